@@ -16,18 +16,69 @@ Examples:
         $ Input number: 2006004008
         $ Interpretation 1: 2006004008 [phone number: VALID]
 
+    Limit the number of interpretations:
+        $ python -m phone_number_interpreter "2 3 4 5 6 7 8" --max-interpretations 5
+        $ Input number: 2345678
+        $ Input number "2345678" has 15 possible interpretations, the maximum is 5
+
+    Count the valid and invalid interpretations, without printing them:
+        $ python -m phone_number_interpreter "69 23 23 23" --summary
+        $ Input number: 69232323
+        $ Interpretations: 23 [phone numbers: VALID 6, INVALID 17]
+        $ First valid interpretation: 6923203203
+
+    Process a file with one number per line, writing the results as JSON Lines:
+        $ python -m phone_number_interpreter batch numbers.txt -o results.jsonl
+        $ cat numbers.txt | python -m phone_number_interpreter batch
+
+    Process a big file in shards that can be resumed, and merge their results in the order of the file:
+        $ python -m phone_number_interpreter pipeline run numbers.txt work --shards 16
+        $ python -m phone_number_interpreter pipeline merge work -o results.jsonl
+
+    Start the HTTP service, and measure it with the load generator:
+        $ python -m phone_number_interpreter serve --port 8080 --workers 4
+        $ python -m phone_number_interpreter loadgen --url http://127.0.0.1:8080 --concurrency 32
+
+    Build an index of contacts, and find the contacts whose number is an interpretation of a number:
+        $ python -m phone_number_interpreter contacts build contacts.csv -o contacts.idx
+        $ python -m phone_number_interpreter contacts lookup contacts.idx "0 0 30 69 70 24 1 3 50 2"
+
+    Run the benchmarks, storing the results to compare them with the next runs:
+        $ python -m phone_number_interpreter bench --output baseline.json
+        $ python -m phone_number_interpreter bench --compare baseline.json
+
     Run test cases:
         $ python -m phone_number_interpreter tests
         $ ..
 """
 import sys
-from phone_number_interpreter import app
-from phone_number_interpreter.tests.run import run_tests
 
 
+# The modules of each mode are imported only when the mode is executed, to start fast when a number is interpreted
+# pylint: disable=import-outside-toplevel
 if __name__ == '__main__':
 
     if len(sys.argv) > 1 and sys.argv[1] == 'tests':
+        from phone_number_interpreter.tests.run import run_tests
         run_tests()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        from phone_number_interpreter import batch
+        batch.run()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'pipeline':
+        from phone_number_interpreter import pipeline
+        pipeline.run()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        from phone_number_interpreter import benchmarks
+        benchmarks.run()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        from phone_number_interpreter import server
+        server.run()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'loadgen':
+        from phone_number_interpreter import load_generator
+        load_generator.run()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'contacts':
+        from phone_number_interpreter import contacts_index
+        contacts_index.run()
     else:
+        from phone_number_interpreter import app
         app.run()
@@ -0,0 +1,281 @@
+"""
+Module with the rules of the ambiguities of the spelled numbers as data, compiled to a finite-state transducer that
+ finds the ambiguity that starts in an index of a number walking its digits once.
+
+Each rule has a pattern of the numbers of the ambiguity, with a digit or a range of digits for each number, and the
+ replacement of the ambiguity as a template of the matched numbers. The transducer merges the patterns of all the rules
+ in a single automaton of digits, each accepting state outputs the rule matched, so adding rules doesn't add passes
+ over the number.
+
+The generation of the interpretations relies on two properties of the rules, that are checked when they are compiled:
+ only one ambiguity can start in each index, and the replacement adds or removes a '0' after the first number, in
+ ambiguities of two or three numbers.
+
+Example:
+    $ transducer = AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES)
+    $ transducer.match('2053', 0)
+    $ 2
+    $ transducer.replace('205')
+    $ '25'
+
+The rules are not a general rewriting system: rules that break these properties are rejected, so for example an
+ ambiguity can't replace a digit other than the '0', or have four numbers. Other rules are used providing their
+ transducer to `NaturalNumbersInterpreter(transducer=...)`, that matches them instead of reading the precomputed
+ tables of the default rules. The contacts index and the byte interpreter only support the default rules.
+
+The tables of the default rules are precomputed in the module `ambiguity_tables`, to not compile the rules when the
+ interpreter is imported. They are generated again with:
+
+    $ python -m phone_number_interpreter.ambiguity_rules
+
+Attributes:
+    ambiguity_rules.render_tables(transducer: AmbiguityTransducer)
+
+Classes:
+    AmbiguityRule
+    AmbiguityTransducer
+"""
+import os
+import re
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Numbers of a pattern, a digit or a range of digits `[a-b]`
+PATTERN_NUMBER = re.compile(r'\[(\d)-(\d)\]|(\d)')
+# Lengths of the ambiguities supported by the segmentation
+MIN_AMBIGUITY_LEN = 2
+MAX_AMBIGUITY_LEN = 3
+
+
+@dataclass(frozen=True)
+class AmbiguityRule:
+    """
+    Rule of an ambiguity of the spelled numbers
+
+    Example:
+        $ AmbiguityRule('[2-9][1-9]', '{0}0{1}')  # 'twenty five' can be '25' or '205'
+
+    Attributes:
+        pattern: Numbers of the ambiguity, a digit or a range of digits `[a-b]` for each number
+        replacement: Replacement of the ambiguity, `{n}` is the number `n` of the ambiguity
+    """
+    pattern: str
+    replacement: str
+
+    def numbers(self) -> List[str]:
+        """
+        Parse the pattern
+
+        :raises ValueError: if the pattern has not the format
+        :return: Digits accepted by each number of the pattern
+        """
+        numbers = []
+        position = 0
+        while position < len(self.pattern):
+            match = PATTERN_NUMBER.match(self.pattern, position)
+            if match is None:
+                raise ValueError('Invalid pattern "{}", the numbers must be digits or ranges of digits [a-b]'.format(
+                    self.pattern))
+            (range_start, range_end, digit) = match.groups()
+            numbers.append(digit if digit else ''.join(str(number) for number in range(int(range_start),
+                                                                                       int(range_end) + 1)))
+            position = match.end()
+        return numbers
+
+    def expand(self) -> Iterable[Tuple[str, str]]:
+        """
+        Generate the ambiguities of the rule
+
+        :raises ValueError: if the pattern has not the format
+        :return: Iterator of `(ambiguity, replacement)`
+        """
+        for numbers in product(*self.numbers()):
+            yield ''.join(numbers), self.replacement.format(*numbers)
+
+
+# '25' can be '205' and '205' can be '25', the ambiguities with a '0' must end in [2-9]
+DEFAULT_AMBIGUITY_RULES = (
+    AmbiguityRule('[2-9][1-9]', '{0}0{1}'),
+    AmbiguityRule('[2-9]0[2-9]', '{0}{2}'),
+)
+
+
+def toggles_zero(ambiguity: str, replacement: str) -> bool:
+    """
+    Check if the replacement of an ambiguity adds or removes a '0' after its first number, that is followed by a
+     number in [1-9], so the shorter of them has at least two numbers
+
+    :param ambiguity:
+    :param replacement:
+    :return:
+    """
+    (short, long) = sorted([ambiguity, replacement], key=len)
+    return len(short) >= 2 and len(long) == len(short) + 1 and short[0] != '0' and short[1] != '0' and \
+        long == short[0] + '0' + short[1:]
+
+
+class AmbiguityTransducer:
+    """
+    Finite-state transducer compiled from many AmbiguityRule
+
+    The states are stored in lists indexed by state, the initial state is the state 0. The patterns are merged
+     digit by digit, so the transducer is a trie of the ambiguities of all the rules.
+
+    Attributes:
+        rules: Compiled rules
+        transitions: Next state of each state by digit
+        outputs: Replacement of the ambiguity accepted in each state, None for the states that don't accept
+        max_length: Length of the longest ambiguity
+        window_matches: Length of the ambiguity that starts each window of up to `max_length` digits, 0 if there is
+            not an ambiguity
+    """
+
+    def __init__(self, rules: Iterable[AmbiguityRule]):
+        self.rules = tuple(rules)
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.outputs: List[Optional[str]] = [None]
+        self.max_length = 0
+
+        for rule in self.rules:
+            for (ambiguity, replacement) in rule.expand():
+                if not MIN_AMBIGUITY_LEN <= len(ambiguity) <= MAX_AMBIGUITY_LEN:
+                    raise ValueError('Invalid rule "{}", the ambiguities must have between {} and {} numbers'.format(
+                        rule.pattern, MIN_AMBIGUITY_LEN, MAX_AMBIGUITY_LEN))
+                if not toggles_zero(ambiguity, replacement):
+                    raise ValueError('Invalid rule "{}", the replacement of "{}" must add or remove a 0 after its '
+                                     'first number'.format(rule.pattern, ambiguity))
+                self.add_ambiguity(ambiguity, replacement)
+                self.max_length = max(self.max_length, len(ambiguity))
+
+        # Length of the ambiguity that starts each window of digits, 0 if there is not an ambiguity
+        self.window_matches: Dict[str, int] = {}
+        for length in range(1, self.max_length + 1):
+            for digits in product('0123456789', repeat=length):
+                window = ''.join(digits)
+                last_index = self.walk(window, 0)
+                self.window_matches[window] = 0 if last_index is None else last_index + 1
+
+    def add_ambiguity(self, ambiguity: str, replacement: str) -> None:
+        """
+        Add the states of an ambiguity
+
+        :param ambiguity:
+        :param replacement:
+        :raises ValueError: if another ambiguity starts with the ambiguity, or the ambiguity starts with another one
+        :return:
+        """
+        state = 0
+        for number in ambiguity:
+            if self.outputs[state] is not None:
+                raise ValueError('Invalid ambiguity "{}", it starts with another ambiguity'.format(ambiguity))
+            next_state = self.transitions[state].get(number)
+            if next_state is None:
+                next_state = self.transitions[state][number] = len(self.transitions)
+                self.transitions.append({})
+                self.outputs.append(None)
+            state = next_state
+        if self.outputs[state] is not None or self.transitions[state]:
+            raise ValueError('Invalid ambiguity "{}", another ambiguity starts with it'.format(ambiguity))
+        self.outputs[state] = replacement
+
+    def walk(self, text_number: str, index: int) -> Optional[int]:
+        """
+        Walk the transducer with the digits of the number from `index`, until an ambiguity is accepted or there is
+         no transition
+
+        :param text_number:
+        :param index:
+        :return: Last index of the ambiguity, None if there is not an ambiguity starting in `index`
+        """
+        state = 0
+        for position in range(index, min(index + self.max_length, len(text_number))):
+            state = self.transitions[state].get(text_number[position], 0)
+            if not state:
+                return None
+            if self.outputs[state] is not None:
+                return position
+        return None
+
+    def match(self, text_number: str, index: int) -> Optional[int]:
+        """
+        Find the ambiguity that starts in the `index` of the number
+
+        The result of the walk of each window of `max_length` digits is precomputed, so only the windows with non
+         numeric characters are walked.
+
+        :param text_number:
+        :param index:
+        :return: Last index of the ambiguity, None if there is not an ambiguity starting in `index`
+        """
+        window = text_number[index:index + self.max_length]
+        matched_length = self.window_matches.get(window)
+        if matched_length is None:
+            return self.walk(text_number, index)
+        return index + matched_length - 1 if matched_length else None
+
+    def replace(self, ambiguity: str) -> str:
+        """
+        Replacement of an ambiguity
+
+        :param ambiguity:
+        :raises KeyError: if it is not an ambiguity of the rules
+        :return:
+        """
+        state = 0
+        for number in ambiguity:
+            state = self.transitions[state][number]
+        replacement = self.outputs[state]
+        if replacement is None:
+            raise KeyError(ambiguity)
+        return replacement
+
+    def ambiguities(self) -> Dict[str, str]:
+        """
+        Table of all the ambiguities of the rules
+
+        :return: Dict with the replacement of each ambiguity
+        """
+        return {ambiguity: replacement for rule in self.rules for (ambiguity, replacement) in rule.expand()}
+
+
+def render_tables(transducer: AmbiguityTransducer) -> str:
+    """
+    Render the source of the module `ambiguity_tables` with the tables of a transducer
+
+    :param transducer:
+    :return: Python source
+    """
+    def render_dict(items: Iterable[Tuple[str, object]]) -> List[str]:
+        lines = ['{']
+        for (key, value) in items:
+            entry = '{!r}: {!r},'.format(key, value)
+            if len(lines) > 1 and len(lines[-1]) + len(entry) < 116:
+                lines[-1] += ' ' + entry
+            else:
+                lines.append('    ' + entry)
+        return lines + ['}']
+
+    return '\n'.join([
+        '"""',
+        'Tables of the ambiguities of `DEFAULT_AMBIGUITY_RULES`, precomputed to not compile the rules at import time.',
+        '',
+        'Generated by `python -m phone_number_interpreter.ambiguity_rules`, don\'t edit it by hand.',
+        '',
+        'Attributes:',
+        '    MAX_AMBIGUITY_LENGTH (int): Length of the longest ambiguity',
+        '    AMBIGUITIES (dict): Replacement of each ambiguity',
+        '    WINDOW_MATCHES (dict): Length of the ambiguity that starts each window of up to `MAX_AMBIGUITY_LENGTH`',
+        '     digits, 0 if there is not an ambiguity',
+        '"""',
+        'MAX_AMBIGUITY_LENGTH = {}'.format(transducer.max_length),
+        'AMBIGUITIES = ' + '\n'.join(render_dict(transducer.ambiguities().items())),
+        'WINDOW_MATCHES = ' + '\n'.join(render_dict(transducer.window_matches.items())),
+        '',
+    ])
+
+
+if __name__ == '__main__':
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ambiguity_tables.py'), 'w') as tables_file:
+        tables_file.write(render_tables(AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES)))
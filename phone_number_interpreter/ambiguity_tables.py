@@ -0,0 +1,133 @@
+"""
+Tables of the ambiguities of `DEFAULT_AMBIGUITY_RULES`, precomputed to not compile the rules at import time.
+
+Generated by `python -m phone_number_interpreter.ambiguity_rules`, don't edit it by hand.
+
+Attributes:
+    MAX_AMBIGUITY_LENGTH (int): Length of the longest ambiguity
+    AMBIGUITIES (dict): Replacement of each ambiguity
+    WINDOW_MATCHES (dict): Length of the ambiguity that starts each window of up to `MAX_AMBIGUITY_LENGTH`
+     digits, 0 if there is not an ambiguity
+"""
+MAX_AMBIGUITY_LENGTH = 3
+AMBIGUITIES = {
+    '21': '201', '22': '202', '23': '203', '24': '204', '25': '205', '26': '206', '27': '207', '28': '208',
+    '29': '209', '31': '301', '32': '302', '33': '303', '34': '304', '35': '305', '36': '306', '37': '307',
+    '38': '308', '39': '309', '41': '401', '42': '402', '43': '403', '44': '404', '45': '405', '46': '406',
+    '47': '407', '48': '408', '49': '409', '51': '501', '52': '502', '53': '503', '54': '504', '55': '505',
+    '56': '506', '57': '507', '58': '508', '59': '509', '61': '601', '62': '602', '63': '603', '64': '604',
+    '65': '605', '66': '606', '67': '607', '68': '608', '69': '609', '71': '701', '72': '702', '73': '703',
+    '74': '704', '75': '705', '76': '706', '77': '707', '78': '708', '79': '709', '81': '801', '82': '802',
+    '83': '803', '84': '804', '85': '805', '86': '806', '87': '807', '88': '808', '89': '809', '91': '901',
+    '92': '902', '93': '903', '94': '904', '95': '905', '96': '906', '97': '907', '98': '908', '99': '909',
+    '202': '22', '203': '23', '204': '24', '205': '25', '206': '26', '207': '27', '208': '28', '209': '29',
+    '302': '32', '303': '33', '304': '34', '305': '35', '306': '36', '307': '37', '308': '38', '309': '39',
+    '402': '42', '403': '43', '404': '44', '405': '45', '406': '46', '407': '47', '408': '48', '409': '49',
+    '502': '52', '503': '53', '504': '54', '505': '55', '506': '56', '507': '57', '508': '58', '509': '59',
+    '602': '62', '603': '63', '604': '64', '605': '65', '606': '66', '607': '67', '608': '68', '609': '69',
+    '702': '72', '703': '73', '704': '74', '705': '75', '706': '76', '707': '77', '708': '78', '709': '79',
+    '802': '82', '803': '83', '804': '84', '805': '85', '806': '86', '807': '87', '808': '88', '809': '89',
+    '902': '92', '903': '93', '904': '94', '905': '95', '906': '96', '907': '97', '908': '98', '909': '99',
+}
+WINDOW_MATCHES = {
+    '0': 0, '1': 0, '2': 0, '3': 0, '4': 0, '5': 0, '6': 0, '7': 0, '8': 0, '9': 0, '00': 0, '01': 0, '02': 0,
+    '03': 0, '04': 0, '05': 0, '06': 0, '07': 0, '08': 0, '09': 0, '10': 0, '11': 0, '12': 0, '13': 0, '14': 0,
+    '15': 0, '16': 0, '17': 0, '18': 0, '19': 0, '20': 0, '21': 2, '22': 2, '23': 2, '24': 2, '25': 2, '26': 2,
+    '27': 2, '28': 2, '29': 2, '30': 0, '31': 2, '32': 2, '33': 2, '34': 2, '35': 2, '36': 2, '37': 2, '38': 2,
+    '39': 2, '40': 0, '41': 2, '42': 2, '43': 2, '44': 2, '45': 2, '46': 2, '47': 2, '48': 2, '49': 2, '50': 0,
+    '51': 2, '52': 2, '53': 2, '54': 2, '55': 2, '56': 2, '57': 2, '58': 2, '59': 2, '60': 0, '61': 2, '62': 2,
+    '63': 2, '64': 2, '65': 2, '66': 2, '67': 2, '68': 2, '69': 2, '70': 0, '71': 2, '72': 2, '73': 2, '74': 2,
+    '75': 2, '76': 2, '77': 2, '78': 2, '79': 2, '80': 0, '81': 2, '82': 2, '83': 2, '84': 2, '85': 2, '86': 2,
+    '87': 2, '88': 2, '89': 2, '90': 0, '91': 2, '92': 2, '93': 2, '94': 2, '95': 2, '96': 2, '97': 2, '98': 2,
+    '99': 2, '000': 0, '001': 0, '002': 0, '003': 0, '004': 0, '005': 0, '006': 0, '007': 0, '008': 0, '009': 0,
+    '010': 0, '011': 0, '012': 0, '013': 0, '014': 0, '015': 0, '016': 0, '017': 0, '018': 0, '019': 0, '020': 0,
+    '021': 0, '022': 0, '023': 0, '024': 0, '025': 0, '026': 0, '027': 0, '028': 0, '029': 0, '030': 0, '031': 0,
+    '032': 0, '033': 0, '034': 0, '035': 0, '036': 0, '037': 0, '038': 0, '039': 0, '040': 0, '041': 0, '042': 0,
+    '043': 0, '044': 0, '045': 0, '046': 0, '047': 0, '048': 0, '049': 0, '050': 0, '051': 0, '052': 0, '053': 0,
+    '054': 0, '055': 0, '056': 0, '057': 0, '058': 0, '059': 0, '060': 0, '061': 0, '062': 0, '063': 0, '064': 0,
+    '065': 0, '066': 0, '067': 0, '068': 0, '069': 0, '070': 0, '071': 0, '072': 0, '073': 0, '074': 0, '075': 0,
+    '076': 0, '077': 0, '078': 0, '079': 0, '080': 0, '081': 0, '082': 0, '083': 0, '084': 0, '085': 0, '086': 0,
+    '087': 0, '088': 0, '089': 0, '090': 0, '091': 0, '092': 0, '093': 0, '094': 0, '095': 0, '096': 0, '097': 0,
+    '098': 0, '099': 0, '100': 0, '101': 0, '102': 0, '103': 0, '104': 0, '105': 0, '106': 0, '107': 0, '108': 0,
+    '109': 0, '110': 0, '111': 0, '112': 0, '113': 0, '114': 0, '115': 0, '116': 0, '117': 0, '118': 0, '119': 0,
+    '120': 0, '121': 0, '122': 0, '123': 0, '124': 0, '125': 0, '126': 0, '127': 0, '128': 0, '129': 0, '130': 0,
+    '131': 0, '132': 0, '133': 0, '134': 0, '135': 0, '136': 0, '137': 0, '138': 0, '139': 0, '140': 0, '141': 0,
+    '142': 0, '143': 0, '144': 0, '145': 0, '146': 0, '147': 0, '148': 0, '149': 0, '150': 0, '151': 0, '152': 0,
+    '153': 0, '154': 0, '155': 0, '156': 0, '157': 0, '158': 0, '159': 0, '160': 0, '161': 0, '162': 0, '163': 0,
+    '164': 0, '165': 0, '166': 0, '167': 0, '168': 0, '169': 0, '170': 0, '171': 0, '172': 0, '173': 0, '174': 0,
+    '175': 0, '176': 0, '177': 0, '178': 0, '179': 0, '180': 0, '181': 0, '182': 0, '183': 0, '184': 0, '185': 0,
+    '186': 0, '187': 0, '188': 0, '189': 0, '190': 0, '191': 0, '192': 0, '193': 0, '194': 0, '195': 0, '196': 0,
+    '197': 0, '198': 0, '199': 0, '200': 0, '201': 0, '202': 3, '203': 3, '204': 3, '205': 3, '206': 3, '207': 3,
+    '208': 3, '209': 3, '210': 2, '211': 2, '212': 2, '213': 2, '214': 2, '215': 2, '216': 2, '217': 2, '218': 2,
+    '219': 2, '220': 2, '221': 2, '222': 2, '223': 2, '224': 2, '225': 2, '226': 2, '227': 2, '228': 2, '229': 2,
+    '230': 2, '231': 2, '232': 2, '233': 2, '234': 2, '235': 2, '236': 2, '237': 2, '238': 2, '239': 2, '240': 2,
+    '241': 2, '242': 2, '243': 2, '244': 2, '245': 2, '246': 2, '247': 2, '248': 2, '249': 2, '250': 2, '251': 2,
+    '252': 2, '253': 2, '254': 2, '255': 2, '256': 2, '257': 2, '258': 2, '259': 2, '260': 2, '261': 2, '262': 2,
+    '263': 2, '264': 2, '265': 2, '266': 2, '267': 2, '268': 2, '269': 2, '270': 2, '271': 2, '272': 2, '273': 2,
+    '274': 2, '275': 2, '276': 2, '277': 2, '278': 2, '279': 2, '280': 2, '281': 2, '282': 2, '283': 2, '284': 2,
+    '285': 2, '286': 2, '287': 2, '288': 2, '289': 2, '290': 2, '291': 2, '292': 2, '293': 2, '294': 2, '295': 2,
+    '296': 2, '297': 2, '298': 2, '299': 2, '300': 0, '301': 0, '302': 3, '303': 3, '304': 3, '305': 3, '306': 3,
+    '307': 3, '308': 3, '309': 3, '310': 2, '311': 2, '312': 2, '313': 2, '314': 2, '315': 2, '316': 2, '317': 2,
+    '318': 2, '319': 2, '320': 2, '321': 2, '322': 2, '323': 2, '324': 2, '325': 2, '326': 2, '327': 2, '328': 2,
+    '329': 2, '330': 2, '331': 2, '332': 2, '333': 2, '334': 2, '335': 2, '336': 2, '337': 2, '338': 2, '339': 2,
+    '340': 2, '341': 2, '342': 2, '343': 2, '344': 2, '345': 2, '346': 2, '347': 2, '348': 2, '349': 2, '350': 2,
+    '351': 2, '352': 2, '353': 2, '354': 2, '355': 2, '356': 2, '357': 2, '358': 2, '359': 2, '360': 2, '361': 2,
+    '362': 2, '363': 2, '364': 2, '365': 2, '366': 2, '367': 2, '368': 2, '369': 2, '370': 2, '371': 2, '372': 2,
+    '373': 2, '374': 2, '375': 2, '376': 2, '377': 2, '378': 2, '379': 2, '380': 2, '381': 2, '382': 2, '383': 2,
+    '384': 2, '385': 2, '386': 2, '387': 2, '388': 2, '389': 2, '390': 2, '391': 2, '392': 2, '393': 2, '394': 2,
+    '395': 2, '396': 2, '397': 2, '398': 2, '399': 2, '400': 0, '401': 0, '402': 3, '403': 3, '404': 3, '405': 3,
+    '406': 3, '407': 3, '408': 3, '409': 3, '410': 2, '411': 2, '412': 2, '413': 2, '414': 2, '415': 2, '416': 2,
+    '417': 2, '418': 2, '419': 2, '420': 2, '421': 2, '422': 2, '423': 2, '424': 2, '425': 2, '426': 2, '427': 2,
+    '428': 2, '429': 2, '430': 2, '431': 2, '432': 2, '433': 2, '434': 2, '435': 2, '436': 2, '437': 2, '438': 2,
+    '439': 2, '440': 2, '441': 2, '442': 2, '443': 2, '444': 2, '445': 2, '446': 2, '447': 2, '448': 2, '449': 2,
+    '450': 2, '451': 2, '452': 2, '453': 2, '454': 2, '455': 2, '456': 2, '457': 2, '458': 2, '459': 2, '460': 2,
+    '461': 2, '462': 2, '463': 2, '464': 2, '465': 2, '466': 2, '467': 2, '468': 2, '469': 2, '470': 2, '471': 2,
+    '472': 2, '473': 2, '474': 2, '475': 2, '476': 2, '477': 2, '478': 2, '479': 2, '480': 2, '481': 2, '482': 2,
+    '483': 2, '484': 2, '485': 2, '486': 2, '487': 2, '488': 2, '489': 2, '490': 2, '491': 2, '492': 2, '493': 2,
+    '494': 2, '495': 2, '496': 2, '497': 2, '498': 2, '499': 2, '500': 0, '501': 0, '502': 3, '503': 3, '504': 3,
+    '505': 3, '506': 3, '507': 3, '508': 3, '509': 3, '510': 2, '511': 2, '512': 2, '513': 2, '514': 2, '515': 2,
+    '516': 2, '517': 2, '518': 2, '519': 2, '520': 2, '521': 2, '522': 2, '523': 2, '524': 2, '525': 2, '526': 2,
+    '527': 2, '528': 2, '529': 2, '530': 2, '531': 2, '532': 2, '533': 2, '534': 2, '535': 2, '536': 2, '537': 2,
+    '538': 2, '539': 2, '540': 2, '541': 2, '542': 2, '543': 2, '544': 2, '545': 2, '546': 2, '547': 2, '548': 2,
+    '549': 2, '550': 2, '551': 2, '552': 2, '553': 2, '554': 2, '555': 2, '556': 2, '557': 2, '558': 2, '559': 2,
+    '560': 2, '561': 2, '562': 2, '563': 2, '564': 2, '565': 2, '566': 2, '567': 2, '568': 2, '569': 2, '570': 2,
+    '571': 2, '572': 2, '573': 2, '574': 2, '575': 2, '576': 2, '577': 2, '578': 2, '579': 2, '580': 2, '581': 2,
+    '582': 2, '583': 2, '584': 2, '585': 2, '586': 2, '587': 2, '588': 2, '589': 2, '590': 2, '591': 2, '592': 2,
+    '593': 2, '594': 2, '595': 2, '596': 2, '597': 2, '598': 2, '599': 2, '600': 0, '601': 0, '602': 3, '603': 3,
+    '604': 3, '605': 3, '606': 3, '607': 3, '608': 3, '609': 3, '610': 2, '611': 2, '612': 2, '613': 2, '614': 2,
+    '615': 2, '616': 2, '617': 2, '618': 2, '619': 2, '620': 2, '621': 2, '622': 2, '623': 2, '624': 2, '625': 2,
+    '626': 2, '627': 2, '628': 2, '629': 2, '630': 2, '631': 2, '632': 2, '633': 2, '634': 2, '635': 2, '636': 2,
+    '637': 2, '638': 2, '639': 2, '640': 2, '641': 2, '642': 2, '643': 2, '644': 2, '645': 2, '646': 2, '647': 2,
+    '648': 2, '649': 2, '650': 2, '651': 2, '652': 2, '653': 2, '654': 2, '655': 2, '656': 2, '657': 2, '658': 2,
+    '659': 2, '660': 2, '661': 2, '662': 2, '663': 2, '664': 2, '665': 2, '666': 2, '667': 2, '668': 2, '669': 2,
+    '670': 2, '671': 2, '672': 2, '673': 2, '674': 2, '675': 2, '676': 2, '677': 2, '678': 2, '679': 2, '680': 2,
+    '681': 2, '682': 2, '683': 2, '684': 2, '685': 2, '686': 2, '687': 2, '688': 2, '689': 2, '690': 2, '691': 2,
+    '692': 2, '693': 2, '694': 2, '695': 2, '696': 2, '697': 2, '698': 2, '699': 2, '700': 0, '701': 0, '702': 3,
+    '703': 3, '704': 3, '705': 3, '706': 3, '707': 3, '708': 3, '709': 3, '710': 2, '711': 2, '712': 2, '713': 2,
+    '714': 2, '715': 2, '716': 2, '717': 2, '718': 2, '719': 2, '720': 2, '721': 2, '722': 2, '723': 2, '724': 2,
+    '725': 2, '726': 2, '727': 2, '728': 2, '729': 2, '730': 2, '731': 2, '732': 2, '733': 2, '734': 2, '735': 2,
+    '736': 2, '737': 2, '738': 2, '739': 2, '740': 2, '741': 2, '742': 2, '743': 2, '744': 2, '745': 2, '746': 2,
+    '747': 2, '748': 2, '749': 2, '750': 2, '751': 2, '752': 2, '753': 2, '754': 2, '755': 2, '756': 2, '757': 2,
+    '758': 2, '759': 2, '760': 2, '761': 2, '762': 2, '763': 2, '764': 2, '765': 2, '766': 2, '767': 2, '768': 2,
+    '769': 2, '770': 2, '771': 2, '772': 2, '773': 2, '774': 2, '775': 2, '776': 2, '777': 2, '778': 2, '779': 2,
+    '780': 2, '781': 2, '782': 2, '783': 2, '784': 2, '785': 2, '786': 2, '787': 2, '788': 2, '789': 2, '790': 2,
+    '791': 2, '792': 2, '793': 2, '794': 2, '795': 2, '796': 2, '797': 2, '798': 2, '799': 2, '800': 0, '801': 0,
+    '802': 3, '803': 3, '804': 3, '805': 3, '806': 3, '807': 3, '808': 3, '809': 3, '810': 2, '811': 2, '812': 2,
+    '813': 2, '814': 2, '815': 2, '816': 2, '817': 2, '818': 2, '819': 2, '820': 2, '821': 2, '822': 2, '823': 2,
+    '824': 2, '825': 2, '826': 2, '827': 2, '828': 2, '829': 2, '830': 2, '831': 2, '832': 2, '833': 2, '834': 2,
+    '835': 2, '836': 2, '837': 2, '838': 2, '839': 2, '840': 2, '841': 2, '842': 2, '843': 2, '844': 2, '845': 2,
+    '846': 2, '847': 2, '848': 2, '849': 2, '850': 2, '851': 2, '852': 2, '853': 2, '854': 2, '855': 2, '856': 2,
+    '857': 2, '858': 2, '859': 2, '860': 2, '861': 2, '862': 2, '863': 2, '864': 2, '865': 2, '866': 2, '867': 2,
+    '868': 2, '869': 2, '870': 2, '871': 2, '872': 2, '873': 2, '874': 2, '875': 2, '876': 2, '877': 2, '878': 2,
+    '879': 2, '880': 2, '881': 2, '882': 2, '883': 2, '884': 2, '885': 2, '886': 2, '887': 2, '888': 2, '889': 2,
+    '890': 2, '891': 2, '892': 2, '893': 2, '894': 2, '895': 2, '896': 2, '897': 2, '898': 2, '899': 2, '900': 0,
+    '901': 0, '902': 3, '903': 3, '904': 3, '905': 3, '906': 3, '907': 3, '908': 3, '909': 3, '910': 2, '911': 2,
+    '912': 2, '913': 2, '914': 2, '915': 2, '916': 2, '917': 2, '918': 2, '919': 2, '920': 2, '921': 2, '922': 2,
+    '923': 2, '924': 2, '925': 2, '926': 2, '927': 2, '928': 2, '929': 2, '930': 2, '931': 2, '932': 2, '933': 2,
+    '934': 2, '935': 2, '936': 2, '937': 2, '938': 2, '939': 2, '940': 2, '941': 2, '942': 2, '943': 2, '944': 2,
+    '945': 2, '946': 2, '947': 2, '948': 2, '949': 2, '950': 2, '951': 2, '952': 2, '953': 2, '954': 2, '955': 2,
+    '956': 2, '957': 2, '958': 2, '959': 2, '960': 2, '961': 2, '962': 2, '963': 2, '964': 2, '965': 2, '966': 2,
+    '967': 2, '968': 2, '969': 2, '970': 2, '971': 2, '972': 2, '973': 2, '974': 2, '975': 2, '976': 2, '977': 2,
+    '978': 2, '979': 2, '980': 2, '981': 2, '982': 2, '983': 2, '984': 2, '985': 2, '986': 2, '987': 2, '988': 2,
+    '989': 2, '990': 2, '991': 2, '992': 2, '993': 2, '994': 2, '995': 2, '996': 2, '997': 2, '998': 2, '999': 2,
+}
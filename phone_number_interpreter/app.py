@@ -2,22 +2,35 @@
 Module with the logic to print the number interpretations the validation if they are a phone number
 
 Attributes:
-    app.print_interpretations_with_phone_validation(interpretations: Set[str], validator: Type[PhoneValidator])
-    app.run()
+    app.print_interpretations_with_phone_validation(interpretations: Iterable[str], validator: Type[PhoneValidator],
+                                                    stats: Optional[InterpretationStats])
+    app.print_interpretations_summary(summary: InterpretationSummary)
+    app.positive_int(value: str)
+    app.non_negative_int(value: str)
+    app.parse_arguments(argv: List[str])
+    app.run(argv: Optional[List[str]], stats_callback: Optional[Callable[[InterpretationStats], None]])
 """
+import argparse
 import sys
-from typing import Set, Type
-from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from typing import Callable, Iterable, List, Optional, Type
+from phone_number_interpreter.natural_numbers_interpreter import InterpretationSummary, NaturalNumbersInterpreter, \
+    TooManyInterpretationsError
 from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator, PhoneValidator
+from phone_number_interpreter.stats import InterpretationStats
 
 
 VALID = 'VALID'
 INVALID = 'INVALID'
+# Summaries of the option `--summary`: the counts of valid and invalid interpretations, or only if there is any valid
+SUMMARY_COUNTS = 'counts'
+SUMMARY_ANY = 'any'
 
 
-def print_interpretations_with_phone_validation(interpretations: Set[str], validator: Type[PhoneValidator]) -> None:
+def print_interpretations_with_phone_validation(interpretations: Iterable[str],
+                                                validator: Type[PhoneValidator],
+                                                stats: Optional[InterpretationStats] = None) -> None:
     """
-    Go throw a list of numbers as strings and validate if they are a valid phone number, and print the following:
+    Go throw an iterable of numbers as strings and validate if they are a valid phone number, and print the following:
 
     Interpretation 1: xxxxxxxx [phone number: INVALID]
     ....
@@ -25,31 +38,151 @@ def print_interpretations_with_phone_validation(interpretations: Set[str], valid
     ....
     Interpretation m: xxxxxx [phone number: INVALID]
 
+    If `stats` is provided, the time used to validate and print the interpretations is collected
+
     :param interpretations:
     :param validator: PhoneValidator
+    :param stats: InterpretationStats where the statistics are collected
     :return:
     """
+    if stats is not None:
+        validator = stats.counting_validator(validator)
+        for (index, interpretation) in enumerate(interpretations):
+            with stats.timer('validation'):
+                is_valid_phone_number = VALID if validator.validate(interpretation) else INVALID
+            with stats.timer('printing'):
+                print('Interpretation {}: {} [phone number: {}]'.format(index+1, interpretation, is_valid_phone_number))
+        return
+
     for (index, interpretation) in enumerate(interpretations):
         is_valid_phone_number = VALID if validator.validate(interpretation) else INVALID
         print('Interpretation {}: {} [phone number: {}]'.format(index+1, interpretation, is_valid_phone_number))
 
 
-def run() -> None:
+def print_interpretations_summary(summary: InterpretationSummary) -> None:
+    """
+    Print the summary of the interpretations of a number, the counts are printed only if the valid interpretations
+     were counted:
+
+    Interpretations: n [phone numbers: VALID v, INVALID i]
+    First valid interpretation: xxxxxxxxx
+
+    :param summary: InterpretationSummary of the number
+    :return:
+    """
+    if summary.valid_count is None:
+        print('Interpretations: {}'.format(summary.count))
+    else:
+        print('Interpretations: {} [phone numbers: {} {}, {} {}]'.format(summary.count, VALID, summary.valid_count,
+                                                                       INVALID, summary.invalid_count))
+    print('First valid interpretation: {}'.format(summary.first_valid if summary.first_valid else 'none'))
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command line argument that must be a positive integer
+
+    :param value:
+    :raises argparse.ArgumentTypeError: if the value is not a positive integer
+    :return:
+    """
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError('invalid positive int value: {!r}'.format(value)) from error
+    if number < 1:
+        raise argparse.ArgumentTypeError('invalid positive int value: {!r}'.format(value))
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """
+    Parse a command line argument that must be an integer greater than or equal to 0
+
+    :param value:
+    :raises argparse.ArgumentTypeError: if the value is not a non-negative integer
+    :return:
+    """
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError('invalid non-negative int value: {!r}'.format(value)) from error
+    if number < 0:
+        raise argparse.ArgumentTypeError('invalid non-negative int value: {!r}'.format(value))
+    return number
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the application
+
+    :param argv: Command line arguments, without the program name
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter',
+                                     description='Print the possible interpretations of a spelled number and '
+                                                 'validate if they are a valid Greek phone number')
+    parser.add_argument('number', nargs='*',
+                        help='Number to process, if not provided it will be asked as user input')
+    output_arguments = parser.add_mutually_exclusive_group()
+    output_arguments.add_argument('--valid-only', action='store_true',
+                                  help='Print only the interpretations that are valid phone numbers')
+    output_arguments.add_argument('--summary', nargs='?', const=SUMMARY_COUNTS, choices=[SUMMARY_COUNTS, SUMMARY_ANY],
+                                  help='Print only the number of valid and invalid interpretations and the first valid '
+                                       'one, with "any" only the first valid one, without counting them')
+    parser.add_argument('--max-interpretations', type=positive_int, default=None,
+                        help='Reject the numbers with more possible interpretations than this value')
+    parser.add_argument('--truncate', action='store_true',
+                        help='Print only --max-interpretations interpretations, instead of rejecting the number')
+    parser.add_argument('--stats', action='store_true',
+                        help='Print to stderr the time of each phase and the counters of the interpretation')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None,
+        stats_callback: Optional[Callable[[InterpretationStats], None]] = None) -> None:
     """
     Start point of application.
 
     Number to process can be provided by argv, if not provided it will be asked as user input.
 
+    The statistics of the interpretation are printed to stderr with the option `--stats`, or provided to
+     `stats_callback` at the end.
+
+    :param argv: Command line arguments, if not provided `sys.argv` is used
+    :param stats_callback: Called with the InterpretationStats collected, if provided
     :return:
     """
-    input_number = sys.argv[1] if len(sys.argv) > 1 else input('Please insert the number: ')
+    arguments = parse_arguments(sys.argv[1:] if argv is None else argv)
+    stats = InterpretationStats() if arguments.stats or stats_callback else None
+
+    input_number = ' '.join(arguments.number) if arguments.number else input('Please insert the number: ')
 
     input_number = ''.join(input_number.split())
 
     print('Input number: {}'.format(input_number))
 
+    interpreter = NaturalNumbersInterpreter(max_interpretations=arguments.max_interpretations,
+                                            truncate=arguments.truncate,
+                                            stats=stats)
     try:
-        possible_interpretations = NaturalNumbersInterpreter().get_all_possible_interpretations_of_number(input_number)
-        print_interpretations_with_phone_validation(possible_interpretations, GreekPhoneNumberValidator)
+        if arguments.summary:
+            print_interpretations_summary(interpreter.summarize_interpretations(
+                input_number, GreekPhoneNumberValidator, count_valid=arguments.summary == SUMMARY_COUNTS))
+        elif arguments.valid_only:
+            possible_interpretations = interpreter.get_valid_phone_interpretations(input_number,
+                                                                                   GreekPhoneNumberValidator)
+            print_interpretations_with_phone_validation(possible_interpretations, GreekPhoneNumberValidator, stats)
+        else:
+            possible_interpretations = interpreter.iter_interpretations(input_number)
+            print_interpretations_with_phone_validation(possible_interpretations, GreekPhoneNumberValidator, stats)
     except ValueError:
         print('Invalid input number "{}", it must contain only numbers'.format(input_number))
+    except TooManyInterpretationsError as error:
+        print('Input number "{}" has {} possible interpretations, the maximum is {}'.format(
+            input_number, error.count, error.max_interpretations))
+
+    if stats is not None and arguments.stats:
+        print(stats.format(), file=sys.stderr)
+    if stats is not None and stats_callback:
+        stats_callback(stats)
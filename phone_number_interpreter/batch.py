@@ -0,0 +1,357 @@
+"""
+Module with the logic to process many numbers in a batch, reading one number per line and writing the results as
+JSON Lines, one JSON object per number.
+
+Example of output line:
+    {"input": "2336", "interpretations": [{"number": "2336", "valid": false}, ...], "time_ms": 0.042}
+
+If a number is invalid, the output line contains an error:
+    {"input": "23a6", "error": "Invalid input number \"23a6\", it must contain only numbers", "time_ms": 0.003}
+
+Attributes:
+    batch.cache_key(input_number: str, interpreter: NaturalNumbersInterpreter, validator: Type[PhoneValidator],
+                    valid_only: bool)
+    batch.interpret_number(input_number: str, interpreter: NaturalNumbersInterpreter, validator: Type[PhoneValidator],
+                           valid_only: bool, cache: Optional[ResultCache])
+    batch.iter_input_numbers(lines: Iterable[str])
+    batch.interpret_many(numbers: Iterable[str], interpreter: NaturalNumbersInterpreter,
+                         validator: Type[PhoneValidator], valid_only: bool, workers: int, chunksize: int,
+                         cache: Optional[ResultCache])
+    batch.run_batch(lines: Iterable[str], output: TextIO, interpreter: NaturalNumbersInterpreter,
+                    validator: Type[PhoneValidator], valid_only: bool, workers: int, cache: Optional[ResultCache])
+    batch.write_results(numbers: Iterable[str], output: TextIO, interpreter: NaturalNumbersInterpreter,
+                        validator: Type[PhoneValidator], valid_only: bool, workers: int, cache: Optional[ResultCache])
+    batch.open_replacing(path: str, binary: bool)
+    batch.parse_arguments(argv: List[str])
+    batch.run(argv: Optional[List[str]])
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext, suppress
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Dict, Hashable, Iterable, Iterator, List, Optional, TextIO, Tuple, Type
+from phone_number_interpreter.app import non_negative_int, positive_int
+from phone_number_interpreter.bulk_reader import MappedInput, parse_shard
+from phone_number_interpreter.cache import LRUCache, ResultCache
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter, TooManyInterpretationsError
+from phone_number_interpreter.persistent_cache import DEFAULT_MAX_ENTRIES, SQLiteCache
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator, PhoneValidator
+
+
+DEFAULT_CHUNKSIZE = 64
+# Blocks of `chunksize * workers` numbers submitted to the pool and not generated yet
+BLOCKS_IN_FLIGHT = 2
+
+
+def cache_key(input_number: str,
+              interpreter: NaturalNumbersInterpreter,
+              validator: Type[PhoneValidator],
+              valid_only: bool) -> Tuple[Hashable, ...]:
+    """
+    Key of the result of a number in a cache, it includes the options that change the result, and the rules of the
+     ambiguities when the interpreter doesn't use the default ones
+
+    :param input_number: Number without spaces
+    :param interpreter:
+    :param validator: PhoneValidator
+    :param valid_only:
+    :return:
+    """
+    key: Tuple[Hashable, ...] = (input_number, validator, valid_only, interpreter.max_interpretations,
+                                 interpreter.truncate)
+    if interpreter.transducer is not None:
+        key += (tuple((rule.pattern, rule.replacement) for rule in interpreter.transducer.rules),)
+    return key
+
+
+def interpret_number(input_number: str,
+                     interpreter: NaturalNumbersInterpreter,
+                     validator: Type[PhoneValidator],
+                     valid_only: bool = False,
+                     cache: Optional[ResultCache] = None) -> Dict[str, Any]:
+    """
+    Create the possible interpretations of a number, validate if they are a valid phone number and return the result
+     as a dict that can be serialized as JSON
+
+    If a `cache` is provided, the result of the number is reused if it is in the cache, or stored in it otherwise.
+     The results obtained from the cache share the `interpretations` list, so it must not be modified.
+
+    :param input_number: Number without spaces
+    :param interpreter:
+    :param validator: PhoneValidator
+    :param valid_only: If True only the interpretations that are valid phone numbers are included
+    :param cache: ResultCache of results
+    :return: Dict with the `input`, the `interpretations` or an `error`, and the `time_ms` used
+    """
+    start_time = time.perf_counter()
+
+    if cache is not None:
+        cached_result = cache.get(cache_key(input_number, interpreter, validator, valid_only))
+        if cached_result is not None:
+            return dict(cached_result, time_ms=round((time.perf_counter() - start_time) * 1000, 3))
+
+    result: Dict[str, Any] = {'input': input_number}
+
+    try:
+        if valid_only:
+            result['interpretations'] = [{'number': interpretation, 'valid': True} for interpretation in
+                                         interpreter.iter_valid_phone_interpretations(input_number, validator)]
+        else:
+            interpretations = list(interpreter.iter_interpretations(input_number))
+            result['interpretations'] = [{'number': interpretation, 'valid': bool(valid)} for (interpretation, valid)
+                                         in zip(interpretations, validator.validate_many(interpretations))]
+    except ValueError:
+        result['error'] = 'Invalid input number "{}", it must contain only numbers'.format(input_number)
+    except TooManyInterpretationsError as error:
+        result['error'] = str(error)
+
+    if cache is not None:
+        cache.put(cache_key(input_number, interpreter, validator, valid_only), dict(result))
+
+    result['time_ms'] = round((time.perf_counter() - start_time) * 1000, 3)
+    return result
+
+
+def iter_input_numbers(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Remove the spaces of the numbers, one number per line, the empty lines are skipped
+
+    :param lines:
+    :return: Iterator of numbers without spaces
+    """
+    for line in lines:
+        input_number = ''.join(line.split())
+        if input_number:
+            yield input_number
+
+
+def interpret_many(numbers: Iterable[str],
+                   interpreter: Optional[NaturalNumbersInterpreter] = None,
+                   validator: Type[PhoneValidator] = GreekPhoneNumberValidator,
+                   valid_only: bool = False,
+                   workers: int = 1,
+                   chunksize: int = DEFAULT_CHUNKSIZE,
+                   cache: Optional[ResultCache] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Process many numbers with `interpret_number`, the results are generated in the same order of `numbers`
+
+    If `workers` is greater than 1 the numbers are distributed in chunks of `chunksize` numbers to a pool of
+     `workers` processes, if it is 1 the numbers are processed in the current process. The numbers are submitted to
+     the pool in blocks of `chunksize * workers` numbers, with at most `BLOCKS_IN_FLIGHT` blocks whose results are
+     not generated yet, so the numbers are read as the results are consumed.
+
+    The `cache` is always used from the current process, the numbers are read in blocks of `chunksize * workers`
+     numbers, the results of a block are looked up and stored at once and only the numbers of the block that are not
+     in the cache are processed.
+
+    :param numbers: Numbers without spaces
+    :param interpreter: If not provided a NaturalNumbersInterpreter without budget is used
+    :param validator: PhoneValidator
+    :param valid_only: If True only the interpretations that are valid phone numbers are included
+    :param workers: Number of processes, if 0 the number of CPUs is used
+    :param chunksize: Numbers sent together to a process
+    :param cache: ResultCache of results
+    :raises ValueError: if `workers` is negative or `chunksize` is not positive
+    :return: Iterator of results of `interpret_number`
+    """
+    if workers < 0:
+        raise ValueError('Invalid workers {}, it must be 0 or positive'.format(workers))
+    if chunksize < 1:
+        raise ValueError('Invalid chunksize {}, it must be positive'.format(chunksize))
+    interpreter = interpreter if interpreter else NaturalNumbersInterpreter()
+    process_number = partial(interpret_number, interpreter=interpreter, validator=validator, valid_only=valid_only)
+    workers = workers if workers else os.cpu_count() or 1
+
+    if workers == 1 and cache is None:
+        yield from map(process_number, numbers)
+        return
+
+    with (multiprocessing.Pool(workers) if workers > 1 else nullcontext()) as pool:
+        numbers = iter(numbers)
+        if cache is None:
+            # pool.imap reads all its numbers ahead, so it is only given a block each time
+            in_flight: 'deque[Iterator[Dict[str, Any]]]' = deque()
+            block = list(islice(numbers, chunksize * workers))
+            while block or in_flight:
+                while block and len(in_flight) < BLOCKS_IN_FLIGHT:
+                    in_flight.append(pool.imap(process_number, block, chunksize))
+                    block = list(islice(numbers, chunksize * workers))
+                yield from in_flight.popleft()
+            return
+
+        block = list(islice(numbers, chunksize * workers))
+        while block:
+            keys = [cache_key(input_number, interpreter, validator, valid_only) for input_number in block]
+            cached_results = cache.get_many(keys)
+            missing_numbers = [input_number for (input_number, cached_result) in zip(block, cached_results)
+                               if cached_result is None]
+            if pool is None:
+                results = list(map(process_number, missing_numbers))
+            else:
+                results = list(pool.imap(process_number, missing_numbers, chunksize))
+            cache.put_many((cache_key(result['input'], interpreter, validator, valid_only),
+                            {field: value for (field, value) in result.items() if field != 'time_ms'})
+                           for result in results)
+
+            missing_results = iter(results)
+            for cached_result in cached_results:
+                yield next(missing_results) if cached_result is None else dict(cached_result, time_ms=0.0)
+
+            block = list(islice(numbers, chunksize * workers))
+
+
+def run_batch(lines: Iterable[str],
+              output: TextIO,
+              interpreter: NaturalNumbersInterpreter,
+              validator: Type[PhoneValidator],
+              valid_only: bool = False,
+              workers: int = 1,
+              cache: Optional[ResultCache] = None) -> int:
+    """
+    Process the numbers of `lines`, one number per line, and write the result of each number as a JSON line, in the
+     same order of the numbers
+
+    The output is written with one write per number, the buffering is done by `output`
+
+    :param lines:
+    :param output: Text stream where the JSON lines are written
+    :param interpreter:
+    :param validator: PhoneValidator
+    :param valid_only: If True only the interpretations that are valid phone numbers are included
+    :param workers: Number of processes, if 0 the number of CPUs is used
+    :param cache: ResultCache of results
+    :return: Number of processed numbers
+    """
+    return write_results(iter_input_numbers(lines), output, interpreter, validator, valid_only, workers, cache)
+
+
+def write_results(numbers: Iterable[str],
+                  output: TextIO,
+                  interpreter: NaturalNumbersInterpreter,
+                  validator: Type[PhoneValidator],
+                  valid_only: bool = False,
+                  workers: int = 1,
+                  cache: Optional[ResultCache] = None) -> int:
+    """
+    Process the numbers and write the result of each number as a JSON line, in the same order of the numbers
+
+    :param numbers: Numbers without spaces
+    :param output: Text stream where the JSON lines are written
+    :param interpreter:
+    :param validator: PhoneValidator
+    :param valid_only: If True only the interpretations that are valid phone numbers are included
+    :param workers: Number of processes, if 0 the number of CPUs is used
+    :param cache: ResultCache of results
+    :return: Number of processed numbers
+    """
+    processed_numbers = 0
+    for result in interpret_many(numbers, interpreter, validator, valid_only, workers, cache=cache):
+        output.write(json.dumps(result) + '\n')
+        processed_numbers += 1
+    return processed_numbers
+
+
+@contextmanager
+def open_replacing(path: str, binary: bool = False) -> Iterator[IO]:
+    """
+    Open a temporary file in the directory of `path`, that replaces `path` only when the block ends without errors,
+     so a failed or interrupted write doesn't leave a truncated file
+
+    :param path:
+    :param binary: If True the file is opened in binary mode, otherwise as UTF-8 text
+    :return: File object of the temporary file
+    """
+    temporary_path = '{}.{}-{}.tmp'.format(path, socket.gethostname(), os.getpid())
+    try:
+        with open(temporary_path, 'wb' if binary else 'w', encoding=None if binary else 'utf-8') as temporary_file:
+            yield temporary_file
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, path)
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the batch mode
+
+    :param argv: Command line arguments, after `batch`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter batch',
+                                     description='Process one number per line and write the results as JSON Lines')
+    parser.add_argument('input', nargs='?', default='-',
+                        help='File with one number per line, if not provided or "-" the numbers are read from stdin')
+    parser.add_argument('-o', '--output', default='-',
+                        help='File where the JSON Lines are written, if not provided or "-" they are written to stdout')
+    parser.add_argument('--valid-only', action='store_true',
+                        help='Include only the interpretations that are valid phone numbers')
+    parser.add_argument('--shard', type=parse_shard, default=(0, 1), metavar='INDEX/COUNT',
+                        help='Split the input file in COUNT byte ranges and process only the range INDEX, starting at '
+                             '0, the lines belong to the range where they start')
+    parser.add_argument('--workers', type=non_negative_int, default=1,
+                        help='Number of processes used to process the numbers, 0 to use one per CPU')
+    parser.add_argument('--max-interpretations', type=positive_int, default=None,
+                        help='Reject the numbers with more possible interpretations than this value')
+    parser.add_argument('--truncate', action='store_true',
+                        help='Include only --max-interpretations interpretations, instead of rejecting the number')
+    cache_arguments = parser.add_mutually_exclusive_group()
+    cache_arguments.add_argument('--cache-size', type=non_negative_int, default=0,
+                                 help='Reuse the results of the last CACHE_SIZE different numbers, the cache '
+                                      'statistics are written to stderr at the end')
+    cache_arguments.add_argument('--cache', metavar='PATH',
+                                 help='SQLite file where the results are stored and reused between executions, the '
+                                      'cache statistics are written to stderr at the end')
+    parser.add_argument('--cache-max-entries', type=positive_int, default=DEFAULT_MAX_ENTRIES,
+                        help='Maximum results stored in the --cache file, the least recently used are evicted')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the batch mode
+
+    :param argv: Command line arguments after `batch`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+    interpreter = NaturalNumbersInterpreter(max_interpretations=arguments.max_interpretations,
+                                            truncate=arguments.truncate)
+    cache: Optional[ResultCache] = None
+    if arguments.cache:
+        cache = SQLiteCache(arguments.cache, arguments.cache_max_entries)
+    elif arguments.cache_size > 0:
+        cache = LRUCache(arguments.cache_size)
+
+    if arguments.input == '-' and arguments.shard != (0, 1):
+        raise SystemExit('The numbers read from stdin can\'t be split in shards')
+
+    # The input files are mapped in memory, instead of being read line by line
+    input_file = sys.stdin if arguments.input == '-' else MappedInput(arguments.input)
+    try:
+        with nullcontext(sys.stdout) if arguments.output == '-' else open_replacing(arguments.output) as output_file:
+            if isinstance(input_file, MappedInput):
+                (shard, shards) = arguments.shard
+                numbers = input_file.iter_numbers(*input_file.shard_ranges(shards)[shard])
+            else:
+                numbers = iter_input_numbers(input_file)
+            write_results(numbers, output_file, interpreter, GreekPhoneNumberValidator, arguments.valid_only,
+                          arguments.workers, cache)
+            output_file.flush()
+        if cache is not None:
+            stats = cache.stats()
+            print('Cache: hits={} misses={} evictions={} hit rate={:.2%}'.format(
+                stats.hits, stats.misses, stats.evictions, stats.hit_rate), file=sys.stderr)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if isinstance(cache, SQLiteCache):
+            cache.close()
@@ -0,0 +1,367 @@
+"""
+Module with the benchmarks of the interpretation of numbers, to compare the performance between versions.
+
+The benchmarks run families of input numbers, representative and adversarial, with different lengths:
+
+    ambiguous_run: All the digits start an ambiguity with the next one, e.g. '232323'
+    zero_padded: Half of the digits are leading zeros, followed by ambiguities with zeros, e.g. '0002303'
+    greek_10: Valid Greek phone numbers of 10 digits, e.g. '6970241352'
+    greek_14: Valid Greek phone numbers of 14 digits, e.g. '00306970241352'
+    batch: Mix of the previous families processed with `batch.interpret_many`
+
+For each family and length they report the throughput, the latency percentiles, the peak memory and the
+ interpretations generated per second. The results can be stored in a JSON file and compared with a previous one.
+
+Examples:
+    $ python -m phone_number_interpreter bench --output baseline.json
+    $ python -m phone_number_interpreter bench --compare baseline.json
+
+Attributes:
+    benchmarks.ambiguous_run(length: int, count: int, seed: int)
+    benchmarks.zero_padded(length: int, count: int, seed: int)
+    benchmarks.greek_numbers(length: int, count: int, seed: int)
+    benchmarks.percentile(sorted_values: List[float], fraction: float)
+    benchmarks.bench_numbers(family: str, numbers: List[str], interpreter: NaturalNumbersInterpreter)
+    benchmarks.bench_batch(numbers: List[str], workers: int)
+    benchmarks.run_benchmarks(lengths: Sequence[int], count: int, workers: int)
+    benchmarks.compare_results(results: List[BenchResult], baseline: Dict[str, Any])
+    benchmarks.run(argv: Optional[List[str]])
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from phone_number_interpreter.app import non_negative_int, positive_int
+from phone_number_interpreter.batch import interpret_many, open_replacing
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+
+
+BENCH_FORMAT_VERSION = 1
+DEFAULT_LENGTHS = (4, 8, 12, 16, 20)
+DEFAULT_COUNT = 50
+
+
+def ambiguous_run(length: int, count: int, seed: int = 0) -> List[str]:
+    """
+    Numbers where all the digits start an ambiguity with the next one, the worst case for the number of
+     interpretations
+
+    :param length:
+    :param count: Number of numbers
+    :param seed: Seed of the random digits
+    :return:
+    """
+    digits = random.Random(seed)
+    return [''.join(digits.choice('23456789') for _ in range(length)) for _ in range(count)]
+
+
+def zero_padded(length: int, count: int, seed: int = 0) -> List[str]:
+    """
+    Numbers with half of the digits as leading zeros, followed by ambiguities of three digits with a zero
+
+    :param length:
+    :param count: Number of numbers
+    :param seed: Seed of the random digits
+    :return:
+    """
+    digits = random.Random(seed)
+    numbers = []
+    for _ in range(count):
+        ambiguities = ''.join(digits.choice('23456789') + digits.choice(['0', '']) for _ in range(length))
+        numbers.append(('0' * (length // 2) + ambiguities)[:length])
+    return numbers
+
+
+def greek_numbers(length: int, count: int, seed: int = 0) -> List[str]:
+    """
+    Valid Greek phone numbers
+
+    :param length: 10 or 14
+    :param count: Number of numbers
+    :param seed: Seed of the random digits
+    :return:
+    """
+    digits = random.Random(seed)
+    numbers = []
+    for _ in range(count):
+        number = '0030' if length == 14 else ''
+        number += digits.choice(['2', '69'])
+        numbers.append(number + ''.join(digits.choice('0123456789') for _ in range(length - len(number))))
+    return numbers
+
+
+# Families of numbers and the lengths they are benchmarked with, None to use the lengths of the run
+INPUT_FAMILIES: Dict[str, Callable[[int, int, int], List[str]]] = {
+    'ambiguous_run': ambiguous_run,
+    'zero_padded': zero_padded,
+    'greek_10': greek_numbers,
+    'greek_14': greek_numbers,
+}
+FAMILY_LENGTHS: Dict[str, Optional[Sequence[int]]] = {
+    'ambiguous_run': None,
+    'zero_padded': None,
+    'greek_10': (10,),
+    'greek_14': (14,),
+}
+
+
+@dataclass
+class BenchResult:  # pylint: disable=too-many-instance-attributes
+    """
+    Result of a benchmark of a family of numbers
+
+    Attributes:
+        family: Family of the numbers
+        length: Length of the numbers
+        numbers: Count of processed numbers
+        interpretations: Count of generated interpretations
+        total_s: Seconds used to process all the numbers
+        numbers_per_s: Throughput in numbers per second
+        interpretations_per_s: Throughput in interpretations per second
+        p50_ms: Median latency of a number in milliseconds
+        p90_ms: 90th percentile of the latency of a number in milliseconds
+        p99_ms: 99th percentile of the latency of a number in milliseconds
+        peak_memory_kb: Peak of memory allocated while processing the numbers, in KiB
+    """
+    family: str
+    length: int
+    numbers: int
+    interpretations: int
+    total_s: float
+    numbers_per_s: float
+    interpretations_per_s: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    peak_memory_kb: float
+
+    @property
+    def key(self) -> str:
+        """
+        Key used to compare the results of different runs
+
+        :return:
+        """
+        return '{}/{}'.format(self.family, self.length)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """
+    Percentile of a sorted list of values, using the nearest rank
+
+    :param sorted_values:
+    :param fraction: Percentile between 0 and 1
+    :return:
+    """
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def build_result(family: str,
+                 length: int,
+                 latencies: List[float],
+                 interpretations: int,
+                 total_s: float,
+                 peak_memory: int) -> BenchResult:
+    """
+    Build a BenchResult from the measures of a benchmark
+
+    :param family:
+    :param length:
+    :param latencies: Seconds used by each number
+    :param interpretations: Count of generated interpretations
+    :param total_s: Seconds used to process all the numbers
+    :param peak_memory: Peak of memory allocated in bytes
+    :return:
+    """
+    latencies = sorted(latencies)
+    return BenchResult(family=family,
+                       length=length,
+                       numbers=len(latencies),
+                       interpretations=interpretations,
+                       total_s=round(total_s, 6),
+                       numbers_per_s=round(len(latencies) / total_s, 1) if total_s else 0.0,
+                       interpretations_per_s=round(interpretations / total_s, 1) if total_s else 0.0,
+                       p50_ms=round(percentile(latencies, 0.50) * 1000, 4),
+                       p90_ms=round(percentile(latencies, 0.90) * 1000, 4),
+                       p99_ms=round(percentile(latencies, 0.99) * 1000, 4),
+                       peak_memory_kb=round(peak_memory / 1024, 1))
+
+
+def bench_numbers(family: str, numbers: List[str], interpreter: NaturalNumbersInterpreter) -> BenchResult:
+    """
+    Benchmark the generation of all the interpretations of the numbers, one by one
+
+    The peak memory is measured in a second pass, because tracing the memory slows down the interpreter
+
+    :param family:
+    :param numbers: Numbers with the same length
+    :param interpreter:
+    :return:
+    """
+    latencies = []
+    interpretations = 0
+    start_time = time.perf_counter()
+    for number in numbers:
+        number_start_time = time.perf_counter()
+        interpretations += sum(1 for _ in interpreter.iter_interpretations(number))
+        latencies.append(time.perf_counter() - number_start_time)
+    total_s = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    try:
+        for number in numbers:
+            for _ in interpreter.iter_interpretations(number):
+                pass
+        (_, peak_memory) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return build_result(family, len(numbers[0]), latencies, interpretations, total_s, peak_memory)
+
+
+def bench_batch(numbers: List[str], workers: int = 1) -> BenchResult:
+    """
+    Benchmark the processing of the numbers with `interpret_many`, including the validation of the interpretations
+
+    The latencies are the `time_ms` of the results, the peak memory is measured for the current process in a second
+     pass, because tracing the memory slows down the interpreter
+
+    :param numbers:
+    :param workers: Number of processes
+    :return:
+    """
+    start_time = time.perf_counter()
+    results = list(interpret_many(numbers, workers=workers))
+    total_s = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    try:
+        for _ in interpret_many(numbers, workers=workers):
+            pass
+        (_, peak_memory) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = [result['time_ms'] / 1000 for result in results]
+    interpretations = sum(len(result.get('interpretations', [])) for result in results)
+    return build_result('batch', max(map(len, numbers)), latencies, interpretations, total_s, peak_memory)
+
+
+def run_benchmarks(lengths: Sequence[int] = DEFAULT_LENGTHS,
+                   count: int = DEFAULT_COUNT,
+                   workers: int = 1,
+                   progress: Optional[Callable[[BenchResult], None]] = None) -> List[BenchResult]:
+    """
+    Run the benchmarks of all the families of numbers
+
+    :param lengths: Lengths of the families without a fixed length
+    :param count: Numbers of each family and length
+    :param workers: Number of processes of the batch benchmark
+    :param progress: Called with each result when it is ready
+    :return:
+    """
+    interpreter = NaturalNumbersInterpreter()
+    results = []
+    batch_numbers = []
+
+    for (family, build_numbers) in INPUT_FAMILIES.items():
+        for length in FAMILY_LENGTHS[family] or lengths:
+            numbers = build_numbers(length, count, length)
+            batch_numbers.extend(numbers)
+            results.append(bench_numbers(family, numbers, interpreter))
+            if progress:
+                progress(results[-1])
+
+    random.Random(0).shuffle(batch_numbers)
+    results.append(bench_batch(batch_numbers, workers))
+    if progress:
+        progress(results[-1])
+    return results
+
+
+def compare_results(results: List[BenchResult], baseline: Dict[str, Any]) -> List[str]:
+    """
+    Compare the throughput and the latency of the results with a baseline stored by a previous run
+
+    :param results:
+    :param baseline: Content of the JSON file of the baseline
+    :return: Lines with the comparison of each result found in the baseline
+    """
+    baseline_results = {'{}/{}'.format(result['family'], result['length']): result for result in baseline['results']}
+    lines = []
+    for result in results:
+        baseline_result = baseline_results.get(result.key)
+        if not baseline_result or not baseline_result['numbers_per_s'] or not baseline_result['p50_ms']:
+            continue
+        lines.append('{:<20} throughput x{:.2f}  p50 x{:.2f}  peak memory x{:.2f}'.format(
+            result.key,
+            result.numbers_per_s / baseline_result['numbers_per_s'],
+            result.p50_ms / baseline_result['p50_ms'],
+            result.peak_memory_kb / baseline_result['peak_memory_kb'] if baseline_result['peak_memory_kb'] else 0))
+    return lines
+
+
+def format_result(result: BenchResult) -> str:
+    """
+    Format a result as a line of the report
+
+    :param result:
+    :return:
+    """
+    return '{:<20} {:>10.1f} {:>14.1f} {:>9.3f} {:>9.3f} {:>9.3f} {:>10.1f}'.format(
+        result.key, result.numbers_per_s, result.interpretations_per_s, result.p50_ms, result.p90_ms, result.p99_ms,
+        result.peak_memory_kb)
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the benchmarks
+
+    :param argv: Command line arguments, after `bench`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter bench',
+                                     description='Benchmark the interpretation of numbers')
+    parser.add_argument('--lengths', type=positive_int, nargs='+', default=list(DEFAULT_LENGTHS),
+                        help='Lengths of the numbers of the families without a fixed length')
+    parser.add_argument('--count', type=positive_int, default=DEFAULT_COUNT, help='Numbers of each family and length')
+    parser.add_argument('--workers', type=non_negative_int, default=1,
+                        help='Number of processes of the batch benchmark, 0 to use one per CPU')
+    parser.add_argument('-o', '--output', help='JSON file where the results are stored, to be used as baseline')
+    parser.add_argument('--compare', help='JSON file of a previous run to compare the results with')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the benchmarks
+
+    :param argv: Command line arguments after `bench`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+
+    print('{:<20} {:>10} {:>14} {:>9} {:>9} {:>9} {:>10}'.format(
+        'family/length', 'numbers/s', 'interpret./s', 'p50 ms', 'p90 ms', 'p99 ms', 'peak KiB'))
+    results = run_benchmarks(arguments.lengths, arguments.count, arguments.workers,
+                             progress=lambda result: print(format_result(result), flush=True))
+
+    if arguments.output:
+        with open_replacing(arguments.output) as output_file:
+            json.dump({'version': BENCH_FORMAT_VERSION,
+                       'python': platform.python_version(),
+                       'results': [asdict(result) for result in results]}, output_file, indent=2)
+
+    if arguments.compare:
+        with open(arguments.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+        print('\nComparison with {}'.format(arguments.compare))
+        for line in compare_results(results, baseline):
+            print(line)
@@ -0,0 +1,159 @@
+"""
+Module with a reader of big files of numbers, one number per line, that maps the file in memory instead of reading it
+ line by line.
+
+The mapped file is processed in blocks of lines, the whitespace is removed from the bytes of each block before it is
+ decoded, so only the numbers without spaces are decoded and split. The file can be split in byte ranges, shards, to
+ process them in different workers: a line belongs to the shard where it starts, so each line is read by exactly
+ one shard.
+
+Example:
+    $ with MappedInput('numbers.txt') as mapped_input:
+    $     for (start, end) in mapped_input.shard_ranges(4):
+    $         numbers = list(mapped_input.iter_numbers(start, end))
+
+Attributes:
+    bulk_reader.shard_ranges(size: int, shards: int)
+    bulk_reader.parse_shard(shard: str)
+    bulk_reader.iter_mapped_numbers(buffer: ByteBuffer, start: int, end: Optional[int])
+
+Classes:
+    MappedInput: File mapped in memory
+"""
+import mmap
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+# Objects with the buffer protocol that can be scanned
+ByteBuffer = Union[bytes, bytearray, mmap.mmap]
+
+# Bytes processed together, the blocks are extended until the end of their last line
+BLOCK_SIZE = 1 << 20
+# Whitespace removed from the lines, the ASCII whitespace of `str.split()` except the line break
+WHITESPACE = b' \t\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+
+def shard_ranges(size: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split `size` bytes in `shards` byte ranges of the same size
+
+    :param size:
+    :param shards:
+    :raises ValueError: if `shards` is not positive
+    :return: List of `(start, end)`, the end is not included
+    """
+    if shards < 1:
+        raise ValueError('Invalid number of shards {}, it must be positive'.format(shards))
+    return [(size * shard // shards, size * (shard + 1) // shards) for shard in range(shards)]
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """
+    Parse a shard as `INDEX/COUNT`, the index starts at 0
+
+    Example:
+        $ parse_shard('1/4')
+        $ (1, 4)
+
+    :param shard:
+    :raises ValueError: if the shard has not the format or the index is not lower than the count
+    :return: `(index, count)`
+    """
+    try:
+        (index, count) = (int(value) for value in shard.split('/'))
+    except ValueError as error:
+        raise ValueError('Invalid shard "{}", the format is INDEX/COUNT'.format(shard)) from error
+    if not 0 <= index < count:
+        raise ValueError('Invalid shard "{}", the index must be between 0 and COUNT - 1'.format(shard))
+    return index, count
+
+
+def line_start(buffer: ByteBuffer, position: int) -> int:
+    """
+    Start of the first line that starts at `position` or after it
+
+    :param buffer:
+    :param position:
+    :return: Index in the buffer, `len(buffer)` if there are no lines left
+    """
+    if position <= 0:
+        return 0
+    newline = buffer.find(b'\n', position - 1)
+    return len(buffer) if newline < 0 else newline + 1
+
+
+def iter_mapped_numbers(buffer: ByteBuffer, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """
+    Generate the numbers without spaces of the lines that start between `start` and `end`, the empty lines are
+     skipped. The same numbers as `batch.iter_input_numbers` for ASCII input.
+
+    The range is processed in blocks of whole lines of about `BLOCK_SIZE` bytes, the whitespace of a block is
+     removed from its bytes at once, and the block is decoded and split in numbers.
+
+    :param buffer: Bytes of the file
+    :param start: First byte of the range
+    :param end: Byte after the range, if not provided the end of the buffer
+    :return: Iterator of numbers without spaces
+    """
+    end = line_start(buffer, len(buffer) if end is None else end)
+    block_start = line_start(buffer, start)
+    while block_start < end:
+        block_end = min(end, line_start(buffer, block_start + BLOCK_SIZE))
+        block = buffer[block_start:block_end].translate(None, WHITESPACE).decode('utf-8', 'replace')
+        yield from filter(None, block.split('\n'))
+        block_start = block_end
+
+
+class MappedInput:
+    """
+    File of numbers, one number per line, mapped in memory
+
+    Attributes:
+        path: Path of the file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as input_file:
+            # Empty files can't be mapped
+            self._buffer: ByteBuffer = b''
+            if input_file.seek(0, 2):
+                self._buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __enter__(self) -> 'MappedInput':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the mapping of the file
+
+        :return:
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def shard_ranges(self, shards: int) -> List[Tuple[int, int]]:
+        """
+        Split the file in `shards` byte ranges of the same size
+
+        :param shards:
+        :raises ValueError: if `shards` is not positive
+        :return: List of `(start, end)`, to use with `iter_numbers`
+        """
+        return shard_ranges(len(self), shards)
+
+    def iter_numbers(self, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+        """
+        Generate the numbers without spaces of the lines that start between `start` and `end`
+
+        :param start: First byte of the range
+        :param end: Byte after the range, if not provided the end of the file
+        :return: Iterator of numbers without spaces
+        """
+        return iter_mapped_numbers(self._buffer, start, end)
@@ -0,0 +1,179 @@
+"""
+Module with an interpreter of numbers received as bytes, `bytes`, `bytearray` or `memoryview`, that doesn't decode them.
+
+The digits are classified by their byte value: the bytes of each index and the next ones are packed in an integer key,
+ that is looked up in a table precomputed from `ambiguity_tables` to get the length of the ambiguity that starts in the
+ index. The keys are computed in a single pass from right to left, shifting the key of the next index.
+
+The segmentation is the same of `NaturalNumbersInterpreter.create_possible_interpretations`, but the states only
+ track the start of their ambiguities, because the single numbers don't change the states. The interpretations are
+ generated like `NaturalNumbersInterpreter.iter_ambiguity_choices`, in the same order, on a working bytearray that is
+ truncated and extended between choices, and they are written to an output bytearray provided by the caller, so the
+ buffers can be reused between numbers.
+
+Example:
+    $ output = bytearray()
+    $ write_interpretations(b'2336', output)
+    $ 5
+    $ bytes(output)
+    $ b'2336\n23306\n23036\n20336\n203306\n'
+
+Attributes:
+    byte_interpreter.ambiguity_lengths(view: memoryview)
+    byte_interpreter.byte_ambiguities(lengths: List[int])
+    byte_interpreter.write_interpretations(data: BytesLike, output: bytearray, separator: bytes)
+"""
+import re
+from typing import Dict, List, Optional, Tuple, Union
+from phone_number_interpreter.ambiguity_tables import AMBIGUITIES, MAX_AMBIGUITY_LENGTH, WINDOW_MATCHES
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+# Ambiguities of a number: `(start index, length, bitmask of the possible interpretations including it)`
+ByteAmbiguity = Tuple[int, int, int]
+
+NON_DIGIT = re.compile(rb'[^0-9]')
+# Bits of a byte in the keys of the windows
+BYTE_BITS = 8
+KEY_SHIFT = BYTE_BITS * (MAX_AMBIGUITY_LENGTH - 1)
+
+
+def window_key(window: bytes) -> int:
+    """
+    Key of a window of bytes, the first byte in the highest bits and 0 for the missing bytes at the end of the number
+
+    :param window: Up to MAX_AMBIGUITY_LENGTH bytes
+    :return:
+    """
+    return int.from_bytes(window.ljust(MAX_AMBIGUITY_LENGTH, b'\0'), 'big')
+
+
+# Length of the ambiguity that starts each window of digits by its key, 0 if there is not an ambiguity
+BYTE_WINDOW_MATCHES: Dict[int, int] = {window_key(window.encode('ascii')): length
+                                       for (window, length) in WINDOW_MATCHES.items()}
+BYTE_AMBIGUITIES: Dict[bytes, bytes] = {ambiguity.encode('ascii'): replacement.encode('ascii')
+                                        for (ambiguity, replacement) in AMBIGUITIES.items()}
+
+
+def ambiguity_lengths(view: memoryview) -> List[int]:
+    """
+    Length of the ambiguity that starts in each index of a number
+
+    :param view: Digits of the number, one byte per digit
+    :return: List with the length of the ambiguity of each index, 0 if there is not an ambiguity
+    """
+    lengths = [0] * len(view)
+    key = 0
+    for index in range(len(view) - 1, -1, -1):
+        key = view[index] << KEY_SHIFT | key >> BYTE_BITS
+        lengths[index] = BYTE_WINDOW_MATCHES[key]
+    return lengths
+
+
+def byte_ambiguities(lengths: List[int]) -> Tuple[List[ByteAmbiguity], int]:
+    """
+    Segmentation of a number from the lengths of its ambiguities, with the same possible interpretations of
+     `NaturalNumbersInterpreter.create_possible_interpretations`
+
+    :param lengths: Length of the ambiguity of each index, as returned by `ambiguity_lengths`
+    :return: Ambiguities sorted by start index, and number of possible interpretations
+    """
+    # States `(covered_index, linked starts of the ambiguities)`, before the current index and the two previous ones
+    states: List[Tuple[int, Optional[tuple]]] = [(-1, None)]
+    previous_states = second_previous_states = states
+
+    for (index, length) in enumerate(lengths):
+        if not length:
+            (previous_states, second_previous_states) = (states, previous_states)
+            continue
+
+        last_index = index + length - 1
+        new_states = []
+        exclusive_ambiguity = True
+        for (covered_index, starts) in states:
+            if covered_index < index:
+                new_states.append((last_index, (index, starts)))
+                exclusive_ambiguity = False
+            else:
+                new_states.append((covered_index, starts))
+
+        if exclusive_ambiguity:
+            # The states of the number before the index can't include an ambiguity that ends in the index
+            if index > 1 and index - 2 + lengths[index - 2] - 1 == index:
+                prefix_states = second_previous_states
+            else:
+                prefix_states = previous_states
+            new_states.extend((last_index, (index, starts)) for (_, starts) in prefix_states)
+
+        (states, previous_states, second_previous_states) = (new_states, states, previous_states)
+
+    owners: Dict[int, int] = {}
+    for (interpretation_n, (_, starts)) in enumerate(states):
+        while starts is not None:
+            (start, starts) = starts
+            owners[start] = owners.get(start, 0) | 1 << interpretation_n
+    return [(start, lengths[start], owners[start]) for start in sorted(owners)], len(states)
+
+
+def write_interpretations(data: BytesLike, output: bytearray, separator: bytes = b'\n') -> int:
+    """
+    Write the interpretations of a number to `output`, each one followed by `separator`, in the same order of
+     `NaturalNumbersInterpreter.iter_interpretations`
+
+    The interpretations are added to the end of `output`, it can be cleared and reused for the next numbers.
+
+    :param data: Digits of the number as ASCII bytes, a non contiguous memoryview is copied once
+    :param output: Buffer where the interpretations are written
+    :param separator: Bytes written after each interpretation
+    :raises ValueError: if `data` contains non numeric characters
+    :return: Number of interpretations written
+    """
+    view = memoryview(data)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    if view.ndim != 1 or view.format != 'B':
+        view = view.cast('B')
+    if not view or NON_DIGIT.search(view):
+        raise ValueError('Invalid number "{}", it must contain only numbers'.format(bytes(view).decode('ascii',
+                                                                                                      'replace')))
+
+    (ambiguities, possible_interpretations_count) = byte_ambiguities(ambiguity_lengths(view))
+    replacements = [BYTE_AMBIGUITIES[bytes(view[start:start + length])] for (start, length, _) in ambiguities]
+    ambiguities_count = len(ambiguities)
+    starts = [start_index for (start_index, _, _) in ambiguities]
+    ambiguities_owners = [ambiguity_owners for (_, _, ambiguity_owners) in ambiguities]
+
+    interpretation = bytearray()
+    interpretations_count = 0
+    # Stack of the replaced ambiguities to explore: (ambiguity, bitmask of possible interpretations, index of the
+    # number before the ambiguity, length of the interpretation before it). The kept ambiguities are walked in place,
+    # so the choices are explored in the same order of `iter_ambiguity_choices`
+    stack = [(-1, (1 << possible_interpretations_count) - 1, 0, 0)]
+    while stack:
+        (replaced_n, owners, index, interpretation_length) = stack.pop()
+        # The interpretation of the entry is a prefix of the working buffer, the choices after it are discarded
+        del interpretation[interpretation_length:]
+        ambiguity_n = replaced_n + 1
+        if replaced_n >= 0:
+            (start_index, length, _) = ambiguities[replaced_n]
+            interpretation += view[index:start_index]
+            interpretation += replacements[replaced_n]
+            index = start_index + length
+            # Skip the ambiguities that intersect the replaced ambiguity
+            while ambiguity_n < ambiguities_count and starts[ambiguity_n] < index:
+                ambiguity_n += 1
+
+        interpretation_length = len(interpretation)
+        for next_n in range(ambiguity_n, ambiguities_count):
+            # Replace the ambiguity later, if it is included in a possible interpretation together with the previous
+            # replaced ambiguities
+            ambiguity_owners = ambiguities_owners[next_n]
+            if owners & ambiguity_owners:
+                stack.append((next_n, owners & ambiguity_owners, index, interpretation_length))
+
+        output += interpretation
+        output += view[index:]
+        output += separator
+        interpretations_count += 1
+
+    return interpretations_count
@@ -0,0 +1,205 @@
+"""
+Module with an in-memory LRU cache, used to reuse the results of the numbers that are processed many times.
+
+Classes:
+    CacheStats: Counters of the use of a cache
+    ResultCache(metaclass=ABCMeta): Abstract base class of the caches of results
+    LRUCache(ResultCache): Bounded cache that evicts the least recently used entries
+"""
+import threading
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of the use of a cache
+
+    Attributes:
+        hits: Number of lookups that found the key
+        misses: Number of lookups that didn't find the key
+        evictions: Number of entries removed to respect the capacity
+        size: Number of entries in the cache
+        capacity: Maximum number of entries of the cache
+    """
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    capacity: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of lookups that found the key
+
+        :return: Hit rate between 0 and 1, 0 if there were no lookups
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache(metaclass=ABCMeta):
+    """
+    Abstract base class of the caches of results
+
+    The caches that have a cost per operation can override `get_many` and `put_many`, they are used to read and
+     store the results of a block of numbers at once.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the value of a key
+
+        :param key:
+        :return: Value of the key, None if the key is not in the cache
+        """
+        raise NotImplementedError('Missing implementation of .get(key: Hashable)')
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key
+
+        :param key:
+        :param value: Value to store, it can't be None
+        :return:
+        """
+        raise NotImplementedError('Missing implementation of .put(key: Hashable, value: Any)')
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters
+
+        :return:
+        """
+        raise NotImplementedError('Missing implementation of .clear()')
+
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """
+        Get the counters of the use of the cache
+
+        :return:
+        """
+        raise NotImplementedError('Missing implementation of .stats()')
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        """
+        Get the values of many keys
+
+        :param keys:
+        :return: Value of each key, None for the keys that are not in the cache
+        """
+        return [self.get(key) for key in keys]
+
+    def put_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Store the values of many keys
+
+        :param items: Keys and values, the values can't be None
+        :return:
+        """
+        for (key, value) in items:
+            self.put(key, value)
+
+
+class LRUCache(ResultCache):
+    """
+    Bounded cache that evicts the least recently used entries when it is full.
+
+    The cache can be shared between threads, all the operations are protected by a lock. When the cache is pickled,
+     to send it to another process, the entries are copied and the counters are reset.
+
+    Example:
+        $ cache = LRUCache(capacity=2)
+        $ cache.put('2336', ('2336', '23306'))
+        $ cache.get('2336')
+        $ ('2336', '23306')
+        $ cache.stats()
+        $ CacheStats(hits=1, misses=0, evictions=0, size=1, capacity=2)
+
+    Attributes:
+        capacity: Maximum number of entries
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError('The capacity of the cache must be greater than 0')
+        self.capacity = capacity
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> dict:
+        with self._lock:
+            return {'capacity': self.capacity, 'entries': list(self._entries.items())}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['capacity'])
+        self._entries.update(state['entries'])
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the value of a key, and mark it as the most recently used
+
+        :param key:
+        :return: Value of the key, None if the key is not in the cache
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key, if the cache is full the least recently used entry is evicted
+
+        :param key:
+        :param value: Value to store, it can't be None
+        :return:
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove all the entries and reset the counters
+
+        :return:
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get the counters of the use of the cache
+
+        :return:
+        """
+        with self._lock:
+            return CacheStats(hits=self._hits,
+                              misses=self._misses,
+                              evictions=self._evictions,
+                              size=len(self._entries),
+                              capacity=self.capacity)
@@ -0,0 +1,392 @@
+"""
+Module with an index of known phone numbers, to find the contacts whose number is an interpretation of a number
+ without generating its interpretations.
+
+The replacement of an ambiguity of `LANGUAGE_AMBIGUITIES` adds or removes a '0' after its first number, with the
+ default rules between a number in [2-9] and a number in [1-9], and it doesn't change the numbers around the other '0'
+ of the number. Removing all those '0' gives a canonical form that is the same for a number and all its
+ interpretations, so the contacts are grouped by the canonical form of their number and a lookup only reads the group
+ of the canonical form of the number. The contacts of the group are then checked with the InterpretationGraph of the
+ number.
+
+The index can be saved to a file that is read with mmap, without loading it:
+
+    Header: magic, version, number of slots, number of records
+    Slots: hash table with linear probing of (hash of canonical form, first record, number of records)
+    Records: (offset, length) in the strings of each contact, sorted by canonical form
+    Strings: 'number<TAB>label' of each contact in UTF-8
+
+Examples:
+    $ python -m phone_number_interpreter contacts build contacts.csv -o contacts.idx
+    $ python -m phone_number_interpreter contacts lookup contacts.idx "0 0 30 69 70 24 1 3 50 2"
+
+Attributes:
+    contacts_index.canonical_form(text_number: str)
+    contacts_index.normalize_number(number: str)
+    contacts_index.read_contacts(lines: Iterable[str])
+    contacts_index.parse_arguments(argv: List[str])
+    contacts_index.run(argv: Optional[List[str]])
+
+Classes:
+    Contact
+    ContactsIndex: Index in memory, that can be saved to a file
+    MappedContactsIndex: Index read from a file with mmap
+"""
+import argparse
+import csv
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Set
+from phone_number_interpreter.interpretation_graph import InterpretationGraph
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from phone_number_interpreter.natural_numbers_interpreter import DIGITS
+
+
+INDEX_MAGIC = b'PNICTIDX'
+INDEX_VERSION = 1
+HEADER = struct.Struct('<8sIII')
+SLOT = struct.Struct('<QII')
+RECORD = struct.Struct('<II')
+
+
+def ambiguous_zero_pattern(ambiguities: Dict[str, str]) -> Pattern[str]:
+    """
+    Regular expression of the '0' that can be added or removed by the replacement of an ambiguity, by the numbers
+     around it
+
+    :param ambiguities: Dict with the replacement of each ambiguity, like LANGUAGE_AMBIGUITIES
+    :return:
+    """
+    numbers_after: Dict[str, Set[str]] = defaultdict(set)
+    for (ambiguity, replacement) in ambiguities.items():
+        with_zero = max(ambiguity, replacement, key=len)
+        numbers_after[with_zero[0]].add(with_zero[2])
+    return re.compile('|'.join('(?<={})0(?=[{}])'.format(number, ''.join(sorted(after)))
+                               for (number, after) in sorted(numbers_after.items())))
+
+
+AMBIGUOUS_ZERO = ambiguous_zero_pattern(LANGUAGE_AMBIGUITIES)
+
+
+def canonical_form(text_number: str) -> str:
+    """
+    Canonical form of a number, the same for all its interpretations
+
+    Example:
+        $ canonical_form('2030604')
+        $ '2364'
+
+    :param text_number: Number without spaces
+    :return: Number without the '0' that can be added or removed by the ambiguities, with the default rules the '0'
+     between a number in [2-9] and a number in [1-9]
+    """
+    return AMBIGUOUS_ZERO.sub('', text_number)
+
+
+def canonical_hash(canonical: str) -> int:
+    """
+    Hash of a canonical form, stable between executions
+
+    :param canonical:
+    :return: Unsigned 64 bits hash
+    """
+    return int.from_bytes(hashlib.blake2b(canonical.encode('ascii'), digest_size=8).digest(), 'little')
+
+
+def normalize_number(number: str) -> str:
+    """
+    Remove the spaces, dashes and parentheses of a phone number, the leading '+' is replaced by '00'
+
+    :param number:
+    :raises ValueError: if the number contains other non numeric characters
+    :return:
+    """
+    text_number = ''.join(number.split())
+    text_number = text_number.replace('-', '').replace('(', '').replace(')', '')
+    if text_number.startswith('+'):
+        text_number = '00' + text_number[1:]
+    if not text_number or not DIGITS.issuperset(text_number):
+        raise ValueError('Invalid phone number "{}", it must contain only numbers'.format(number))
+    return text_number
+
+
+@dataclass(frozen=True)
+class Contact:
+    """
+    Known phone number
+
+    Attributes:
+        number: Phone number, only numbers
+        label: Name or identifier of the contact
+    """
+    number: str
+    label: str = ''
+
+
+def read_contacts(lines: Iterable[str]) -> Iterator[Contact]:
+    """
+    Read the contacts of a CSV file, the first column is the phone number and the second, optional, the label
+
+    :param lines:
+    :raises ValueError: if a phone number is not valid
+    :return: Iterator of contacts, the empty lines are skipped
+    """
+    for row in csv.reader(lines):
+        if row and row[0].strip():
+            yield Contact(normalize_number(row[0]), row[1].strip() if len(row) > 1 else '')
+
+
+def matching_contacts(text_number: str, candidates: List[Contact]) -> List[Contact]:
+    """
+    Contacts whose number is an interpretation of a number
+
+    :param text_number: Number without spaces
+    :param candidates: Contacts with the same canonical form as the number
+    :return:
+    """
+    if not candidates:
+        return []
+    graph = InterpretationGraph.from_number(text_number)
+    return [contact for contact in candidates if graph.contains(contact.number)]
+
+
+class ContactsIndex:
+    """
+    Index of contacts by the canonical form of their number
+
+    Example:
+        $ index = ContactsIndex([Contact('00306970241352', 'Alice')])
+        $ index.lookup('003069702413502')
+        $ [Contact(number='00306970241352', label='Alice')]
+
+    Attributes:
+        groups: Contacts by canonical form
+    """
+
+    def __init__(self, contacts: Iterable[Contact] = ()):
+        self.groups: Dict[str, List[Contact]] = defaultdict(list)
+        for contact in contacts:
+            self.add(contact)
+
+    def __len__(self) -> int:
+        return sum(len(contacts) for contacts in self.groups.values())
+
+    def add(self, contact: Contact) -> None:
+        """
+        Add a contact to the index
+
+        :param contact:
+        :return:
+        """
+        self.groups[canonical_form(contact.number)].append(contact)
+
+    def candidates(self, text_number: str) -> List[Contact]:
+        """
+        Contacts with the same canonical form as a number
+
+        :param text_number: Number without spaces
+        :return:
+        """
+        return list(self.groups.get(canonical_form(text_number), ()))
+
+    def lookup(self, text_number: str) -> List[Contact]:
+        """
+        Contacts whose number is an interpretation of a number
+
+        :param text_number: Number without spaces
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return:
+        """
+        if not text_number or not DIGITS.issuperset(text_number):
+            raise ValueError('Invalid number "{}", it must contain only numbers'.format(text_number))
+        return matching_contacts(text_number, self.candidates(text_number))
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a file that can be read with MappedContactsIndex
+
+        The index is written to a temporary file that replaces `path` when it is complete, so an interrupted save
+         doesn't leave a truncated index, and the indexes mapped from the previous file keep their contents.
+
+        :param path:
+        :return:
+        """
+        groups = sorted(self.groups.items())
+        slots_count = 1
+        while slots_count < 2 * len(groups):
+            slots_count *= 2
+        slots = [(0, 0, 0)] * slots_count
+        records = []
+        strings = []
+        strings_length = 0
+
+        for (canonical, contacts) in groups:
+            slot = canonical_hash(canonical) & (slots_count - 1)
+            while slots[slot][2]:
+                slot = (slot + 1) & (slots_count - 1)
+            slots[slot] = (canonical_hash(canonical), len(records), len(contacts))
+            for contact in contacts:
+                entry = '{}\t{}'.format(contact.number, contact.label).encode('utf-8')
+                records.append((strings_length, len(entry)))
+                strings.append(entry)
+                strings_length += len(entry)
+
+        temporary_path = '{}.{}.tmp'.format(path, os.getpid())
+        try:
+            with open(temporary_path, 'wb') as index_file:
+                index_file.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, slots_count, len(records)))
+                index_file.write(b''.join(SLOT.pack(*slot) for slot in slots))
+                index_file.write(b''.join(RECORD.pack(*record) for record in records))
+                index_file.write(b''.join(strings))
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(temporary_path)
+            raise
+        os.replace(temporary_path, path)
+
+
+class MappedContactsIndex:
+    """
+    Index of contacts read from a file saved by ContactsIndex, the file is mapped in memory and only the slot of the
+     canonical form of the number and its records are read in a lookup
+
+    Example:
+        $ with MappedContactsIndex('contacts.idx') as index:
+        $     index.lookup('003069702413502')
+        $ [Contact(number='00306970241352', label='Alice')]
+
+    Attributes:
+        path: Path of the index file
+        slots_count: Number of slots of the hash table
+        records_count: Number of contacts
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as index_file:
+            self._map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, self.slots_count, self.records_count) = HEADER.unpack_from(self._map, 0)
+        except struct.error as error:
+            self._map.close()
+            raise ValueError('Invalid contacts index "{}"'.format(path)) from error
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._map.close()
+            raise ValueError('Invalid contacts index "{}", unknown format or version'.format(path))
+        self._records_offset = HEADER.size + self.slots_count * SLOT.size
+        self._strings_offset = self._records_offset + self.records_count * RECORD.size
+
+    def __len__(self) -> int:
+        return self.records_count
+
+    def __enter__(self) -> 'MappedContactsIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the mapping of the file
+
+        :return:
+        """
+        self._map.close()
+
+    def candidates(self, text_number: str) -> List[Contact]:
+        """
+        Contacts with the same canonical form as a number
+
+        :param text_number: Number without spaces
+        :return:
+        """
+        canonical = canonical_form(text_number)
+        hash_value = canonical_hash(canonical)
+        slot = hash_value & (self.slots_count - 1)
+        while True:
+            (slot_hash, first_record, records_count) = SLOT.unpack_from(self._map, HEADER.size + slot * SLOT.size)
+            if not records_count:
+                return []
+            if slot_hash == hash_value:
+                break
+            slot = (slot + 1) & (self.slots_count - 1)
+
+        contacts = []
+        for record in range(first_record, first_record + records_count):
+            (offset, length) = RECORD.unpack_from(self._map, self._records_offset + record * RECORD.size)
+            start = self._strings_offset + offset
+            (number, label) = self._map[start:start + length].decode('utf-8').split('\t', 1)
+            contacts.append(Contact(number, label))
+        # Different canonical forms can have the same hash
+        return [contact for contact in contacts if canonical_form(contact.number) == canonical]
+
+    def lookup(self, text_number: str) -> List[Contact]:
+        """
+        Contacts whose number is an interpretation of a number
+
+        :param text_number: Number without spaces
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return:
+        """
+        if not text_number or not DIGITS.issuperset(text_number):
+            raise ValueError('Invalid number "{}", it must contain only numbers'.format(text_number))
+        return matching_contacts(text_number, self.candidates(text_number))
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the contacts index
+
+    :param argv: Command line arguments, after `contacts`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter contacts',
+                                     description='Build an index of known phone numbers, and find the contacts whose '
+                                                 'number is an interpretation of a number')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help='Build the index of a CSV file of contacts')
+    build_parser.add_argument('contacts', help='CSV file with the phone number and, optionally, the label of each '
+                                               'contact, "-" to read it from stdin')
+    build_parser.add_argument('-o', '--output', required=True, help='File where the index is saved')
+    lookup_parser = commands.add_parser('lookup', help='Find the contacts of a number')
+    lookup_parser.add_argument('index', help='File of the index')
+    lookup_parser.add_argument('number', nargs='+', help='Number to find')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the contacts index
+
+    :param argv: Command line arguments after `contacts`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+
+    if arguments.command == 'build':
+        input_file = sys.stdin if arguments.contacts == '-' else open(arguments.contacts, encoding='utf-8', newline='')
+        try:
+            index = ContactsIndex(read_contacts(input_file))
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+        index.save(arguments.output)
+        print('Indexed {} contacts in {} groups'.format(len(index), len(index.groups)), file=sys.stderr)
+        return
+
+    input_number = ''.join(' '.join(arguments.number).split())
+    with MappedContactsIndex(arguments.index) as index:
+        try:
+            contacts = index.lookup(input_number)
+        except ValueError:
+            print('Invalid input number "{}", it must contain only numbers'.format(input_number))
+            return
+    for contact in contacts:
+        print('{} {}'.format(contact.number, contact.label).rstrip())
@@ -0,0 +1,184 @@
+"""
+Module with an incremental interpreter, for numbers that are received in chunks of digits, e.g. from speech
+ recognition while the caller speaks.
+
+The segmentation of `NaturalNumbersInterpreter.create_possible_interpretations` processes the number from left to
+ right, and the ambiguity that starts in an index only depends on the next two numbers. The incremental interpreter
+ keeps the states of the segmentation between chunks, and processes each index as soon as the two numbers after it are
+ received, so each chunk only costs the work of its own digits. The last two numbers are processed when the number is
+ finished, or on a copy of the states when the interpretations of the digits received so far are requested.
+
+Example:
+    $ interpreter = IncrementalInterpreter()
+    $ interpreter.feed('23')
+    $ interpreter.count_interpretations()
+    $ 2
+    $ interpreter.feed('36')
+    $ interpreter.count_potentially_valid(GreekPhoneNumberValidator)
+    $ 5
+    $ interpreter.finish()
+    $ [PossibleInterpretation(...), PossibleInterpretation(...)]
+
+Attributes:
+    incremental_interpreter.prefix_validator(validator: Type[PhoneValidator])
+
+Classes:
+    IncrementalInterpreter
+"""
+import sys
+from typing import List, Optional, Tuple, Type
+from phone_number_interpreter.natural_numbers_ambiguities import MAX_AMBIGUITY_LENGTH
+from phone_number_interpreter.natural_numbers_interpreter import DIGITS, NaturalNumbersInterpreter, \
+    PossibleInterpretation, SegmentationState
+from phone_number_interpreter.phone_number_validator import PhoneValidator
+
+
+# Numbers after an index needed to know if an ambiguity starts in it
+LOOKAHEAD = MAX_AMBIGUITY_LENGTH - 1
+
+
+def prefix_validator(validator: Type[PhoneValidator]) -> Type[PhoneValidator]:
+    """
+    Create a PhoneValidator that accepts the numbers that can be the start of a valid phone number of `validator`,
+     because they match a valid start and they aren't longer than a valid length
+
+    :param validator: PhoneValidator that declares its valid lengths and starts
+    :return:
+    """
+    class PrefixPhoneValidator(validator):  # type: ignore
+        """PhoneValidator that accepts the start of the valid phone numbers"""
+
+        @staticmethod
+        def validate(text_number: str) -> bool:
+            return validator.could_be_valid(text_number, len(text_number), sys.maxsize)
+
+        @classmethod
+        def could_be_valid(cls, prefix: str, min_len: int, max_len: int) -> bool:
+            return validator.could_be_valid(prefix, min_len, sys.maxsize)
+
+    return PrefixPhoneValidator
+
+
+class IncrementalInterpreter:
+    """
+    Interpreter of a number received in chunks of digits, with `feed`, that is completed with `finish`.
+
+    Only the last numbers of the number are kept to detect the ambiguities, the numbers already processed are stored
+     in the states of the segmentation.
+
+    Attributes:
+        interpreter: NaturalNumbersInterpreter used to generate and count the interpretations
+        finished: True when `finish` was called, no more digits can be received
+    """
+
+    def __init__(self, interpreter: Optional[NaturalNumbersInterpreter] = None):
+        self.interpreter = interpreter if interpreter else NaturalNumbersInterpreter()
+        self.finished = False
+        self._length = 0
+        self._next_index = 0
+        # Numbers from `_window_start`, needed to process the indexes from `_next_index`
+        self._window = ''
+        self._window_start = 0
+        # States before `_next_index` and before the two previous indexes
+        self._states: List[SegmentationState] = [(-1, None)]
+        self._previous_states = self._second_previous_states = self._states
+
+    def __len__(self) -> int:
+        return self._length
+
+    def feed(self, digits: str) -> None:
+        """
+        Receive the next digits of the number, and process the indexes that have all the numbers they depend on
+
+        :param digits:
+        :raises ValueError: if `digits` contains non numeric characters, or the number is finished
+        :return:
+        """
+        if self.finished:
+            raise ValueError('The number is finished, it can\'t receive more digits')
+        if not DIGITS.issuperset(digits):
+            raise ValueError('Invalid digits "{}", they must contain only numbers'.format(digits))
+
+        self._window += digits
+        self._length += len(digits)
+        end_index = max(self._next_index, self._length - LOOKAHEAD)
+        (self._states, self._previous_states, self._second_previous_states) = self._process(end_index)
+        self._next_index = end_index
+
+        # Keep only the numbers needed to process the next indexes
+        window_start = max(0, self._next_index - LOOKAHEAD)
+        self._window = self._window[window_start - self._window_start:]
+        self._window_start = window_start
+
+    def _process(self, end_index: int) -> Tuple[List[SegmentationState], ...]:
+        """
+        Process the indexes from `_next_index` until `end_index`, without modifying the stored states
+
+        :param end_index: First index that is not processed
+        :return: States before `end_index` and before the two previous indexes
+        """
+        states = self._states
+        (previous_states, second_previous_states) = (self._previous_states, self._second_previous_states)
+        for index in range(self._next_index, end_index):
+            (new_states, _) = NaturalNumbersInterpreter.add_index_to_states(self._window, index, states,
+                                                                            previous_states, second_previous_states,
+                                                                            self._window_start,
+                                                                            self.interpreter.transducer)
+            (states, previous_states, second_previous_states) = (new_states, states, previous_states)
+        return states, previous_states, second_previous_states
+
+    def possible_interpretations(self) -> List[PossibleInterpretation]:
+        """
+        Possible interpretations of the digits received so far, as if the number was finished
+
+        :raises ValueError: if no digits were received
+        :return: List of PossibleInterpretation
+        """
+        if not self._length:
+            raise ValueError('Invalid number "", it must contain only numbers')
+        (states, _, _) = self._process(self._length)
+        return [NaturalNumbersInterpreter.build_possible_interpretation(elements) for (_, elements) in states]
+
+    def finish(self) -> List[PossibleInterpretation]:
+        """
+        Complete the number, processing its last numbers
+
+        :raises ValueError: if no digits were received
+        :return: List of PossibleInterpretation of the number, the same of `create_possible_interpretations`
+        """
+        possible_interpretations = self.possible_interpretations()
+        (self._states, self._previous_states, self._second_previous_states) = self._process(self._length)
+        self._next_index = self._length
+        self.finished = True
+        return possible_interpretations
+
+    def count_interpretations(self) -> int:
+        """
+        Count the interpretations of the digits received so far, without creating them
+
+        :raises ValueError: if no digits were received
+        :return:
+        """
+        possible_interpretations = self.possible_interpretations()
+        ambiguities = self.interpreter.ambiguities_of_possible_interpretations(possible_interpretations)
+        return self.interpreter.count_ambiguity_choices(ambiguities, len(possible_interpretations))
+
+    def count_potentially_valid(self, validator: Type[PhoneValidator]) -> int:
+        """
+        Count the interpretations of the digits received so far that are valid phone numbers or the start of one,
+         the interpretations that can't be valid are discarded while they are created
+
+        If the number is finished, only the valid phone numbers are counted.
+
+        :param validator: PhoneValidator
+        :raises ValueError: if no digits were received
+        :return:
+        """
+        possible_interpretations = self.possible_interpretations()
+        ambiguities = self.interpreter.ambiguities_of_possible_interpretations(possible_interpretations)
+        text_number = ''.join(possible_interpretations[0].interpretation_elements)
+        if not self.finished:
+            validator = prefix_validator(validator)
+        return sum(1 for _ in self.interpreter.iter_ambiguity_choices(text_number, ambiguities,
+                                                                      len(possible_interpretations), validator,
+                                                                      self.interpreter.replacements))
@@ -0,0 +1,220 @@
+"""
+Module with a directed acyclic graph of the interpretations of a number, built from its possible interpretations
+ without generating the interpretations.
+
+Each interpretation is a choice of ambiguities to replace, that are included together in a PossibleInterpretation
+ (see `NaturalNumbersInterpreter.iter_ambiguity_choices`). The nodes of the graph are the partial choices, identified
+ by the next ambiguity to decide, the next index of the number and the bitmask of the possible interpretations that
+ include all the replaced ambiguities. Each node has an edge to keep the ambiguity and, if it can be replaced, an edge
+ to replace it. The partial choices that reach the same node share the rest of the graph.
+
+The replacement of an ambiguity adds or removes a '0' after its first number, so a candidate number decides at each
+ ambiguity which edge to follow by its next number, and it is checked walking the graph once.
+
+Example:
+    $ graph = InterpretationGraph.from_number('2336')
+    $ graph.count()
+    $ 5
+    $ graph.contains('20336')
+    $ True
+    $ list(graph)
+    $ ['2336', '23306', '23036', '20336', '203306']
+
+Classes:
+    InterpretationGraph
+"""
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from phone_number_interpreter.natural_numbers_interpreter import AmbiguityOwners, NaturalNumbersInterpreter
+
+
+# Target of the edges that are not in the graph
+NO_EDGE = -1
+
+
+class InterpretationGraph:
+    """
+    Graph of the interpretations of a number
+
+    The nodes are stored in lists indexed by node, the root is the node 0 and the nodes are sorted topologically. The
+     nodes without ambiguities left are final, the rest of the number is added to their interpretations.
+
+    Attributes:
+        text_number: Number without spaces
+        ambiguities: Ambiguities of the number, as returned by `ambiguities_of_possible_interpretations`
+        ambiguity_of_node: Next ambiguity to decide of each node, `len(ambiguities)` for the final nodes
+        index_of_node: Next index of the number of each node
+        keep_edges: Node reached keeping the ambiguity of each node
+        replace_edges: Node reached replacing the ambiguity of each node, NO_EDGE if it can't be replaced
+        replacements: Replacement of each ambiguity
+    """
+
+    def __init__(self,
+                 text_number: str,
+                 ambiguities: List[AmbiguityOwners],
+                 possible_interpretations_count: int,
+                 replacements: Mapping[str, str] = LANGUAGE_AMBIGUITIES):
+        self.text_number = text_number
+        self.ambiguities = ambiguities
+        self.replacements = replacements
+        self.ambiguity_of_node: List[int] = []
+        self.index_of_node: List[int] = []
+        self.keep_edges: List[int] = []
+        self.replace_edges: List[int] = []
+
+        ambiguities_count = len(ambiguities)
+        # Nodes by (ambiguity, index, owners), and the nodes pending to add their edges by ambiguity
+        nodes: Dict[Tuple[int, int, int], int] = {}
+        pending: List[List[Tuple[int, int, int]]] = [[] for _ in range(ambiguities_count + 1)]
+
+        def node_of(ambiguity_n: int, index: int, owners: int) -> int:
+            # Skip the ambiguities that intersect a replaced ambiguity
+            while ambiguity_n < ambiguities_count and ambiguities[ambiguity_n][0] < index:
+                ambiguity_n += 1
+            key = (ambiguity_n, index, owners)
+            node = nodes.get(key)
+            if node is None:
+                node = nodes[key] = len(self.ambiguity_of_node)
+                self.ambiguity_of_node.append(ambiguity_n)
+                self.index_of_node.append(index)
+                self.keep_edges.append(NO_EDGE)
+                self.replace_edges.append(NO_EDGE)
+                pending[ambiguity_n].append(key)
+            return node
+
+        node_of(0, 0, (1 << possible_interpretations_count) - 1)
+        # The edges go to nodes of later ambiguities, so the nodes of each ambiguity are complete when it is reached
+        for ambiguity_n in range(ambiguities_count):
+            for key in pending[ambiguity_n]:
+                (_, index, owners) = key
+                (start_index, ambiguity, ambiguity_owners) = ambiguities[ambiguity_n]
+                node = nodes[key]
+                self.keep_edges[node] = node_of(ambiguity_n + 1, index, owners)
+                if owners & ambiguity_owners:
+                    self.replace_edges[node] = node_of(ambiguity_n + 1, start_index + len(ambiguity),
+                                                       owners & ambiguity_owners)
+
+        # Sort the nodes topologically, by ambiguity, keeping the root as node 0
+        order = sorted(range(len(self.ambiguity_of_node)), key=self.ambiguity_of_node.__getitem__)
+        position = [0] * len(order)
+        for (new_node, node) in enumerate(order):
+            position[node] = new_node
+        self.ambiguity_of_node = [self.ambiguity_of_node[node] for node in order]
+        self.index_of_node = [self.index_of_node[node] for node in order]
+        self.keep_edges = [position[self.keep_edges[node]] if self.keep_edges[node] != NO_EDGE else NO_EDGE
+                           for node in order]
+        self.replace_edges = [position[self.replace_edges[node]] if self.replace_edges[node] != NO_EDGE else NO_EDGE
+                              for node in order]
+
+    @classmethod
+    def from_number(cls,
+                    text_number: str,
+                    interpreter: Optional[NaturalNumbersInterpreter] = None) -> 'InterpretationGraph':
+        """
+        Build the graph of the interpretations of a number
+
+        :param text_number:
+        :param interpreter: If not provided a NaturalNumbersInterpreter without budget is used
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return:
+        """
+        interpreter = interpreter if interpreter else NaturalNumbersInterpreter()
+        possible_interpretations = interpreter.create_possible_interpretations(text_number)
+        ambiguities = interpreter.ambiguities_of_possible_interpretations(possible_interpretations)
+        return cls(text_number, ambiguities, len(possible_interpretations), interpreter.replacements)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_interpretations()
+
+    def __contains__(self, candidate: object) -> bool:
+        return isinstance(candidate, str) and self.contains(candidate)
+
+    @property
+    def nodes_count(self) -> int:
+        """
+        Number of nodes of the graph
+
+        :return:
+        """
+        return len(self.ambiguity_of_node)
+
+    def count(self) -> int:
+        """
+        Count the interpretations, the paths from the root to the final nodes
+
+        :return:
+        """
+        paths = [1] * self.nodes_count
+        for node in reversed(range(self.nodes_count)):
+            if self.keep_edges[node] != NO_EDGE:
+                paths[node] = paths[self.keep_edges[node]]
+                if self.replace_edges[node] != NO_EDGE:
+                    paths[node] += paths[self.replace_edges[node]]
+        return paths[0]
+
+    def iter_interpretations(self) -> Iterator[str]:
+        """
+        Generate the interpretations walking the paths of the graph depth first, in the same order of
+         `NaturalNumbersInterpreter.iter_interpretations`
+
+        :return: Iterator of interpretations
+        """
+        stack = [(0, '')]
+        while stack:
+            (node, interpretation) = stack.pop()
+            index = self.index_of_node[node]
+
+            if self.keep_edges[node] == NO_EDGE:
+                yield interpretation + self.text_number[index:]
+                continue
+
+            if self.replace_edges[node] != NO_EDGE:
+                (start_index, ambiguity, _) = self.ambiguities[self.ambiguity_of_node[node]]
+                stack.append((self.replace_edges[node],
+                              interpretation + self.text_number[index:start_index] + self.replacements[ambiguity]))
+            stack.append((self.keep_edges[node], interpretation))
+
+    def contains(self, candidate: str) -> bool:
+        """
+        Check if a candidate is an interpretation of the number, walking the graph once with its numbers
+
+        While the ambiguities are kept the candidate must match the number, at each ambiguity the number after its
+         first number decides if it is kept or replaced, because the replacement adds or removes a '0' there.
+
+        :param candidate:
+        :return: True if it is an interpretation, False otherwise
+        """
+        text_number = self.text_number
+        node = 0
+        # The candidate from `position` matches the number from the index of the node until `matched_index`
+        position = 0
+        matched_index = 0
+
+        while self.keep_edges[node] != NO_EDGE:
+            index = self.index_of_node[node]
+            (start_index, ambiguity, _) = self.ambiguities[self.ambiguity_of_node[node]]
+
+            # The candidate must match the number until the first number of the ambiguity, both if it is kept or
+            # replaced
+            while matched_index <= start_index:
+                candidate_index = position + matched_index - index
+                if candidate_index >= len(candidate) or candidate[candidate_index] != text_number[matched_index]:
+                    return False
+                matched_index += 1
+
+            replacement = self.replacements[ambiguity]
+            candidate_index = position + start_index + 1 - index
+            if candidate[candidate_index:candidate_index + 1] != replacement[1]:
+                node = self.keep_edges[node]
+                continue
+
+            if self.replace_edges[node] == NO_EDGE or \
+                    candidate[candidate_index:candidate_index + len(replacement) - 1] != replacement[1:]:
+                return False
+            node = self.replace_edges[node]
+            position = candidate_index + len(replacement) - 1
+            matched_index = self.index_of_node[node]
+
+        index = self.index_of_node[node]
+        return len(candidate) - position == len(text_number) - index and \
+            candidate.startswith(text_number[matched_index:], position + matched_index - index)
@@ -0,0 +1,102 @@
+"""
+Module with the scorers used to rank the interpretations of a number, in
+ `NaturalNumbersInterpreter.get_top_k_interpretations`.
+
+The score of an interpretation is the sum of the score of the choice made for each ambiguity of the number, keep it or
+ replace it, plus the score of the complete interpretation. The best interpretations are searched best first, so the
+ scorers must provide an upper bound of the score of the interpretations that start with a prefix.
+
+Example:
+    $ scorer = AmbiguityPriorScorer(validator=GreekPhoneNumberValidator)
+    $ NaturalNumbersInterpreter().get_top_k_interpretations('2106930664', 2, scorer)
+    $ [('2106930664', 0.273...), ('2106093664', -1.347...)]
+
+Classes:
+    InterpretationScorer: Scorer that only ranks the interpretations by their ambiguities
+    AmbiguityPriorScorer: Scorer with a prior probability of each ambiguity and a bonus for the valid phone numbers
+"""
+import math
+from typing import Dict, Optional, Type
+from phone_number_interpreter.phone_number_validator import PhoneValidator
+
+
+class InterpretationScorer:
+    """
+    Base scorer, all the interpretations have the same score. The scores are log-likelihoods, higher is better.
+    """
+
+    def ambiguity_score(self, ambiguity: str, replaced: bool) -> float:
+        """
+        Score of the choice made for an ambiguity of the number
+
+        :param ambiguity: Ambiguity as it is in the number, a key of LANGUAGE_AMBIGUITIES
+        :param replaced: True if the ambiguity is replaced, False if it is kept
+        :return:
+        """
+        return 0.0
+
+    def interpretation_score(self, interpretation: str) -> float:
+        """
+        Score of a complete interpretation, added to the score of its ambiguities
+
+        :param interpretation:
+        :return:
+        """
+        return 0.0
+
+    def interpretation_score_bound(self, prefix: str, min_len: int, max_len: int) -> float:
+        """
+        Upper bound of `interpretation_score` for the interpretations that start with `prefix`, and have a length
+         between `min_len` and `max_len`
+
+        :param prefix: Start of the interpretation
+        :param min_len: Minimum length of the interpretation
+        :param max_len: Maximum length of the interpretation
+        :return:
+        """
+        return 0.0
+
+
+class AmbiguityPriorScorer(InterpretationScorer):
+    """
+    Scorer with the probability that each ambiguity was transcribed right, and a bonus for the interpretations that
+     are valid phone numbers
+
+    Example:
+        $ scorer = AmbiguityPriorScorer({'21': 0.9}, keep_probability=0.75)
+        $ scorer.ambiguity_score('21', replaced=True)
+        $ -2.302...
+
+    Attributes:
+        keep_probabilities: Probability of keeping each ambiguity, the ambiguities not included use `keep_probability`
+        keep_probability: Probability of keeping an ambiguity
+        validator: PhoneValidator of the interpretations that get the bonus, None for no bonus
+        validity_bonus: Score added to the valid phone numbers
+    """
+
+    def __init__(self,
+                 keep_probabilities: Optional[Dict[str, float]] = None,
+                 keep_probability: float = 0.75,
+                 validator: Optional[Type[PhoneValidator]] = None,
+                 validity_bonus: float = 2.0):
+        for probability in [keep_probability, *(keep_probabilities or {}).values()]:
+            if not 0 < probability < 1:
+                raise ValueError('Invalid probability {}, it must be between 0 and 1'.format(probability))
+        self.keep_probabilities = keep_probabilities if keep_probabilities else {}
+        self.keep_probability = keep_probability
+        self.validator = validator
+        self.validity_bonus = validity_bonus
+
+    def ambiguity_score(self, ambiguity: str, replaced: bool) -> float:
+        probability = self.keep_probabilities.get(ambiguity, self.keep_probability)
+        return math.log(1 - probability if replaced else probability)
+
+    def interpretation_score(self, interpretation: str) -> float:
+        if self.validator is not None and self.validator.validate(interpretation):
+            return self.validity_bonus
+        return 0.0
+
+    def interpretation_score_bound(self, prefix: str, min_len: int, max_len: int) -> float:
+        if self.validator is not None and self.validator.could_be_valid(prefix, min_len, max_len):
+            return max(self.validity_bonus, 0.0)
+        return 0.0
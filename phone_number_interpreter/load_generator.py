@@ -0,0 +1,185 @@
+"""
+Module with a load generator for the HTTP service, to measure its throughput and latency from localhost.
+
+Each client keeps a connection open and sends its requests one after the other, the numbers are taken from the
+ families of the benchmarks. If the url is not provided, a service is started in a background thread of the current
+ process on a free port.
+
+Examples:
+    $ python -m phone_number_interpreter loadgen --concurrency 16 --requests 2000
+    $ python -m phone_number_interpreter loadgen --url http://127.0.0.1:8080 --concurrency 64 --valid-only
+
+Attributes:
+    load_generator.run_client(host: str, port: int, path: str, bodies: List[bytes])
+    load_generator.generate_load(host: str, port: int, numbers: List[str], concurrency: int, valid_only: bool)
+    load_generator.parse_arguments(argv: List[str])
+    load_generator.run(argv: Optional[List[str]])
+"""
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from phone_number_interpreter.app import non_negative_int, positive_int
+from phone_number_interpreter.benchmarks import INPUT_FAMILIES, FAMILY_LENGTHS, percentile
+from phone_number_interpreter.server import InterpretationService, ServiceThread
+
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_REQUESTS = 1000
+DEFAULT_LENGTHS = (8, 12)
+
+
+@dataclass
+class LoadResult:
+    """
+    Result of a load generation
+
+    Attributes:
+        requests: Count of sent requests
+        statuses: Count of responses by HTTP status, 0 for the connection errors
+        total_s: Seconds used to send all the requests
+        requests_per_s: Throughput in requests per second
+        p50_ms: Median latency of a request in milliseconds
+        p90_ms: 90th percentile of the latency of a request in milliseconds
+        p99_ms: 99th percentile of the latency of a request in milliseconds
+    """
+    requests: int
+    statuses: Dict[int, int]
+    total_s: float
+    requests_per_s: float
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+
+
+def run_client(host: str, port: int, path: str, bodies: List[bytes]) -> List[Tuple[int, float]]:
+    """
+    Send the requests through a single connection, that is kept open between them
+
+    :param host:
+    :param port:
+    :param path: Path of the endpoint
+    :param bodies: Bodies of the POST requests
+    :return: HTTP status and seconds of each request, the status is 0 if the connection failed
+    """
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    responses = []
+    try:
+        for body in bodies:
+            start_time = time.perf_counter()
+            try:
+                connection.request('POST', path, body, {'Content-Type': 'application/json'})
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                status = 0
+            responses.append((status, time.perf_counter() - start_time))
+    finally:
+        connection.close()
+    return responses
+
+
+def generate_load(host: str,
+                  port: int,
+                  numbers: List[str],
+                  concurrency: int = DEFAULT_CONCURRENCY,
+                  valid_only: bool = False) -> LoadResult:
+    """
+    Send one `/interpret` request per number, from `concurrency` clients at the same time
+
+    :param host:
+    :param port:
+    :param numbers: Numbers to interpret
+    :param concurrency: Number of clients, each one with its own connection
+    :param valid_only: If True only the interpretations that are valid phone numbers are requested
+    :return:
+    """
+    bodies = [json.dumps({'number': number, 'valid_only': valid_only}).encode('utf-8') for number in numbers]
+    responses: List[List[Tuple[int, float]]] = [[] for _ in range(concurrency)]
+
+    def client(index: int) -> None:
+        responses[index] = run_client(host, port, '/interpret', bodies[index::concurrency])
+
+    clients = [threading.Thread(target=client, args=(index,)) for index in range(concurrency)]
+    start_time = time.perf_counter()
+    for client_thread in clients:
+        client_thread.start()
+    for client_thread in clients:
+        client_thread.join()
+    total_s = time.perf_counter() - start_time
+
+    all_responses = [response for client_responses in responses for response in client_responses]
+    latencies = sorted(latency for (_, latency) in all_responses)
+    return LoadResult(requests=len(all_responses),
+                      statuses=dict(Counter(status for (status, _) in all_responses)),
+                      total_s=round(total_s, 6),
+                      requests_per_s=round(len(all_responses) / total_s, 1) if total_s else 0.0,
+                      p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+                      p90_ms=round(percentile(latencies, 0.90) * 1000, 3),
+                      p99_ms=round(percentile(latencies, 0.99) * 1000, 3))
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the load generator
+
+    :param argv: Command line arguments, after `loadgen`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter loadgen',
+                                     description='Send concurrent requests to the HTTP service and report the '
+                                                 'throughput and the latency')
+    parser.add_argument('--url', help='URL of the service, if not provided a service is started in this process')
+    parser.add_argument('--concurrency', type=positive_int, default=DEFAULT_CONCURRENCY,
+                        help='Number of clients sending requests at the same time')
+    parser.add_argument('--requests', type=positive_int, default=DEFAULT_REQUESTS, help='Total number of requests')
+    parser.add_argument('--lengths', type=positive_int, nargs='+', default=list(DEFAULT_LENGTHS),
+                        help='Lengths of the numbers of the families without a fixed length')
+    parser.add_argument('--valid-only', action='store_true',
+                        help='Request only the interpretations that are valid phone numbers')
+    parser.add_argument('--workers', type=non_negative_int, default=1,
+                        help='Number of processes of the service started when --url is not provided')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the load generator
+
+    :param argv: Command line arguments after `loadgen`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+
+    numbers = []
+    for (family, build_numbers) in INPUT_FAMILIES.items():
+        for length in FAMILY_LENGTHS[family] or arguments.lengths:
+            numbers.extend(build_numbers(length, arguments.requests, length))
+    numbers = numbers[::max(1, len(numbers) // arguments.requests)][:arguments.requests]
+
+    service_thread = None
+    if arguments.url:
+        url = urlsplit(arguments.url)
+        (host, port) = (url.hostname or '127.0.0.1', url.port or 80)
+    else:
+        service_thread = ServiceThread(InterpretationService(port=0, workers=arguments.workers))
+        service_thread.start()
+        (host, port) = (service_thread.service.host, service_thread.service.port)
+
+    try:
+        result = generate_load(host, port, numbers, arguments.concurrency, arguments.valid_only)
+    finally:
+        if service_thread is not None:
+            service_thread.stop()
+
+    print('Requests: {}  statuses: {}'.format(result.requests, result.statuses))
+    print('Throughput: {:.1f} requests/s in {:.3f} s'.format(result.requests_per_s, result.total_s))
+    print('Latency: p50 {:.3f} ms  p90 {:.3f} ms  p99 {:.3f} ms'.format(result.p50_ms, result.p90_ms, result.p99_ms))
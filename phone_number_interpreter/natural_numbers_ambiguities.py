@@ -1,46 +1,58 @@
 """
 Dict with all possibles ambiguities when a number is spelled in the english language.
 
-Build up dynamically
+Precomputed from the rules of `DEFAULT_AMBIGUITY_RULES` in the module `ambiguity_tables`, and frozen
 
 LANGUAGE_AMBIGUITIES = {
     '21': '201',
     ..
     '29': '209',
-    '201': '21',
-    ..
-    '209': '29',
     '31': '301',
     ..
-    '39': '309',
-    '301': '31',
-    ..
-    '309': '39',
+    '99': '909',
+    '202': '22',
     ..
-    '91': '901',
+    '209': '29',
+    '302': '32',
     ..
     '909': '99'
 }
 
 Attributes:
-    LANGUAGE_AMBIGUITIES (dict): Dict with all possibles ambiguities of a spelled english number
+    LANGUAGE_AMBIGUITIES (Mapping): Read-only dict with all possibles ambiguities of a spelled english number
+    AMBIGUITY_WINDOW_MATCHES (Mapping): Read-only dict with the length of the ambiguity that starts each window of up
+     to `MAX_AMBIGUITY_LENGTH` digits, 0 if there is not an ambiguity
+    MAX_AMBIGUITY_LENGTH (int): Length of the longest ambiguity
     natural_numbers_ambiguities.build_language_ambiguities_dict()
+    natural_numbers_ambiguities.ambiguity_transducer()
 """
-LANGUAGE_AMBIGUITIES = dict()
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict
+from phone_number_interpreter import ambiguity_tables
+
+
+LANGUAGE_AMBIGUITIES = MappingProxyType(ambiguity_tables.AMBIGUITIES)
+AMBIGUITY_WINDOW_MATCHES = MappingProxyType(ambiguity_tables.WINDOW_MATCHES)
+MAX_AMBIGUITY_LENGTH = ambiguity_tables.MAX_AMBIGUITY_LENGTH
 
 
-def build_language_ambiguities_dict():
+@lru_cache(maxsize=None)
+def ambiguity_transducer():
     """
-    Build the LANGUAGE_AMBIGUITIES dict
+    Compile the rules of `DEFAULT_AMBIGUITY_RULES`, only when the transducer is needed
 
-    :return:
+    :return: AmbiguityTransducer
     """
-    for number in range(2, 10):
-        for number_2 in range(1, 10):
-            str_number = '{}{}'.format(number, number_2)
-            str_ambiguity = '{}0{}'.format(number, number_2)
-            LANGUAGE_AMBIGUITIES[str_number] = str_ambiguity
-            LANGUAGE_AMBIGUITIES[str_ambiguity] = str_number
+    # pylint: disable=import-outside-toplevel
+    from phone_number_interpreter.ambiguity_rules import DEFAULT_AMBIGUITY_RULES, AmbiguityTransducer
+    return AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES)
+
 
+def build_language_ambiguities_dict() -> Dict[str, str]:
+    """
+    Build the LANGUAGE_AMBIGUITIES dict from the rules, the same of the precomputed table
 
-build_language_ambiguities_dict()
+    :return:
+    """
+    return ambiguity_transducer().ambiguities()
@@ -6,69 +6,128 @@ For example, if someone says 'twenty five' this could be transcribed as '25' or
     ‘75’, may be: ‘705’ or ‘75’ Etc..
 
 
+Attributes:
+    natural_numbers_interpreter.indexes_mask(start_index: int, last_index: int)
+
 Classes:
     PossibleInterpretation
+    TooManyInterpretationsError
+    InterpretationSummary
     NaturalNumbersInterpreter
 """
+import time
 from dataclasses import dataclass
-from typing import List, Set, Optional
-from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from heapq import heappop, heappush
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Type
+from phone_number_interpreter.interpretation_scorer import AmbiguityPriorScorer, InterpretationScorer
+from phone_number_interpreter.ambiguity_tables import WINDOW_MATCHES
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES, MAX_AMBIGUITY_LENGTH, \
+    ambiguity_transducer
+from phone_number_interpreter.phone_number_validator import PhoneValidator
+from phone_number_interpreter.stats import InterpretationStats
+if TYPE_CHECKING:
+    from phone_number_interpreter.ambiguity_rules import AmbiguityTransducer
+
+
+DIGITS = frozenset('0123456789')
+
+# Elements of a possible interpretation linked as nested tuples `(last_element, previous_elements)`
+LinkedElements = Optional[Tuple[str, 'LinkedElements']]
+# Possible interpretation being created: `(last index included in an ambiguity, elements)`
+SegmentationState = Tuple[int, LinkedElements]
+# Ambiguity of a number: `(start index, ambiguity, bitmask of the possible interpretations including it)`
+AmbiguityOwners = Tuple[int, str, int]
+
+
+def indexes_mask(start_index: int, last_index: int) -> int:
+    """
+    Bitmask of the indexes between `start_index` and `last_index`, both included
+
+    Example:
+        $ indexes_mask(1, 2)
+        $ 0b110
+
+    :param start_index:
+    :param last_index:
+    :return:
+    """
+    return ((1 << (last_index - start_index + 1)) - 1) << start_index
 
 
-@dataclass
+@dataclass(init=False)
 class PossibleInterpretation:
     """
     Representation of a number, split in elements.
 
     The elements are numbers as string, some of them can be possible ambiguities in english language.
 
-    The indexes of the elements that are ambiguities are going to be stored in a set to detect exclusive ambiguities.
+    The indexes of the elements that are ambiguities are going to be stored in a bitmask to detect exclusive
+    ambiguities, the bit `n` is set if the index `n` is part of an ambiguity.
     To determinate the index we are considering the join of all the elements.
 
+    The elements are stored in a tuple, and the class use `__slots__`, to keep the instances small.
+
     Example:
-        $ self.interpretation_elements=['2', '33', '6']
+        $ self.interpretation_elements=('2', '33', '6')
+        $ self.ambiguity_mask=0b110
         $ self.ambiguity_indexes={1, 2}
     If we join all the elements we get '2336', begin '33' an ambiguity, they are in the indexes {1, 2}
 
     Attributes:
-        interpretation_elements: List of numbers as string, with possible ambiguities
-        ambiguity_indexes: Index of possibles ambiguities (considering join of interpretation_elements)
+        interpretation_elements: Tuple of numbers as string, with possible ambiguities
+        ambiguity_mask: Bitmask of the indexes of possibles ambiguities (considering join of interpretation_elements)
     """
-    interpretation_elements: List[str]
-    ambiguity_indexes = Set[int]
+    __slots__ = ('interpretation_elements', 'ambiguity_mask')
+    interpretation_elements: Tuple[str, ...]
+    ambiguity_mask: int
+
+    def __init__(self,
+                 interpretation_elements: Optional[Sequence[str]] = None,
+                 ambiguity_indexes: Optional[Iterable[int]] = None,
+                 ambiguity_mask: int = 0):
+        self.interpretation_elements = tuple(interpretation_elements) if interpretation_elements else tuple()
+        for index in ambiguity_indexes if ambiguity_indexes else ():
+            ambiguity_mask |= 1 << index
+        self.ambiguity_mask = ambiguity_mask
+
+    @property
+    def ambiguity_indexes(self) -> Set[int]:
+        """
+        Index of possibles ambiguities (considering join of interpretation_elements)
 
-    def __init__(self, interpretation_elements: Optional[List[str]] = None, ambiguity_indexes: Optional[Set] = None):
-        self.interpretation_elements = interpretation_elements if interpretation_elements else list()
-        self.ambiguity_indexes = ambiguity_indexes if ambiguity_indexes else set()
+        :return: Set of indexes
+        """
+        return {index for index in range(self.ambiguity_mask.bit_length()) if self.ambiguity_mask >> index & 1}
 
-    def add_ambiguity_element(self, element: str, indexes_set: Set[int]) -> None:
+    def add_ambiguity_element(self, element: str, indexes: int) -> None:
         """
         Add a new ambiguity element and the indexes involved
 
         :param element:
-        :param indexes_set:
+        :param indexes: Bitmask of the indexes
         :return:
         """
-        self.interpretation_elements.append(element)
-        self.ambiguity_indexes.update(indexes_set)
+        self.interpretation_elements += (element,)
+        self.ambiguity_mask |= indexes
 
     def index_in_ambiguities(self, index: int) -> bool:
         """
-        Check if an index is in the `ambiguity_indexes` set
+        Check if an index is in the ambiguities
 
         :param index:
-        :return: True if is in the set, False otherwise
+        :return: True if it is, False otherwise
         """
-        return index in self.ambiguity_indexes
+        return bool(self.ambiguity_mask >> index & 1)
 
-    def indexes_intersect(self, indexes_set: Set[int]) -> bool:
+    def indexes_intersect(self, indexes: int) -> bool:
         """
-        Check if the indexes set intersect
+        Check if the indexes intersect with the indexes of the ambiguities
 
-        :param indexes_set:
+        :param indexes: Bitmask of the indexes
         :return: True if they intersect, False otherwise
         """
-        return bool(self.ambiguity_indexes.intersection(indexes_set))
+        return bool(self.ambiguity_mask & indexes)
 
     def add_interpretation_element(self, element: str) -> None:
         """
@@ -76,130 +135,274 @@ class PossibleInterpretation:
         :param element:
         :return:
         """
-        self.interpretation_elements.append(element)
+        self.interpretation_elements += (element,)
+
+
+class TooManyInterpretationsError(Exception):
+    """
+    Raised when a number has more possible interpretations than the `max_interpretations` budget of the interpreter
+
+    Attributes:
+        text_number: Number with too many interpretations
+        count: Number of possible interpretations of `text_number`
+        max_interpretations: Maximum number of interpretations allowed
+    """
+
+    def __init__(self, text_number: str, count: int, max_interpretations: int):
+        super().__init__('Number "{}" has {} possible interpretations, the maximum allowed is {}'.format(
+            text_number, count, max_interpretations))
+        self.text_number = text_number
+        self.count = count
+        self.max_interpretations = max_interpretations
+
+
+@dataclass(frozen=True)
+class InterpretationSummary:
+    """
+    Summary of the validation of the interpretations of a number, without the interpretations
+
+    Attributes:
+        count: Number of possible interpretations
+        valid_count: Number of interpretations that are valid phone numbers, None if they were not counted
+        first_valid: First valid interpretation in the order of `iter_interpretations`, None if there is not any
+    """
+    count: int
+    valid_count: Optional[int]
+    first_valid: Optional[str]
+
+    @property
+    def invalid_count(self) -> Optional[int]:
+        """
+        Number of interpretations that are not valid phone numbers, None if the valid ones were not counted
+
+        :return:
+        """
+        return None if self.valid_count is None else self.count - self.valid_count
 
 
 class NaturalNumbersInterpreter:
     """
     Class with the logic to detect the possible ambiguities in a spelled number and generate all the possible
     interpretations of the number
+
+    The number of interpretations generated for a number can be limited with `max_interpretations`, the numbers that
+    exceed it are rejected raising TooManyInterpretationsError, or truncated if `truncate` is True.
+
+    The time of each phase and the counters of the objects created can be collected providing `stats`.
+
+    The ambiguities are the ones of `DEFAULT_AMBIGUITY_RULES`, read from the precomputed tables, or the ones of the
+    AmbiguityTransducer provided as `transducer`, compiled from other rules.
+
+    Attributes:
+        max_interpretations: Maximum number of interpretations to generate for a number, positive or None for no
+            limit
+        truncate: If True generate only `max_interpretations` interpretations for the numbers that exceed it, instead
+            of rejecting them
+        stats: InterpretationStats where the statistics are collected, None to not collect them
+        transducer: AmbiguityTransducer of the rules of the ambiguities, None for the default rules
     """
 
+    def __init__(self,
+                 max_interpretations: Optional[int] = None,
+                 truncate: bool = False,
+                 stats: Optional[InterpretationStats] = None,
+                 transducer: Optional['AmbiguityTransducer'] = None):
+        if max_interpretations is not None and max_interpretations < 1:
+            raise ValueError('Invalid max_interpretations {}, it must be positive'.format(max_interpretations))
+        self.max_interpretations = max_interpretations
+        self.truncate = truncate
+        self.stats = stats
+        self.transducer = transducer
+        self._replacements = None if transducer is None else transducer.ambiguities()
+
+    @property
+    def replacements(self) -> Mapping[str, str]:
+        """
+        Replacement of each ambiguity of the rules of the interpreter
+
+        :return:
+        """
+        return LANGUAGE_AMBIGUITIES if self._replacements is None else self._replacements
+
     @staticmethod
     def generate_interpretations(possible_interpretation: PossibleInterpretation) -> Set[str]:
         """
         Generate all possible interpretations of a PossibleInterpretation, making all possible permutations of the
             possible ambiguities in the interpretation.
 
+        Each permutation is generated only once, see `iter_ambiguity_choices`
+
         :param possible_interpretation:
         :return: Set of possible interpretations
         """
-        _interpretations = [[possible_interpretation.interpretation_elements[0]]]
-        try:
-            _interpretations.append([LANGUAGE_AMBIGUITIES[possible_interpretation.interpretation_elements[0]]])
-        except KeyError:
-            pass
-
-        # Todo: time performance, creating strings instead of lists of elements and joining at the end
-        for element in possible_interpretation.interpretation_elements[1:]:
-            # Using range and len, because the list is being extended in the loop dynamically
-            for interpretation_n in range(len(_interpretations)):  # pylint: disable=consider-using-enumerate
-                # If the interpretation element have an ambiguity we create all possible interpretations with the
-                # ambiguity and without it
-                try:
-                    ambiguity = LANGUAGE_AMBIGUITIES[element]
-                    new_interpretation = _interpretations[interpretation_n].copy()
-                    new_interpretation.append(ambiguity)
-                    _interpretations.append(new_interpretation)
-                # Element is not an ambiguity
-                except KeyError:
-                    pass
-                _interpretations[interpretation_n].append(element)
-
-        # Return the interpretations as a set of strings
-        interpretations = [''.join(interpretation) for interpretation in _interpretations]
-        return set(interpretations)
-
-    def process_possible_interpretations(self, possible_interpretations: List[PossibleInterpretation]) -> Set[str]:
+        return NaturalNumbersInterpreter.process_possible_interpretations([possible_interpretation])
+
+    @staticmethod
+    def process_possible_interpretations(possible_interpretations: List[PossibleInterpretation]) -> Set[str]:
         """
         Create all possible interpretations of a number from a List of PossibleInterpretation, we will have more than
             one `possible_interpretations` if they are exclusive ambiguities in the number
 
+        The interpretations shared by more than one PossibleInterpretation are generated only once, instead of
+            generating the interpretations of each PossibleInterpretation and removing the duplicates.
+
         :param possible_interpretations:
         :return: Set of possible interpretations
         """
-        interpretations = set()
-        for possible_interpretation in possible_interpretations:
-            interpretations.update(self.generate_interpretations(possible_interpretation))
-        return interpretations
+        text_number = ''.join(possible_interpretations[0].interpretation_elements)
+        ambiguities = NaturalNumbersInterpreter.ambiguities_of_possible_interpretations(possible_interpretations)
+        return set(NaturalNumbersInterpreter.iter_ambiguity_choices(text_number,
+                                                                    ambiguities,
+                                                                    len(possible_interpretations)))
 
     @staticmethod
-    def add_number_to_interpretations(number: str, index: int, possible_interpretations: List[PossibleInterpretation]):
+    def ambiguity_last_index(text_number: str,
+                             index: int,
+                             transducer: Optional['AmbiguityTransducer'] = None) -> Optional[int]:
         """
-        Add a simple number to the interpretations elements, when the number is not part of an ambiguity
+        Check if a possible ambiguity starts in the `index` of the number
 
-        We validate if the number has been included in a previous ambiguity
+        Without `transducer` the possible ambiguities are the matches of the rules of `DEFAULT_AMBIGUITY_RULES`, they
+            start with [2-9] and continue with [1-9] or with 0 + [2-9]. The match of each window of digits is
+            precomputed, the windows with non numeric characters are matched with the transducer of the rules
 
-        :param number:
+        :param text_number:
         :param index:
-        :param possible_interpretations:
-        :return:
+        :param transducer: AmbiguityTransducer of other rules, None for the default rules
+        :return: Last index of the ambiguity, None if there is not an ambiguity starting in `index`
         """
-        for possible_interpretation in possible_interpretations:
-            # Add the number to the interpretation elements if it is NOT already included in an ambiguity
-            if not possible_interpretation.index_in_ambiguities(index):
-                possible_interpretation.add_interpretation_element(number)
+        if transducer is not None:
+            return transducer.match(text_number, index)
+        # The precomputed table is read directly, AMBIGUITY_WINDOW_MATCHES is a read-only view of it
+        matched_length = WINDOW_MATCHES.get(text_number[index:index + MAX_AMBIGUITY_LENGTH])
+        if matched_length is None:
+            return ambiguity_transducer().walk(text_number, index)
+        return index + matched_length - 1 if matched_length else None
 
-    def add_ambiguity_to_possible_interpretations(self,
-                                                  text_number: str,
-                                                  possible_interpretations: List[PossibleInterpretation],
-                                                  start_index: int,
-                                                  last_index: int) -> None:
+    @staticmethod
+    def add_number_to_states(number: str, index: int, states: List[SegmentationState]) -> List[SegmentationState]:
         """
-        This method update `possible_interpretations` in place!
+        Add a simple number to the elements of the states, when the number is not part of an ambiguity
 
-        Add a possible ambiguity to the lists of possible interpretations elements, to detect exclusive
-            ambiguities we store the indexes involved in the ambiguities
+        The number is only added to the states that do NOT include it in a previous ambiguity
 
-        The `possible_interpretations` is a list of PossibleInterpretation, where we track the elements of the possible
-            interpretations and the indexes of the considered ambiguities
+        :param number:
+        :param index:
+        :param states:
+        :return: New list of states
+        """
+        return [(covered_index, (number, elements)) if covered_index < index else (covered_index, elements)
+                for (covered_index, elements) in states]
 
-        Example of `possible_interpretations`:
-        For `text_number='2336'`
-        possible_interpretations = [
-            PossibleInterpretation(interpretation_elements=['23', '36'], ambiguity_indexes={0, 1, 2, 3}),
-            PossibleInterpretation(interpretation_elements=['2', '33', '6'], ambiguity_indexes={1, 2})
-        ]
-        We have 2 possible interpretations because there are exclusive ambiguities (indexes of ambiguities intersect)
+    @staticmethod
+    def add_ambiguity_to_states(possible_ambiguity: str,
+                                start_index: int,
+                                last_index: int,
+                                states: List[SegmentationState]) -> Tuple[List[SegmentationState], bool]:
+        """
+        Add a possible ambiguity to the states, to detect exclusive ambiguities we check the last index included in
+            the ambiguities of each state
 
-        :param text_number:
-        :param possible_interpretations:
+        :param possible_ambiguity:
         :param start_index: first element of ambiguity
         :param last_index: last element of ambiguity
-        :return:
+        :param states:
+        :return: New list of states, and True if the ambiguity is exclusive with all the states, False otherwise
         """
-        possible_ambiguity = text_number[start_index:last_index + 1]
-        ambiguity_indexes = set(range(start_index, last_index + 1))
         exclusive_ambiguity = True
+        new_states = []
 
-        for _possible_interpretation in possible_interpretations:
-            # If the ambiguity is not exclusive with an existing ambiguity of the possible interpretation
-            if not _possible_interpretation.indexes_intersect(ambiguity_indexes):
-                _possible_interpretation.add_ambiguity_element(possible_ambiguity, ambiguity_indexes)
+        for (covered_index, elements) in states:
+            # If the ambiguity is not exclusive with an existing ambiguity of the state
+            if covered_index < start_index:
+                new_states.append((last_index, (possible_ambiguity, elements)))
                 exclusive_ambiguity = False
-
-        # If the ambiguity is exclusive with all the previous possible interpretations,
-        # we create a new possible interpretation to include this ambiguity
+            else:
+                new_states.append((covered_index, elements))
+
+        return new_states, exclusive_ambiguity
+
+    @classmethod
+    def add_index_to_states(cls,
+                            text_number: str,
+                            index: int,
+                            states: List[SegmentationState],
+                            previous_states: List[SegmentationState],
+                            second_previous_states: List[SegmentationState],
+                            offset: int = 0,
+                            transducer: Optional['AmbiguityTransducer'] = None) -> Tuple[List[SegmentationState], bool]:
+        """
+        Add the number of an index to the states, as a simple number or as the start of a possible ambiguity
+
+        When the ambiguity is exclusive with all the states, new states are created from the states of
+         `text_number[:index]`, that are built from the states of the two previous indexes.
+
+        The number can be a window of the full number that starts in `offset`, it must include from two indexes
+         before `index` to two indexes after it, or to the end of the full number.
+
+        :param text_number: Number, or window of the number
+        :param index: Index of the full number to add
+        :param states: States before `index`
+        :param previous_states: States before `index - 1`
+        :param second_previous_states: States before `index - 2`
+        :param offset: Index of the full number where `text_number` starts
+        :param transducer: AmbiguityTransducer of the rules of the ambiguities, None for the default rules
+        :return: New list of states, and True if the states of `text_number[:index]` were rebuilt, False otherwise
+        """
+        position = index - offset
+        ambiguity_last_position = cls.ambiguity_last_index(text_number, position, transducer)
+
+        if ambiguity_last_position is None:
+            return cls.add_number_to_states(text_number[position], index, states), False
+
+        possible_ambiguity = text_number[position:ambiguity_last_position + 1]
+        ambiguity_last_index = ambiguity_last_position + offset
+        new_states, exclusive_ambiguity = cls.add_ambiguity_to_states(possible_ambiguity,
+                                                                      index,
+                                                                      ambiguity_last_index,
+                                                                      states)
+
+        # If the ambiguity is exclusive with all the states, we create new states to include this ambiguity
+        # from the states of `text_number[:index]`, that will not include the ambiguities that conflict with
+        # the current ambiguity
         if exclusive_ambiguity:
-            # Todo: enhance performance build previous_possible_interpretations from possible_interpretations?
-            # previous_possible_interpretations will not include the exclusive ambiguity that conflict with the new
-            # current ambiguity, because the `last_index` to create possible interpretations is set to
-            # not include the elements of the current new ambiguity.
-            previous_possible_interpretations = self.create_possible_interpretations(text_number[:start_index],
-                                                                                     last_index=start_index)
-            for _previous_possible_interpretation in previous_possible_interpretations:
-                _previous_possible_interpretation.add_ambiguity_element(possible_ambiguity, ambiguity_indexes)
-                possible_interpretations.append(_previous_possible_interpretation)
+            # `text_number[:index]` can't include an ambiguity that starts two indexes before and ends in
+            # `index`, in that case the number two indexes before is added as a simple number
+            if index > 1 and cls.ambiguity_last_index(text_number, position - 2, transducer) == position:
+                prefix_states = cls.add_number_to_states(text_number[position - 2], index - 2,
+                                                         second_previous_states)
+            else:
+                prefix_states = previous_states
+            prefix_states = cls.add_number_to_states(text_number[position - 1], index - 1, prefix_states)
+
+            new_states.extend((ambiguity_last_index, (possible_ambiguity, elements))
+                              for (_, elements) in prefix_states)
+
+        return new_states, exclusive_ambiguity
+
+    @staticmethod
+    def build_possible_interpretation(elements: LinkedElements) -> PossibleInterpretation:
+        """
+        Build a PossibleInterpretation from the linked elements of a state
+
+        :param elements: Elements linked as nested tuples `(last_element, previous_elements)`
+        :return:
+        """
+        interpretation_elements = []
+        while elements is not None:
+            (element, elements) = elements
+            interpretation_elements.append(element)
+        interpretation_elements.reverse()
+
+        # The elements with more than one number are the ambiguities
+        ambiguity_mask = 0
+        index = 0
+        for element in interpretation_elements:
+            if len(element) > 1:
+                ambiguity_mask |= indexes_mask(index, index + len(element) - 1)
+            index += len(element)
+
+        return PossibleInterpretation(interpretation_elements, ambiguity_mask=ambiguity_mask)
 
     def create_possible_interpretations(self,
                                         text_number: str,
@@ -232,60 +435,434 @@ class NaturalNumbersInterpreter:
                 PossibleInterpretation(interpretation_elements=['2', '33', '6'], ambiguity_indexes={1, 2})
             ]
 
+        The number is processed once from left to right, tracking the possible interpretations as states
+         `(covered_index, elements)`, where `covered_index` is the last index included in an ambiguity and `elements`
+         are linked as nested tuples, so the states are shared between the steps instead of copied.
+
+        When an ambiguity is exclusive with all the states, we need the possible interpretations of the number before
+         the ambiguity, they are built from the states of the two previous indexes instead of processing the number
+         again.
+
         :param text_number:
         :param last_index: Last index of the text_number to process, if not provided all the number is processed
 
         :raises ValueError: if `text_number` contains non numeric characters
         :return: List of PossibleInterpretations
         """
-        # Init values
-        last_index = last_index if last_index else len(text_number)
-        possible_interpretations = [PossibleInterpretation()]
-        index = 0
-        number = text_number[0]
+        start_time = time.perf_counter()
+        text_number = text_number[:last_index] if last_index else text_number
+        if not text_number or not DIGITS.issuperset(text_number):
+            raise ValueError('Invalid number "{}", it must contain only numbers'.format(text_number))
+
+        # States before the current index and before the two previous indexes
+        states = [(-1, None)]
+        previous_states = second_previous_states = states
+        prefix_rebuilds = 0
+
+        for index in range(len(text_number)):
+            new_states, prefix_rebuilt = self.add_index_to_states(text_number, index, states, previous_states,
+                                                                  second_previous_states, transducer=self.transducer)
+            prefix_rebuilds += prefix_rebuilt
+
+            second_previous_states = previous_states
+            previous_states = states
+            states = new_states
+
+        possible_interpretations = [self.build_possible_interpretation(elements) for (_, elements) in states]
+
+        if self.stats is not None:
+            self.stats.add_time('segmentation', time.perf_counter() - start_time)
+            self.stats.add('possible_interpretations', len(possible_interpretations))
+            self.stats.add('prefix_rebuilds', prefix_rebuilds)
+        return possible_interpretations
 
-        try:
-            for (index, number) in enumerate(text_number[:last_index]):
+    @staticmethod
+    def ambiguities_of_possible_interpretations(possible_interpretations: List[PossibleInterpretation]) \
+            -> List[AmbiguityOwners]:
+        """
+        Get the ambiguities of a List of PossibleInterpretation sorted by start index, with a bitmask of the possible
+            interpretations that include each ambiguity, the bit `n` is the possible interpretation `n` of the list
 
-                # Possible ambiguities start with [2-9]
-                if 1 < int(number) < 10:
+        Example:
+            $ possible_interpretations = [
+                PossibleInterpretation(interpretation_elements=['23', '36'], ambiguity_indexes={0, 1, 2, 3}),
+                PossibleInterpretation(interpretation_elements=['2', '33', '6'], ambiguity_indexes={1, 2})
+            ]
+            $ returns [(0, '23', 0b01), (1, '33', 0b10), (2, '36', 0b01)]
 
-                    # And continue with [1-9]
-                    if 0 < int(text_number[index + 1]) < 10:
-                        self.add_ambiguity_to_possible_interpretations(text_number,
-                                                                       possible_interpretations,
-                                                                       start_index=index,
-                                                                       last_index=index + 1)
-                        continue
+        :param possible_interpretations:
+        :return: List of `(start index, ambiguity, bitmask of possible interpretations)`
+        """
+        ambiguities = dict()
+        for (interpretation_n, possible_interpretation) in enumerate(possible_interpretations):
+            index = 0
+            for element in possible_interpretation.interpretation_elements:
+                # The numbers are single digits, the ambiguities have two or more
+                if len(element) > 1:
+                    (_, owners) = ambiguities.get(index, (element, 0))
+                    ambiguities[index] = (element, owners | 1 << interpretation_n)
+                index += len(element)
+
+        return [(index, element, owners) for (index, (element, owners)) in sorted(ambiguities.items())]
+
+    @staticmethod
+    def ambiguities_length_changes(ambiguities: List[AmbiguityOwners]) -> Tuple[List[int], List[int]]:
+        """
+        Count, from each ambiguity to the end, the ambiguities that add or remove a number when they are replaced, to
+            know the lengths that the interpretations can have before the choices are made
+
+        :param ambiguities: Ambiguities of the number, as returned by `ambiguities_of_possible_interpretations`
+        :return: Lists `(added_after, removed_after)` indexed by ambiguity, with a last item 0 for the end
+        """
+        ambiguities_count = len(ambiguities)
+        added_after = [0] * (ambiguities_count + 1)
+        removed_after = [0] * (ambiguities_count + 1)
+        for ambiguity_n in reversed(range(ambiguities_count)):
+            is_added = len(ambiguities[ambiguity_n][1]) == 2
+            added_after[ambiguity_n] = added_after[ambiguity_n + 1] + is_added
+            removed_after[ambiguity_n] = removed_after[ambiguity_n + 1] + (not is_added)
+        return added_after, removed_after
 
-                    # Or continue with 0 + [1-9]
-                    if text_number[index + 1] == '0' and 1 < int(text_number[index + 2]) < 10:
-                        self.add_ambiguity_to_possible_interpretations(text_number,
-                                                                       possible_interpretations,
-                                                                       start_index=index,
-                                                                       last_index=index + 2)
-                        continue
+    @staticmethod
+    def iter_ambiguity_choices(text_number: str,
+                               ambiguities: List[AmbiguityOwners],
+                               possible_interpretations_count: int,
+                               validator: Optional[Type[PhoneValidator]] = None,
+                               replacements: Mapping[str, str] = LANGUAGE_AMBIGUITIES) -> Iterator[str]:
+        """
+        Generate the interpretations of a number from its ambiguities, each interpretation is generated only once.
 
-                # If not ambiguity is found, the number is added to the interpretations
-                self.add_number_to_interpretations(number, index, possible_interpretations)
+        Each interpretation is a choice of ambiguities to replace, that are included together in at least one
+            PossibleInterpretation. The choices are explored depth first, ambiguity by ambiguity, tracking the bitmask
+            of the possible interpretations that include all the replaced ambiguities, so the memory used depends on
+            the length of the number and not on the number of interpretations.
 
-        except IndexError:
-            # When we go out of index we must add the last element to the interpretations
-            self.add_number_to_interpretations(number, index, possible_interpretations)
+        Different choices generate different interpretations, the replacement of an ambiguity adds or removes a '0'
+            after its first number, that is followed by a number in [1-9] when it is not replaced.
 
-            # If the next index is inside the len of the number we must also add it to the interpretations
-            if index + 1 < len(text_number):
-                self.add_number_to_interpretations(text_number[index + 1], index + 1, possible_interpretations)
+        The first interpretation generated is the number without replacements.
 
-        return possible_interpretations
+        If a `validator` is provided only the valid phone numbers are generated, the choices are discarded as soon as
+            the start of the interpretation, or the lengths it can have, can't be a valid phone number.
+
+        :param text_number:
+        :param ambiguities: Ambiguities of the number, as returned by `ambiguities_of_possible_interpretations`
+        :param possible_interpretations_count: Number of PossibleInterpretation of the number
+        :param validator: PhoneValidator used to generate only valid phone numbers
+        :param replacements: Replacement of each ambiguity
+        :return: Iterator of possible interpretations
+        """
+        ambiguities_count = len(ambiguities)
+        (added_after, removed_after) = NaturalNumbersInterpreter.ambiguities_length_changes(ambiguities)
+
+        # Stack of (next ambiguity, next index of the number, bitmask of possible interpretations, interpretation)
+        stack = [(0, 0, (1 << possible_interpretations_count) - 1, '')]
+        while stack:
+            (ambiguity_n, index, owners, interpretation) = stack.pop()
+
+            # Skip the ambiguities that intersect a replaced ambiguity
+            while ambiguity_n < ambiguities_count and ambiguities[ambiguity_n][0] < index:
+                ambiguity_n += 1
+
+            if validator is not None:
+                # The number until the first number of the next ambiguity is the same for all the choices left
+                known_index = ambiguities[ambiguity_n][0] + 1 if ambiguity_n < ambiguities_count else len(text_number)
+                length = len(interpretation) + len(text_number) - index
+                if not validator.could_be_valid(interpretation + text_number[index:known_index],
+                                                length - removed_after[ambiguity_n],
+                                                length + added_after[ambiguity_n]):
+                    continue
+
+            if ambiguity_n == ambiguities_count:
+                interpretation += text_number[index:]
+                if validator is None or validator.validate(interpretation):
+                    yield interpretation
+                continue
+
+            (start_index, ambiguity, ambiguity_owners) = ambiguities[ambiguity_n]
+
+            # Replace the ambiguity, if it is included in a possible interpretation together with the previous
+            # replaced ambiguities
+            if owners & ambiguity_owners:
+                stack.append((ambiguity_n + 1,
+                              start_index + len(ambiguity),
+                              owners & ambiguity_owners,
+                              interpretation + text_number[index:start_index] + replacements[ambiguity]))
+
+            # Keep the ambiguity as it is
+            stack.append((ambiguity_n + 1, index, owners, interpretation))
+
+    @staticmethod
+    def count_ambiguity_choices(ambiguities: List[AmbiguityOwners], possible_interpretations_count: int) -> int:
+        """
+        Count the interpretations generated by `iter_ambiguity_choices` without generating them.
+
+        The choices are counted ambiguity by ambiguity, grouping the partial choices by the bitmask of the possible
+            interpretations that include all their replaced ambiguities, because the choices left only depend on it.
+
+        Ambiguities that intersect a replaced ambiguity are not included in the same possible interpretation, so
+            there is no need to skip them.
+
+        :param ambiguities: Ambiguities of the number, as returned by `ambiguities_of_possible_interpretations`
+        :param possible_interpretations_count: Number of PossibleInterpretation of the number
+        :return: Number of interpretations
+        """
+        choices = {(1 << possible_interpretations_count) - 1: 1}
+        for (_, _, ambiguity_owners) in ambiguities:
+            new_choices = dict(choices)
+            for (owners, count) in choices.items():
+                if owners & ambiguity_owners:
+                    new_choices[owners & ambiguity_owners] = new_choices.get(owners & ambiguity_owners, 0) + count
+            choices = new_choices
+        return sum(choices.values())
+
+    def interpretations_to_generate(self,
+                                    text_number: str,
+                                    ambiguities: List[AmbiguityOwners],
+                                    possible_interpretations_count: int) -> Optional[int]:
+        """
+        Apply the `max_interpretations` budget to a number, before generating its interpretations
+
+        :param text_number:
+        :param ambiguities: Ambiguities of the number, as returned by `ambiguities_of_possible_interpretations`
+        :param possible_interpretations_count: Number of PossibleInterpretation of the number
+        :raises TooManyInterpretationsError: if the number exceed the budget and `truncate` is False
+        :return: Number of interpretations to generate, None to generate all of them
+        """
+        if self.max_interpretations is None:
+            return None
+
+        count = self.count_ambiguity_choices(ambiguities, possible_interpretations_count)
+        if count <= self.max_interpretations:
+            return None
+
+        if not self.truncate:
+            raise TooManyInterpretationsError(text_number, count, self.max_interpretations)
+        return self.max_interpretations
+
+    def record_generation(self,
+                          possible_interpretations: List[PossibleInterpretation],
+                          interpretations: Iterator[str]) -> Iterator[str]:
+        """
+        Collect the statistics of the generation of the interpretations of a number, if `stats` is provided
+
+        :param possible_interpretations: PossibleInterpretation of the number
+        :param interpretations: Iterator of the interpretations of the number
+        :return: Iterator of the interpretations, that collect the time used to generate each one
+        """
+        if self.stats is None:
+            return interpretations
+
+        self.stats.add('numbers')
+        # Each PossibleInterpretation generates all the permutations of its ambiguities
+        self.stats.add('raw_interpretations', sum(
+            1 << sum(1 for element in possible_interpretation.interpretation_elements if len(element) > 1)
+            for possible_interpretation in possible_interpretations))
+        return self.stats.timed_iter('generation', interpretations, counter='interpretations')
 
     def get_all_possible_interpretations_of_number(self, text_number: str) -> Set[str]:
         """
         Create all the possible interpretations of a number and return them in a Set of strings
 
+        If the number exceed the `max_interpretations` budget and `truncate` is True, only `max_interpretations`
+            interpretations are returned
+
         :param text_number:
         :raises ValueError: if `text_number` contains non numeric characters
+        :raises TooManyInterpretationsError: if the number exceed the budget and `truncate` is False
         :return:
         """
+        return set(self.iter_interpretations(text_number))
+
+    def iter_interpretations(self, text_number: str) -> Iterator[str]:
+        """
+        Generate the possible interpretations of a number one by one, each interpretation is generated only once,
+            as soon as it is created.
+
+        The first interpretation generated is the number without replacements.
+
+        If the number exceed the `max_interpretations` budget and `truncate` is True, only the first
+            `max_interpretations` interpretations are generated
+
+        :param text_number:
+        :raises ValueError: if `text_number` contains non numeric characters
+        :raises TooManyInterpretationsError: if the number exceed the budget and `truncate` is False
+        :return: Iterator of possible interpretations
+        """
+        possible_interpretations = self.create_possible_interpretations(text_number)
+        ambiguities = self.ambiguities_of_possible_interpretations(possible_interpretations)
+        interpretations_to_generate = self.interpretations_to_generate(text_number,
+                                                                       ambiguities,
+                                                                       len(possible_interpretations))
+
+        interpretations = self.iter_ambiguity_choices(text_number, ambiguities, len(possible_interpretations),
+                                                      replacements=self.replacements)
+        interpretations = islice(interpretations, interpretations_to_generate)
+        yield from self.record_generation(possible_interpretations, interpretations)
+
+    def count_interpretations(self, text_number: str) -> int:
+        """
+        Count the unique possible interpretations of a number without creating them, the `max_interpretations`
+            budget is not applied
+
+        :param text_number:
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return: Number of possible interpretations
+        """
+        possible_interpretations = self.create_possible_interpretations(text_number)
+        ambiguities = self.ambiguities_of_possible_interpretations(possible_interpretations)
+        return self.count_ambiguity_choices(ambiguities, len(possible_interpretations))
+
+    def get_valid_phone_interpretations(self, text_number: str, validator: Type[PhoneValidator]) -> Set[str]:
+        """
+        Create only the possible interpretations of a number that are valid phone numbers, the interpretations that
+            can't be valid are discarded while they are created, using the valid lengths and starts of the validator.
+
+        The `max_interpretations` budget is not applied.
+
+        :param text_number:
+        :param validator: PhoneValidator
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return: Set of possible interpretations that are valid phone numbers
+        """
+        return set(self.iter_valid_phone_interpretations(text_number, validator))
+
+    def iter_valid_phone_interpretations(self, text_number: str, validator: Type[PhoneValidator]) -> Iterator[str]:
+        """
+        Generate the possible interpretations of a number that are valid phone numbers, like
+            `get_valid_phone_interpretations`, in the same order of `iter_interpretations`
+
+        :param text_number:
+        :param validator: PhoneValidator
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return: Iterator of possible interpretations that are valid phone numbers
+        """
+        possible_interpretations = self.create_possible_interpretations(text_number)
+        ambiguities = self.ambiguities_of_possible_interpretations(possible_interpretations)
+        if self.stats is not None:
+            validator = self.stats.counting_validator(validator)
+
+        interpretations = self.iter_ambiguity_choices(text_number, ambiguities, len(possible_interpretations),
+                                                      validator, self.replacements)
+        return self.record_generation(possible_interpretations, interpretations)
+
+    def summarize_interpretations(self,
+                                  text_number: str,
+                                  validator: Type[PhoneValidator],
+                                  count_valid: bool = True) -> InterpretationSummary:
+        """
+        Count the possible interpretations of a number that are valid and invalid phone numbers, and find the first
+            valid one, without creating the invalid interpretations or storing any of them.
+
+        The interpretations are counted with `count_interpretations`, and only the valid ones are generated, like
+            `get_valid_phone_interpretations`. If `count_valid` is False the generation stops at the first valid
+            interpretation, to know if the number has any valid interpretation.
+
+        The `max_interpretations` budget is not applied.
+
+        :param text_number:
+        :param validator: PhoneValidator
+        :param count_valid: If False the valid interpretations are not counted
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return: InterpretationSummary of the number
+        """
+        possible_interpretations = self.create_possible_interpretations(text_number)
+        ambiguities = self.ambiguities_of_possible_interpretations(possible_interpretations)
+        if self.stats is not None:
+            validator = self.stats.counting_validator(validator)
+
+        valid_interpretations = self.record_generation(possible_interpretations, self.iter_ambiguity_choices(
+            text_number, ambiguities, len(possible_interpretations), validator, self.replacements))
+        first_valid = next(valid_interpretations, None)
+        valid_count = None
+        if count_valid:
+            valid_count = sum(1 for _ in valid_interpretations) + (first_valid is not None)
+        return InterpretationSummary(self.count_ambiguity_choices(ambiguities, len(possible_interpretations)),
+                                     valid_count, first_valid)
+
+    def get_top_k_interpretations(self,
+                                  text_number: str,
+                                  k: int,
+                                  scorer: Optional[InterpretationScorer] = None) -> List[Tuple[str, float]]:
+        """
+        Get the `k` interpretations of a number with the best score, without generating all the interpretations.
+
+        The choices of ambiguities are explored best first with a heap, like `iter_ambiguity_choices`, ordered by an
+            upper bound of the score of the interpretations they can reach: the score of the choices made, the best
+            score of the choices of the ambiguities left and the bound of `scorer.interpretation_score_bound`. A
+            complete interpretation is returned when it is the best item of the heap, so the search stops after the
+            first `k` and the choices that can't reach them are never expanded.
+
+        The `max_interpretations` budget is not applied.
+
+        :param text_number:
+        :param k: Number of interpretations to return
+        :param scorer: InterpretationScorer, if not provided an AmbiguityPriorScorer without validator is used
+        :raises ValueError: if `text_number` contains non numeric characters
+        :return: List of `(interpretation, score)` sorted by score, the best first
+        """
+        scorer = scorer if scorer else AmbiguityPriorScorer()
         possible_interpretations = self.create_possible_interpretations(text_number)
-        return self.process_possible_interpretations(possible_interpretations)
+        ambiguities = self.ambiguities_of_possible_interpretations(possible_interpretations)
+        ambiguities_count = len(ambiguities)
+        (added_after, removed_after) = self.ambiguities_length_changes(ambiguities)
+
+        # Best score of the choices of the ambiguities from each ambiguity to the end. Replacing an ambiguity skips the
+        # ambiguities that intersect it, so each ambiguity continues with the next one if it is kept, or with the first
+        # one after it if it is replaced
+        best_after = [0.0] * (ambiguities_count + 1)
+        next_after_replace = ambiguities_count
+        for ambiguity_n in reversed(range(ambiguities_count)):
+            (start_index, ambiguity, _) = ambiguities[ambiguity_n]
+            while next_after_replace > ambiguity_n + 1 and \
+                    ambiguities[next_after_replace - 1][0] >= start_index + len(ambiguity):
+                next_after_replace -= 1
+            best_after[ambiguity_n] = max(
+                scorer.ambiguity_score(ambiguity, False) + best_after[ambiguity_n + 1],
+                scorer.ambiguity_score(ambiguity, True) + best_after[next_after_replace])
+
+        # Heap of (-bound, order, next ambiguity, next index of the number, bitmask of possible interpretations,
+        # interpretation, score), the next ambiguity is None for the complete interpretations
+        heap: List[tuple] = []
+        pushed = 0
+
+        def push(ambiguity_n: int, index: int, owners: int, interpretation: str, score: float) -> None:
+            nonlocal pushed
+            pushed += 1
+            # Skip the ambiguities that intersect a replaced ambiguity
+            while ambiguity_n < ambiguities_count and ambiguities[ambiguity_n][0] < index:
+                ambiguity_n += 1
+
+            if ambiguity_n == ambiguities_count:
+                interpretation += text_number[index:]
+                score += scorer.interpretation_score(interpretation)
+                heappush(heap, (-score, pushed, None, index, owners, interpretation, score))
+                return
+
+            # The number until the first number of the next ambiguity is the same for all the choices left
+            known_index = ambiguities[ambiguity_n][0] + 1
+            length = len(interpretation) + len(text_number) - index
+            bound = score + best_after[ambiguity_n] + scorer.interpretation_score_bound(
+                interpretation + text_number[index:known_index],
+                length - removed_after[ambiguity_n],
+                length + added_after[ambiguity_n])
+            heappush(heap, (-bound, pushed, ambiguity_n, index, owners, interpretation, score))
+
+        push(0, 0, (1 << len(possible_interpretations)) - 1, '', 0.0)
+        top_interpretations: List[Tuple[str, float]] = []
+        while heap and len(top_interpretations) < k:
+            (_, _, ambiguity_n, index, owners, interpretation, score) = heappop(heap)
+            if ambiguity_n is None:
+                top_interpretations.append((interpretation, score))
+                continue
+
+            (start_index, ambiguity, ambiguity_owners) = ambiguities[ambiguity_n]
+            push(ambiguity_n + 1, index, owners, interpretation, score + scorer.ambiguity_score(ambiguity, False))
+            if owners & ambiguity_owners:
+                push(ambiguity_n + 1,
+                     start_index + len(ambiguity),
+                     owners & ambiguity_owners,
+                     interpretation + text_number[index:start_index] + self.replacements[ambiguity],
+                     score + scorer.ambiguity_score(ambiguity, True))
+
+        return top_interpretations
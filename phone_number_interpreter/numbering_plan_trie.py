@@ -0,0 +1,138 @@
+"""
+Module with a prefix trie of the rules of many numbering plans, to validate a number against all of them at once.
+
+The valid starts of all the plans are merged in a single trie of digits. Each node stores, by length of the number,
+ the plans that accept the numbers that start with the prefix of the node. A number is validated walking the trie
+ once with its digits, so the cost depends on the length of the number and not on the number of plans.
+
+Only the rules declared as data are compiled, `VALID_PHONES_LEN` and `VALID_PHONES_START`, the code of the `validate`
+ method of the validators is not used.
+
+Example:
+    $ trie = NumberingPlanTrie.compile()
+    $ trie.matching_plans('6970241352')
+    $ ['GR']
+
+Classes:
+    NumberingPlanTrie: Trie compiled from the rules of many PhoneValidator
+"""
+from typing import Dict, Iterable, List, Optional, Type
+from phone_number_interpreter.phone_number_validator import PHONE_VALIDATORS, PhoneValidator
+
+
+class NumberingPlanTrie:
+    """
+    Trie compiled from the valid lengths and starts of many PhoneValidator
+
+    The nodes are stored in lists indexed by node, the root is the node 0. The plans are identified by their index in
+     `plans`, and the sets of plans are bitmasks of their indexes.
+
+    Attributes:
+        plans: Names of the compiled plans
+        children: Child of each node by digit
+        accepted: Plans that accept the numbers that start with the prefix of each node, by length of the number
+        prefixes: Prefix of each node
+    """
+
+    def __init__(self, validators: Dict[str, Type[PhoneValidator]]):
+        self.plans: List[str] = list(validators)
+        self.children: List[Dict[str, int]] = [{}]
+        self.accepted: List[Dict[int, int]] = [{}]
+        self.prefixes: List[str] = ['']
+
+        for (plan_index, validator) in enumerate(validators.values()):
+            if validator.VALID_PHONES_LEN is None:
+                raise ValueError('The validator {} must declare VALID_PHONES_LEN'.format(validator.__name__))
+            for valid_len in validator.VALID_PHONES_LEN:
+                if validator.VALID_PHONES_START is None:
+                    valid_starts = ['']
+                else:
+                    valid_starts = validator.VALID_PHONES_START[valid_len]
+                for valid_start in valid_starts:
+                    node = self.add_prefix(valid_start)
+                    self.accepted[node][valid_len] = self.accepted[node].get(valid_len, 0) | 1 << plan_index
+
+    @classmethod
+    def compile(cls, names: Optional[Iterable[str]] = None) -> 'NumberingPlanTrie':
+        """
+        Compile the registered validators
+
+        :param names: Names of the plans to compile, if not provided all the registered plans are compiled
+        :raises KeyError: if a plan is not registered
+        :return:
+        """
+        names = list(PHONE_VALIDATORS) if names is None else list(names)
+        return cls({name: PHONE_VALIDATORS[name] for name in names})
+
+    def add_prefix(self, prefix: str) -> int:
+        """
+        Add the nodes of a prefix to the trie
+
+        :param prefix:
+        :return: Node of the prefix
+        """
+        node = 0
+        for digit in prefix:
+            child = self.children[node].get(digit)
+            if child is None:
+                child = len(self.children)
+                self.children.append({})
+                self.accepted.append({})
+                self.prefixes.append(self.prefixes[node] + digit)
+                self.children[node][digit] = child
+            node = child
+        return node
+
+    def match(self, text_number: str) -> int:
+        """
+        Plans that accept a number, walking the trie once with its digits
+
+        :param text_number:
+        :return: Bitmask of the indexes of the plans in `plans`
+        """
+        len_num = len(text_number)
+        node = 0
+        plans = self.accepted[0].get(len_num, 0)
+        for digit in text_number:
+            node = self.children[node].get(digit, -1)
+            if node < 0:
+                break
+            plans |= self.accepted[node].get(len_num, 0)
+        return plans
+
+    def matching_plans(self, text_number: str) -> List[str]:
+        """
+        Names of the plans that accept a number
+
+        :param text_number:
+        :return: Names in the order of `plans`
+        """
+        plans = self.match(text_number)
+        return [name for (plan_index, name) in enumerate(self.plans) if plans >> plan_index & 1]
+
+    def as_validator(self) -> Type[PhoneValidator]:
+        """
+        Create a PhoneValidator that accepts the numbers valid in any of the plans
+
+        The valid lengths and starts of the plans are merged, so the validator can be used to discard the
+         interpretations that can't be valid while they are created.
+
+        :return:
+        """
+        trie = self
+        valid_phones_start: Dict[int, List[str]] = {}
+        for (node, accepted) in enumerate(self.accepted):
+            for valid_len in accepted:
+                valid_phones_start.setdefault(valid_len, []).append(self.prefixes[node])
+
+        class AnyPlanPhoneValidator(PhoneValidator):
+            """PhoneValidator that accepts the numbers valid in any of the compiled plans"""
+            NAME = '|'.join(self.plans)
+            VALID_PHONES_LEN = sorted(valid_phones_start)
+            VALID_PHONES_START = valid_phones_start
+
+            @staticmethod
+            def validate(text_number: str) -> bool:
+                return trie.match(text_number) != 0
+
+        return AnyPlanPhoneValidator
@@ -0,0 +1,239 @@
+"""
+Module with a persistent cache stored in a SQLite file, used to reuse the results of the numbers between executions.
+
+The keys are stored with a version of the rules that produce the results: the `LANGUAGE_AMBIGUITIES` table and, for
+ each validator of the keys, its valid lengths, valid starts and the code of its `VERSIONED_METHODS`. When any of
+ them changes the old entries are not found anymore, and they are removed by the eviction.
+
+The cache can be shared by many processes, SQLite serializes the writes.
+
+Attributes:
+    persistent_cache.ambiguities_version()
+    persistent_cache.validator_version(validator: Type[PhoneValidator])
+    persistent_cache.storage_key(key: Hashable)
+"""
+import hashlib
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Hashable, Iterable, List, Optional, Tuple, Type
+from phone_number_interpreter.cache import CacheStats, ResultCache
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from phone_number_interpreter.phone_number_validator import PhoneValidator
+
+
+DEFAULT_MAX_ENTRIES = 1000000
+# Maximum keys of a single SQL statement, lower than the SQLite limit of variables
+MAX_STATEMENT_KEYS = 500
+# Increase it when the format of the stored results changes
+RESULT_FORMAT_VERSION = 1
+# Methods of the validators whose code is part of their version, the results depend on all of them
+VERSIONED_METHODS = ('validate', 'validate_many', 'could_be_valid')
+
+
+def rules_hash(*rules: Any) -> str:
+    """
+    Short hash of rules that can be serialized as JSON
+
+    :param rules:
+    :return:
+    """
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def ambiguities_version() -> str:
+    """
+    Version of the `LANGUAGE_AMBIGUITIES` table and the format of the results
+
+    :return:
+    """
+    return rules_hash(RESULT_FORMAT_VERSION, sorted(LANGUAGE_AMBIGUITIES.items()))
+
+
+@lru_cache(maxsize=None)
+def validator_version(validator: Type[PhoneValidator]) -> str:
+    """
+    Name and version of the rules of a validator
+
+    :param validator: PhoneValidator
+    :return:
+    """
+    sources = []
+    for method in VERSIONED_METHODS:
+        try:
+            sources.append(inspect.getsource(getattr(validator, method)))
+        except (OSError, TypeError):
+            sources.append('')
+    rules = [validator.VALID_PHONES_LEN, sorted((validator.VALID_PHONES_START or {}).items()), sources]
+    return '{}.{}@{}'.format(validator.__module__, validator.__qualname__, rules_hash(*rules))
+
+
+def storage_key(key: Hashable) -> str:
+    """
+    Key stored in the database, the validators of the key are replaced by their versions
+
+    :param key: String or tuple of values that can be serialized as JSON and validators
+    :return:
+    """
+    parts = key if isinstance(key, tuple) else (key,)
+    return json.dumps([validator_version(part) if isinstance(part, type) and issubclass(part, PhoneValidator)
+                       else part for part in parts])
+
+
+class SQLiteCache(ResultCache):
+    """
+    Cache stored in a SQLite file, that evicts the least recently used entries when it has more than `max_entries`.
+
+    The values must be serializable as JSON. The lookups and stores of `get_many` and `put_many` are done in a single
+     transaction.
+
+    The number of entries is kept in the `metadata` table, updated by triggers when the entries are inserted or
+     deleted, so it is not counted each time the entries are stored.
+
+    Example:
+        $ cache = SQLiteCache('results.sqlite')
+        $ cache.put_many([('2336', {'input': '2336'}), ('234', {'input': '234'})])
+        $ cache.get_many(['2336', '2337'])
+        $ [{'input': '2336'}, None]
+
+    Attributes:
+        path: Path of the SQLite file
+        max_entries: Maximum number of entries
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError('The maximum entries of the cache must be greater than 0')
+        self.path = path
+        self.max_entries = max_entries
+        self.version = ambiguities_version()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                     'version TEXT NOT NULL, '
+                                     'key TEXT NOT NULL, '
+                                     'value TEXT NOT NULL, '
+                                     'last_used REAL NOT NULL, '
+                                     'PRIMARY KEY (version, key))')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS metadata ('
+                                     'name TEXT PRIMARY KEY, '
+                                     'value INTEGER NOT NULL)')
+            self._connection.execute("INSERT OR IGNORE INTO metadata (name, value) "
+                                     "SELECT 'size', COUNT(*) FROM results")
+            self._connection.execute('CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results BEGIN '
+                                     "UPDATE metadata SET value = value + 1 WHERE name = 'size'; END")
+            self._connection.execute('CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results BEGIN '
+                                     "UPDATE metadata SET value = value - 1 WHERE name = 'size'; END")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size()
+
+    def _size(self) -> int:
+        return self._connection.execute("SELECT value FROM metadata WHERE name = 'size'").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the database
+
+        :return:
+        """
+        with self._lock:
+            self._connection.close()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get the value of a key, and mark it as recently used
+
+        :param key: String or tuple of values that can be serialized as JSON and validators
+        :return: Value of the key, None if the key is not in the cache
+        """
+        return self.get_many([key])[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store the value of a key, evicting the least recently used entries if the cache is full
+
+        :param key: String or tuple of values that can be serialized as JSON and validators
+        :param value: Value that can be serialized as JSON, it can't be None
+        :return:
+        """
+        self.put_many([(key, value)])
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Any]]:
+        """
+        Get the values of many keys in a single transaction, and mark them as recently used
+
+        :param keys: Strings or tuples of values that can be serialized as JSON and validators
+        :return: Value of each key, None for the keys that are not in the cache
+        """
+        stored_keys = [storage_key(key) for key in keys]
+        values = {}
+        with self._lock, self._connection:
+            for start in range(0, len(stored_keys), MAX_STATEMENT_KEYS):
+                block = stored_keys[start:start + MAX_STATEMENT_KEYS]
+                rows = self._connection.execute(
+                    'SELECT key, value FROM results WHERE version = ? AND key IN ({})'.format(
+                        ','.join('?' * len(block))),
+                    [self.version] + block)
+                values.update(rows)
+            now = time.time()
+            self._connection.executemany('UPDATE results SET last_used = ? WHERE version = ? AND key = ?',
+                                         [(now, self.version, key) for key in values])
+            self._hits += sum(1 for key in stored_keys if key in values)
+            self._misses += sum(1 for key in stored_keys if key not in values)
+        return [json.loads(values[key]) if key in values else None for key in stored_keys]
+
+    def put_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Store the values of many keys in a single transaction, evicting the least recently used entries if the cache
+         is full
+
+        :param items: Keys and values, the values can be serialized as JSON and can't be None
+        :return:
+        """
+        now = time.time()
+        rows = [(self.version, storage_key(key), json.dumps(value), now) for (key, value) in items]
+        with self._lock, self._connection:
+            # The existing keys are updated, so only the new entries fire the trigger that counts them
+            self._connection.executemany('INSERT INTO results (version, key, value, last_used) VALUES (?, ?, ?, ?) '
+                                         'ON CONFLICT (version, key) DO UPDATE SET '
+                                         'value = excluded.value, last_used = excluded.last_used', rows)
+            size = self._size()
+            if size > self.max_entries:
+                self._connection.execute('DELETE FROM results WHERE rowid IN '
+                                         '(SELECT rowid FROM results ORDER BY last_used LIMIT ?)',
+                                         (size - self.max_entries,))
+                self._evictions += size - self.max_entries
+
+    def clear(self) -> None:
+        """
+        Remove all the entries, of all the versions, and reset the counters
+
+        :return:
+        """
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM results')
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        """
+        Get the counters of the use of the cache by this process, and the entries stored by all the processes
+
+        :return:
+        """
+        with self._lock:
+            return CacheStats(hits=self._hits,
+                              misses=self._misses,
+                              evictions=self._evictions,
+                              size=self._size(),
+                              capacity=self.max_entries)
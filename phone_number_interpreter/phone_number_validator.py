@@ -1,15 +1,52 @@
 """
 Module with the logic used to validate if a number is a valid phone number.
 
+Many numbers can be validated at once with `validate_many`. GreekPhoneNumberValidator implements it with vectorized
+ NumPy operations over a fixed-width byte array of the numbers when NumPy is installed, and it falls back to
+ `validate` otherwise. Converting a list of strings to an array has a cost, so short lists are validated one by one.
+ NumPy is slow to import, so it is only imported the first time a long list is validated.
+
+The validators of each numbering plan can be registered by name with `register_phone_validator`, to validate the
+ numbers against many plans at once (see `numbering_plan_trie`).
+
+Attributes:
+    PHONE_VALIDATORS (Dict[str, Type[PhoneValidator]]): Registered validators by the name of their numbering plan
+    phone_number_validator.import_numpy()
+    phone_number_validator.register_phone_validator(validator: Type[PhoneValidator])
+    phone_number_validator.validate_many_by_rules(numbers: Sequence[str], valid_phones_len: List[int],
+                                                  valid_phones_start: Optional[Dict[int, List[str]]])
+
 Classes:
     PhoneValidator(metaclass=ABCMeta): Abstract base class of phone validator classes
     GreekPhoneNumberValidator(PhoneValidator): Implementation to validate Greek phone numbers
 """
+import sys
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence, Type
+
+
+# Minimum numbers of a list to validate them with NumPy, the arrays are always validated with NumPy
+VECTORIZE_MIN_NUMBERS = 1024
+
 
+class PhoneValidator(metaclass=ABCMeta):
+    """
+    Abstract base class for phone number validator classes
+
+    The validators can declare the valid lengths and starts of the phone numbers, they are used to discard numbers
+     before they are complete. If they are not declared, any number could be valid until it is validated.
 
-class PhoneValidator(metaclass=ABCMeta):  # pylint: disable=too-few-public-methods
-    """Abstract base class for phone number validator classes"""
+    Attributes:
+        PhoneValidator.NAME (Optional[str]): Name of the numbering plan, used to register the validator
+        PhoneValidator.VALID_PHONES_LEN (Optional[List[int]]): Valid lengths of phone numbers
+        PhoneValidator.VALID_PHONES_START (Optional[Dict[int, List[str]]]): Dict with valid start of phone numbers,
+         the key will be the length and the value contain a List with valid starts for that length
+    """
+    NAME: Optional[str] = None
+    VALID_PHONES_LEN: Optional[List[int]] = None
+    VALID_PHONES_START: Optional[Dict[int, List[str]]] = None
 
     @staticmethod
     @abstractmethod
@@ -22,16 +59,133 @@ class PhoneValidator(metaclass=ABCMeta):  # pylint: disable=too-few-public-metho
         """
         raise NotImplementedError('Missing implementation of .validate(text_number: str)')
 
+    @classmethod
+    def validate_many(cls, numbers: Sequence[str]) -> Sequence[bool]:
+        """
+        Validate if many numbers are valid phone numbers
+
+        :param numbers: Numbers as strings or bytes, or a NumPy array of strings or bytes
+        :return: Mask with True for the valid phone numbers, False otherwise
+        """
+        # The elements of a byte array are bytes, str() of them would be their representation "b'...'"
+        return [cls.validate(text_number.decode('ascii') if isinstance(text_number, bytes) else str(text_number))
+                for text_number in numbers]
+
+    @classmethod
+    def could_be_valid(cls, prefix: str, min_len: int, max_len: int) -> bool:
+        """
+        Validate if a number that starts with `prefix`, and has a length between `min_len` and `max_len`, could be a
+         valid phone number, based on `VALID_PHONES_LEN` and `VALID_PHONES_START`
+
+        :param prefix: Start of the number
+        :param min_len: Minimum length of the number
+        :param max_len: Maximum length of the number
+        :return: False if it can't be a valid phone number, True otherwise
+        """
+        if cls.VALID_PHONES_LEN is None:
+            return True
+
+        for valid_len in cls.VALID_PHONES_LEN:
+            if min_len <= valid_len <= max_len:
+                if cls.VALID_PHONES_START is None:
+                    return True
+                for valid_start in cls.VALID_PHONES_START[valid_len]:
+                    if valid_start.startswith(prefix[:len(valid_start)]):
+                        return True
+        return False
+
+
+PHONE_VALIDATORS: Dict[str, Type[PhoneValidator]] = dict()
+
 
-class GreekPhoneNumberValidator(PhoneValidator):  # pylint: disable=too-few-public-methods
+@lru_cache(maxsize=None)
+def import_numpy() -> Optional[ModuleType]:
+    """
+    Import NumPy the first time it is needed, instead of when the module is imported
+
+    :return: numpy module, None if it is not installed
+    """
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def validate_many_by_rules(numbers: Sequence[str],
+                           valid_phones_len: List[int],
+                           valid_phones_start: Optional[Dict[int, List[str]]]) -> 'numpy.ndarray':
+    """
+    Validate many numbers with the valid lengths and starts of a numbering plan, using vectorized NumPy operations
+
+    The numbers are converted to a fixed-width byte array and viewed as a matrix of digits, one row per number, the
+     lengths are the count of non padding bytes of each row and the starts are compared with the first columns.
+
+    :param numbers: Numbers as strings, or a NumPy array of strings or bytes
+    :param valid_phones_len: Valid lengths of phone numbers
+    :param valid_phones_start: Valid starts of phone numbers by length, None if any start is valid
+    :raises ImportError: if NumPy is not installed
+    :return: Boolean NumPy array with True for the valid phone numbers
+    """
+    numpy = import_numpy()
+    if numpy is None:
+        raise ImportError('NumPy is not installed')
+    array = numbers if isinstance(numbers, numpy.ndarray) else numpy.array(numbers, dtype='S')
+    if array.dtype.kind != 'S':
+        array = array.astype('S')
+    array = numpy.ascontiguousarray(array.reshape(-1))
+    if not array.size:
+        return numpy.zeros(0, dtype=bool)
+
+    width = array.dtype.itemsize
+    digits = array.view(numpy.uint8).reshape(-1, width)
+    lengths = numpy.count_nonzero(digits, axis=1)
+
+    valid = numpy.zeros(len(digits), dtype=bool)
+    for valid_len in valid_phones_len:
+        if valid_len > width:
+            continue
+        has_valid_len = lengths == valid_len
+        if valid_phones_start is None:
+            valid |= has_valid_len
+            continue
+        for valid_start in valid_phones_start[valid_len]:
+            start = numpy.frombuffer(valid_start.encode('ascii'), dtype=numpy.uint8)
+            valid |= has_valid_len & (digits[:, :len(start)] == start).all(axis=1)
+    return valid
+
+
+def register_phone_validator(validator: Type[PhoneValidator]) -> Type[PhoneValidator]:
+    """
+    Register a validator by the name of its numbering plan, it can be used as a class decorator
+
+    The validator must declare its `NAME` and its `VALID_PHONES_LEN`, because the registered validators are compiled
+     from their rules.
+
+    :param validator: PhoneValidator
+    :raises ValueError: if the validator doesn't declare its name or valid lengths, or the name is registered
+    :return: The same validator
+    """
+    if not validator.NAME or validator.VALID_PHONES_LEN is None:
+        raise ValueError('The validator {} must declare NAME and VALID_PHONES_LEN'.format(validator.__name__))
+    if PHONE_VALIDATORS.get(validator.NAME, validator) is not validator:
+        raise ValueError('There is already a validator registered for "{}"'.format(validator.NAME))
+    PHONE_VALIDATORS[validator.NAME] = validator
+    return validator
+
+
+@register_phone_validator
+class GreekPhoneNumberValidator(PhoneValidator):
     """
     Implementation of PhoneValidator for Greek phone numbers
 
     Attributes:
+        GreekPhoneNumberValidator.NAME (str): Name of the numbering plan
         GreekPhoneNumberValidator.VALID_PHONES_LEN (List[int]): Valid lengths of Greek phone numbers
         GreekPhoneNumberValidator.VALID_PHONES_START (Dict[int, List[str]]): Dict with valid start of
          Greek phone numbers, the key will be the length and the value contain a List with valid starts for that length
     """
+    NAME = 'GR'
     VALID_PHONES_LEN = [10, 14]
     VALID_PHONES_START = {
         10: ['2', '69'],
@@ -52,3 +206,19 @@ class GreekPhoneNumberValidator(PhoneValidator):  # pylint: disable=too-few-publ
                 if text_number.startswith(valid_start):
                     return True
         return False
+
+    @classmethod
+    def validate_many(cls, numbers: Sequence[str]) -> Sequence[bool]:
+        """
+        Validate if many numbers are valid Greek phone numbers, with vectorized NumPy operations if it is installed
+         and the numbers are an array or a list of at least `VECTORIZE_MIN_NUMBERS` numbers
+
+        :param numbers: Numbers as strings or bytes, or a NumPy array of strings or bytes
+        :return: Mask with True for the valid phone numbers, False otherwise
+        """
+        # An array can only exist if NumPy was already imported
+        loaded_numpy = sys.modules.get('numpy')
+        is_array = loaded_numpy is not None and isinstance(numbers, loaded_numpy.ndarray)
+        if not is_array and len(numbers) < VECTORIZE_MIN_NUMBERS or import_numpy() is None:
+            return super().validate_many(numbers)
+        return validate_many_by_rules(numbers, cls.VALID_PHONES_LEN, cls.VALID_PHONES_START)
@@ -0,0 +1,341 @@
+"""
+Module with a pipeline that processes a big file of numbers in shards, with a checkpoint per shard, so a job that
+ stops halfway is resumed from the shards that were not finished.
+
+The input file is split in byte ranges with `bulk_reader.shard_ranges`, each shard writes the JSON Lines of the
+ `batch` mode to its own file in a work directory. The output of a shard is written to a temporary file that is renamed
+ when it is complete, and then its checkpoint is written, so a shard is either finished or processed again from the
+ start. The shards are independent, they can be processed by different machines that share the work directory.
+
+The job is described by the manifest of the work directory, with the shards, the size of the input and the options
+ that change the results. The shards of another job, or of a modified input, are never mixed in the same directory.
+
+The outputs of the shards are merged in the order of the shards, that is the order of the numbers in the input, so
+ the merged output has the same lines of `batch` for the whole file.
+
+Examples:
+    $ python -m phone_number_interpreter pipeline run numbers.txt work --shards 16
+    $ python -m phone_number_interpreter pipeline run numbers.txt work --shards 16 --shard 0 --shard 1
+    $ python -m phone_number_interpreter pipeline merge work -o results.jsonl
+
+Attributes:
+    pipeline.shard_path(directory: str, shard: int, shards: int, extension: str)
+    pipeline.merge_shards(directory: str, output: BinaryIO)
+    pipeline.parse_arguments(argv: List[str])
+    pipeline.run(argv: Optional[List[str]])
+
+Classes:
+    ShardPipeline
+"""
+import argparse
+import json
+import os
+import shutil
+import socket
+import sys
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Type
+from phone_number_interpreter.app import non_negative_int, positive_int
+from phone_number_interpreter.batch import open_replacing, write_results
+from phone_number_interpreter.bulk_reader import MappedInput
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator, PhoneValidator
+
+
+MANIFEST_FILE = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def write_json_atomically(path: str, data: Dict[str, Any]) -> None:
+    """
+    Write a JSON file through a temporary file, so the file is never read partially written
+
+    :param path:
+    :param data:
+    :return:
+    """
+    temporary_path = '{}.{}-{}.tmp'.format(path, socket.gethostname(), os.getpid())
+    with open(temporary_path, 'w', encoding='utf-8') as json_file:
+        json.dump(data, json_file, sort_keys=True)
+    os.replace(temporary_path, path)
+
+
+def read_json(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON file
+
+    :param path:
+    :return: The data of the file, None if it doesn't exist
+    """
+    try:
+        with open(path, encoding='utf-8') as json_file:
+            return json.load(json_file)
+    except FileNotFoundError:
+        return None
+
+
+def shard_path(directory: str, shard: int, shards: int, extension: str) -> str:
+    """
+    File of a shard in the work directory
+
+    :param directory: Work directory
+    :param shard:
+    :param shards: Number of shards
+    :param extension: 'jsonl' for the output of the shard, 'done' for its checkpoint
+    :return:
+    """
+    return os.path.join(directory, 'shard-{:05d}-of-{:05d}.{}'.format(shard, shards, extension))
+
+
+def merge_shards(directory: str, output: BinaryIO) -> int:
+    """
+    Write the outputs of all the shards of a work directory in order, the lines are the same of `batch` for the
+     whole input
+
+    :param directory: Work directory
+    :param output: Binary stream where the JSON lines are written
+    :raises ValueError: if the directory has not a manifest, or there are shards not finished
+    :return: Number of numbers written
+    """
+    manifest = read_json(os.path.join(directory, MANIFEST_FILE))
+    if manifest is None or manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError('The directory "{}" is not a work directory of a pipeline'.format(directory))
+
+    shards = manifest['shards']
+    checkpoints = [read_json(shard_path(directory, shard, shards, 'done')) for shard in range(shards)]
+    pending_shards = [shard for (shard, checkpoint) in enumerate(checkpoints) if checkpoint is None]
+    if pending_shards:
+        raise ValueError('The shards {} of {} are not finished'.format(
+            ', '.join(str(shard) for shard in pending_shards), shards))
+
+    for shard in range(shards):
+        with open(shard_path(directory, shard, shards, 'jsonl'), 'rb') as shard_file:
+            shutil.copyfileobj(shard_file, output)
+    return sum(checkpoint['numbers'] for checkpoint in checkpoints)
+
+
+class ShardPipeline:
+    """
+    Job that processes a file of numbers in shards, with the outputs and checkpoints of the shards in a work
+     directory
+
+    Example:
+        $ pipeline = ShardPipeline('numbers.txt', 'work', shards=16)
+        $ pipeline.run()
+        $ with open('results.jsonl', 'wb') as output:
+        $     pipeline.merge(output)
+
+    Attributes:
+        input_path: File with one number per line
+        directory: Work directory of the outputs and the checkpoints of the shards
+        shards: Number of shards
+        interpreter: NaturalNumbersInterpreter
+        validator: PhoneValidator
+        valid_only: If True only the interpretations that are valid phone numbers are included
+        workers: Number of processes used to process each shard, if 0 the number of CPUs is used
+    """
+
+    def __init__(self,
+                 input_path: str,
+                 directory: str,
+                 shards: int,
+                 interpreter: Optional[NaturalNumbersInterpreter] = None,
+                 validator: Type[PhoneValidator] = GreekPhoneNumberValidator,
+                 valid_only: bool = False,
+                 workers: int = 1):
+        if shards < 1:
+            raise ValueError('Invalid number of shards {}, it must be positive'.format(shards))
+        if workers < 0:
+            raise ValueError('Invalid number of workers {}, it must not be negative'.format(workers))
+        self.input_path = input_path
+        self.directory = directory
+        self.shards = shards
+        self.interpreter = interpreter if interpreter else NaturalNumbersInterpreter()
+        self.validator = validator
+        self.valid_only = valid_only
+        self.workers = workers
+
+    def manifest(self) -> Dict[str, Any]:
+        """
+        Manifest of the job, the shards are only reused by jobs with the same manifest
+
+        :return:
+        """
+        return {
+            'version': MANIFEST_VERSION,
+            'input_size': os.path.getsize(self.input_path),
+            'input_mtime': int(os.path.getmtime(self.input_path)),
+            'shards': self.shards,
+            'validator': self.validator.__name__,
+            'valid_only': self.valid_only,
+            'max_interpretations': self.interpreter.max_interpretations,
+            'truncate': self.interpreter.truncate,
+        }
+
+    def prepare(self) -> None:
+        """
+        Create the work directory and its manifest, or check the manifest of an existing directory
+
+        :raises ValueError: if the directory has the manifest of another job
+        :return:
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = self.manifest()
+        existing_manifest = read_json(os.path.join(self.directory, MANIFEST_FILE))
+        if existing_manifest is None:
+            write_json_atomically(os.path.join(self.directory, MANIFEST_FILE), manifest)
+        elif existing_manifest != manifest:
+            differences = ['{} is {} and was {}'.format(field, value, existing_manifest.get(field))
+                           for (field, value) in manifest.items() if existing_manifest.get(field) != value]
+            raise ValueError('The work directory "{}" belongs to another job, or the input changed: {}'.format(
+                self.directory, ', '.join(differences)))
+
+    def checkpoint(self, shard: int) -> Optional[Dict[str, Any]]:
+        """
+        Checkpoint of a shard, it exists only when the shard is finished
+
+        :param shard:
+        :return: Dict with the `shard`, its byte range and the `numbers` processed, None if it is not finished
+        """
+        return read_json(shard_path(self.directory, shard, self.shards, 'done'))
+
+    def pending_shards(self) -> List[int]:
+        """
+        Shards that are not finished
+
+        :return:
+        """
+        return [shard for shard in range(self.shards)
+                if not os.path.exists(shard_path(self.directory, shard, self.shards, 'done'))]
+
+    def run_shard(self, shard: int) -> int:
+        """
+        Process a shard and write its checkpoint, even if it was already finished
+
+        :param shard:
+        :raises ValueError: if the shard doesn't exist
+        :return: Number of processed numbers
+        """
+        if not 0 <= shard < self.shards:
+            raise ValueError('Invalid shard {}, it must be between 0 and {}'.format(shard, self.shards - 1))
+
+        output_path = shard_path(self.directory, shard, self.shards, 'jsonl')
+        temporary_path = '{}.{}-{}.tmp'.format(output_path, socket.gethostname(), os.getpid())
+        with MappedInput(self.input_path) as mapped_input:
+            (start, end) = mapped_input.shard_ranges(self.shards)[shard]
+            try:
+                with open(temporary_path, 'w', encoding='utf-8') as output_file:
+                    processed_numbers = write_results(mapped_input.iter_numbers(start, end), output_file,
+                                                      self.interpreter, self.validator, self.valid_only, self.workers)
+                    output_file.flush()
+                    os.fsync(output_file.fileno())
+            except BaseException:
+                if os.path.exists(temporary_path):
+                    os.remove(temporary_path)
+                raise
+
+        os.replace(temporary_path, output_path)
+        write_json_atomically(shard_path(self.directory, shard, self.shards, 'done'),
+                              {'shard': shard, 'start': start, 'end': end, 'numbers': processed_numbers})
+        return processed_numbers
+
+    def run(self, shards: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """
+        Process the shards that are not finished
+
+        The checkpoint of each shard is checked just before processing it, so the shards finished meanwhile by
+         other machines are skipped.
+
+        :param shards: Shards to process if they are not finished, if not provided all the shards
+        :raises ValueError: if the directory has the manifest of another job, or a shard doesn't exist
+        :return: Dict with the numbers processed by each shard processed, the finished shards are not included
+        """
+        selected_shards = range(self.shards) if shards is None else sorted(set(shards))
+        for shard in selected_shards:
+            if not 0 <= shard < self.shards:
+                raise ValueError('Invalid shard {}, it must be between 0 and {}'.format(shard, self.shards - 1))
+        self.prepare()
+
+        processed_numbers = {}
+        for shard in selected_shards:
+            if self.checkpoint(shard) is None:
+                processed_numbers[shard] = self.run_shard(shard)
+        return processed_numbers
+
+    def merge(self, output: BinaryIO) -> int:
+        """
+        Write the outputs of all the shards in order, with `merge_shards`
+
+        :param output: Binary stream where the JSON lines are written
+        :raises ValueError: if the directory has the manifest of another job, or there are shards not finished
+        :return: Number of numbers written
+        """
+        self.prepare()
+        return merge_shards(self.directory, output)
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the pipeline
+
+    :param argv: Command line arguments, after `pipeline`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter pipeline',
+                                     description='Process a file of numbers in shards that can be resumed, and merge '
+                                                 'their JSON Lines in the order of the input')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='Process the shards that are not finished')
+    run_parser.add_argument('input', help='File with one number per line')
+    run_parser.add_argument('directory', help='Work directory of the outputs and the checkpoints of the shards')
+    run_parser.add_argument('--shards', type=positive_int, required=True,
+                            help='Number of byte ranges of the input file')
+    run_parser.add_argument('--shard', type=int, action='append', metavar='INDEX',
+                            help='Process only the shard INDEX, starting at 0, it can be repeated')
+    run_parser.add_argument('--valid-only', action='store_true',
+                            help='Include only the interpretations that are valid phone numbers')
+    run_parser.add_argument('--workers', type=non_negative_int, default=1,
+                            help='Number of processes used to process each shard, 0 to use one per CPU')
+    run_parser.add_argument('--max-interpretations', type=positive_int, default=None,
+                            help='Reject the numbers with more possible interpretations than this value')
+    run_parser.add_argument('--truncate', action='store_true',
+                            help='Include only --max-interpretations interpretations, instead of rejecting the number')
+    merge_parser = commands.add_parser('merge', help='Merge the outputs of the shards in the order of the input')
+    merge_parser.add_argument('directory', help='Work directory of the outputs and the checkpoints of the shards')
+    merge_parser.add_argument('-o', '--output', default='-',
+                              help='File where the JSON Lines are written, if not provided or "-" they are written to '
+                                   'stdout')
+    return parser.parse_args(argv)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the pipeline
+
+    :param argv: Command line arguments after `pipeline`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+
+    try:
+        if arguments.command == 'run':
+            interpreter = NaturalNumbersInterpreter(max_interpretations=arguments.max_interpretations,
+                                                    truncate=arguments.truncate)
+            pipeline = ShardPipeline(arguments.input, arguments.directory, arguments.shards, interpreter,
+                                     valid_only=arguments.valid_only, workers=arguments.workers)
+            selected_shards = set(range(arguments.shards) if arguments.shard is None else arguments.shard)
+            processed_numbers = pipeline.run(selected_shards)
+            print('Processed {} numbers in {} shards, {} shards were already finished'.format(
+                sum(processed_numbers.values()), len(processed_numbers),
+                len(selected_shards) - len(processed_numbers)), file=sys.stderr)
+            return
+
+        if arguments.output == '-':
+            merged_numbers = merge_shards(arguments.directory, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            # The output replaces an existing file only when the merge succeeds
+            with open_replacing(arguments.output, binary=True) as output_file:
+                merged_numbers = merge_shards(arguments.directory, output_file)
+        print('Merged {} numbers'.format(merged_numbers), file=sys.stderr)
+    except ValueError as error:
+        raise SystemExit(str(error)) from error
@@ -0,0 +1,672 @@
+"""
+Module with an HTTP service to interpret numbers, implemented with asyncio and the standard library only.
+
+The service keeps the connections open (HTTP/1.1 keep-alive) and groups the numbers of the concurrent requests in
+ micro-batches, that are processed by a pool of workers. When too many numbers are waiting to be processed the new
+ requests are rejected with 503, and the requests that are not processed in `request_timeout` seconds get 504.
+
+Endpoints:
+    GET /health: Status of the service and the numbers waiting to be processed
+    POST /interpret: Interpretations of a number, body {"number": "2336", "valid_only": false}, the response is the
+        same object of `batch.interpret_number`. Many numbers can be sent with {"numbers": [...]}, the response is
+        {"results": [...]}
+    POST /validate: Validate a phone number, body {"number": "2106930664"}, the response is
+        {"number": "2106930664", "valid": true}. Many numbers can be sent with {"numbers": [...]}
+
+Examples:
+    $ python -m phone_number_interpreter serve --port 8080 --workers 4
+    $ curl -d '{"number": "2336"}' http://127.0.0.1:8080/interpret
+    $ {"input": "2336", "interpretations": [{"number": "2336", "valid": false}, ...], "time_ms": 0.042}
+
+Attributes:
+    server.interpret_batch(items: List[Tuple[str, bool]], interpreter: NaturalNumbersInterpreter,
+                           validator: Type[PhoneValidator])
+    server.read_line(reader: asyncio.StreamReader, status: HTTPStatus, message: str)
+    server.read_request(reader: asyncio.StreamReader)
+    server.parse_arguments(argv: List[str])
+    server.print_address(service: InterpretationService)
+    server.run(argv: Optional[List[str]])
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+from phone_number_interpreter.app import non_negative_int, positive_int
+from phone_number_interpreter.batch import interpret_number
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator, PhoneValidator
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_DELAY = 0.002
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_REQUEST_TIMEOUT = 10.0
+DEFAULT_KEEP_ALIVE_TIMEOUT = 30.0
+MAX_HEADER_LINES = 100
+MAX_BODY_SIZE = 1024 * 1024
+MAX_NUMBERS_PER_REQUEST = 1000
+
+# Item of a micro-batch, the number without spaces and if only the valid interpretations are included
+BatchItem = Tuple[str, bool]
+
+
+class HttpError(Exception):
+    """
+    Error that is returned to the client as a JSON response with its status
+
+    Attributes:
+        status: HTTP status of the response
+        message: Description of the error
+    """
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ServiceOverloadedError(Exception):
+    """Exception raised when a number is submitted and the queue of pending numbers is full"""
+
+
+@dataclass
+class HttpRequest:
+    """
+    Request received by the service
+
+    Attributes:
+        method: HTTP method in upper case
+        path: Path of the request, without the query
+        version: HTTP version, e.g. 'HTTP/1.1'
+        headers: Headers with the names in lower case
+        body: Content of the request
+    """
+    method: str
+    path: str
+    version: str
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        """
+        If the connection is kept open after the response, by default in HTTP/1.1 and only if requested in HTTP/1.0
+
+        :return:
+        """
+        connection = self.headers.get('connection', '').lower()
+        if self.version == 'HTTP/1.0':
+            return connection == 'keep-alive'
+        return connection != 'close'
+
+
+async def read_line(reader: asyncio.StreamReader, status: HTTPStatus, message: str) -> bytes:
+    """
+    Read a line of the request, that can't be longer than the limit of the reader
+
+    :param reader:
+    :param status: Status of the error when the line is too long
+    :param message: Description of the error when the line is too long
+    :raises HttpError: if the line is too long
+    :return: Line read, with its line break
+    """
+    try:
+        return await reader.readline()
+    except ValueError as error:
+        # The reader raises ValueError, from LimitOverrunError, for the lines longer than its limit
+        raise HttpError(status, message) from error
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[HttpRequest]:
+    """
+    Read a request from a connection
+
+    :param reader:
+    :raises HttpError: if the request is malformed or too large
+    :return: Request read, None if the client closed the connection
+    """
+    request_line = await read_line(reader, HTTPStatus.BAD_REQUEST, 'Request line too long')
+    if not request_line.strip():
+        return None
+
+    try:
+        (method, target, version) = request_line.decode('latin-1').split()
+    except ValueError as error:
+        raise HttpError(HTTPStatus.BAD_REQUEST, 'Malformed request line') from error
+
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        header_line = (await read_line(reader, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                       'Header line too long')).decode('latin-1').strip()
+        if not header_line:
+            break
+        (name, _, value) = header_line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, 'Too many headers')
+
+    try:
+        content_length = int(headers.get('content-length', 0))
+    except ValueError as error:
+        raise HttpError(HTTPStatus.BAD_REQUEST, 'Invalid Content-Length') from error
+    if content_length > MAX_BODY_SIZE:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'The body can have {} bytes'.format(MAX_BODY_SIZE))
+
+    body = await reader.readexactly(content_length) if content_length > 0 else b''
+    return HttpRequest(method=method.upper(), path=target.split('?', 1)[0], version=version, headers=headers,
+                       body=body)
+
+
+def interpret_batch(items: List[BatchItem],
+                    interpreter: NaturalNumbersInterpreter,
+                    validator: Type[PhoneValidator]) -> List[Dict[str, Any]]:
+    """
+    Process a micro-batch of numbers with `interpret_number`, it is executed by the workers
+
+    :param items: Numbers without spaces and if only the valid interpretations are included
+    :param interpreter:
+    :param validator: PhoneValidator
+    :return: Results of `interpret_number` in the same order of `items`
+    """
+    return [interpret_number(input_number, interpreter, validator, valid_only)
+            for (input_number, valid_only) in items]
+
+
+class MicroBatcher:
+    """
+    Group the numbers submitted by concurrent requests in batches that are processed by an executor.
+
+    A batch is dispatched when it has `max_batch_size` numbers or `max_delay` seconds after its first number. At most
+     `max_in_flight` batches are processed at the same time, the numbers submitted meanwhile wait in a queue of
+     `max_pending` numbers, when it is full the new numbers are rejected.
+
+    Attributes:
+        process_batch: Function that processes a batch in the executor, it must be picklable for a process pool
+        executor: Executor of the batches
+        max_batch_size: Maximum numbers of a batch
+        max_delay: Seconds that a batch waits for more numbers
+        max_in_flight: Maximum batches processed at the same time
+    """
+
+    def __init__(self,
+                 process_batch: Callable[[List[BatchItem]], List[Dict[str, Any]]],
+                 executor: Executor,
+                 max_batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_delay: float = DEFAULT_BATCH_DELAY,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 max_in_flight: int = 1):
+        self.process_batch = process_batch
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self._queue: 'asyncio.Queue[Tuple[BatchItem, asyncio.Future]]' = asyncio.Queue(max_pending)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+
+    @property
+    def pending(self) -> int:
+        """
+        Numbers waiting to be dispatched
+
+        :return:
+        """
+        return self._queue.qsize()
+
+    def submit(self, item: BatchItem) -> 'asyncio.Future[Dict[str, Any]]':
+        """
+        Add a number to the next batch
+
+        :param item: Number without spaces and if only the valid interpretations are included
+        :raises ServiceOverloadedError: if the queue of pending numbers is full
+        :return: Future with the result of the number
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((item, future))
+        except asyncio.QueueFull as error:
+            raise ServiceOverloadedError('Too many pending numbers') from error
+        return future
+
+    async def next_batch(self) -> List[Tuple[BatchItem, asyncio.Future]]:
+        """
+        Wait for the next batch, the numbers of the requests that timed out are skipped
+
+        :return:
+        """
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch_size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return [(item, future) for (item, future) in batch if not future.done()]
+
+    async def run(self) -> None:
+        """
+        Dispatch the batches until the task is cancelled
+
+        :return:
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._in_flight.acquire()
+            batch = await self.next_batch()
+            if not batch:
+                self._in_flight.release()
+                continue
+            results = loop.run_in_executor(self.executor, self.process_batch, [item for (item, _) in batch])
+            results.add_done_callback(partial(self._resolve, [future for (_, future) in batch]))
+
+    def _resolve(self, futures: List[asyncio.Future], results: asyncio.Future) -> None:
+        self._in_flight.release()
+        for (index, future) in enumerate(futures):
+            if future.done():
+                continue
+            if results.cancelled():
+                future.cancel()
+            elif results.exception() is not None:
+                future.set_exception(results.exception())
+            else:
+                future.set_result(results.result()[index])
+
+
+class InterpretationService:  # pylint: disable=too-many-instance-attributes
+    """
+    HTTP service that interprets and validates numbers
+
+    Example:
+        $ service = InterpretationService(port=0)
+        $ await service.start()
+        $ service.port
+        $ 41253
+        $ await service.close()
+
+    Attributes:
+        host: Address where the service listens
+        port: Port where the service listens, 0 to use a free port, updated when the service is started
+        workers: Number of processes of the pool, 1 to use a thread, 0 to use one process per CPU
+        interpreter:
+        validator: PhoneValidator
+        batch_size: Maximum numbers of a micro-batch
+        batch_delay: Seconds that a micro-batch waits for more numbers
+        max_pending: Maximum numbers waiting for a worker, the requests over it are rejected with 503
+        request_timeout: Seconds to process a request, the requests over it get 504
+        keep_alive_timeout: Seconds that an idle connection is kept open
+    """
+
+    def __init__(self,
+                 host: str = DEFAULT_HOST,
+                 port: int = DEFAULT_PORT,
+                 workers: int = 1,
+                 interpreter: Optional[NaturalNumbersInterpreter] = None,
+                 validator: Type[PhoneValidator] = GreekPhoneNumberValidator,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_delay: float = DEFAULT_BATCH_DELAY,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+                 keep_alive_timeout: float = DEFAULT_KEEP_ALIVE_TIMEOUT):
+        if workers < 0:
+            raise ValueError('Invalid workers {}, it must be 0 or positive'.format(workers))
+        if batch_size < 1:
+            raise ValueError('Invalid batch size {}, it must be positive'.format(batch_size))
+        if max_pending < 1:
+            raise ValueError('Invalid max pending {}, it must be positive'.format(max_pending))
+        self.host = host
+        self.port = port
+        self.workers = workers if workers else os.cpu_count() or 1
+        self.interpreter = interpreter if interpreter else NaturalNumbersInterpreter()
+        self.validator = validator
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[Executor] = None
+        self._batcher: Optional[MicroBatcher] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        """
+        Start the workers and listen for connections
+
+        :return:
+        """
+        if self.workers > 1:
+            self._executor = ProcessPoolExecutor(self.workers)
+        else:
+            self._executor = ThreadPoolExecutor(1)
+        self._batcher = MicroBatcher(partial(interpret_batch, interpreter=self.interpreter, validator=self.validator),
+                                     self._executor, self.batch_size, self.batch_delay, self.max_pending,
+                                     max_in_flight=self.workers)
+        self._batcher_task = asyncio.ensure_future(self._batcher.run())
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stop listening, close the open connections and stop the workers
+
+        :return:
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for writer in list(self._connections):
+            writer.close()
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    async def serve_forever(self, started: Optional[Callable[['InterpretationService'], None]] = None) -> None:
+        """
+        Start the service and process the connections until the task is cancelled
+
+        :param started: Function called with the service when it is listening, e.g. to show its port
+        :return:
+        """
+        await self.start()
+        if started is not None:
+            started(self)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await self.close()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Process the requests of a connection until the client closes it, it is idle for `keep_alive_timeout` seconds
+         or a request asks to close it
+
+        :param reader:
+        :param writer:
+        :return:
+        """
+        self._connections.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), self.keep_alive_timeout)
+                except HttpError as error:
+                    await self.write_response(writer, error.status, {'error': error.message}, keep_alive=False)
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                if request is None:
+                    break
+
+                keep_alive = request.keep_alive
+                try:
+                    body = await self.dispatch(request)
+                    status = HTTPStatus.OK
+                except HttpError as error:
+                    (status, body) = (error.status, {'error': error.message})
+                except Exception:  # pylint: disable=broad-except
+                    # Unexpected errors of the workers, e.g. a broken process pool, are not sent to the client
+                    (status, body) = (HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal error'})
+                await self.write_response(writer, status, body, keep_alive)
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def write_response(writer: asyncio.StreamWriter,
+                             status: HTTPStatus,
+                             body: Dict[str, Any],
+                             keep_alive: bool) -> None:
+        """
+        Write a JSON response
+
+        :param writer:
+        :param status:
+        :param body: Object serialized as JSON
+        :param keep_alive: If the connection is kept open after the response
+        :return:
+        """
+        content = json.dumps(body).encode('utf-8')
+        headers = ['HTTP/1.1 {} {}'.format(status.value, status.phrase),
+                   'Content-Type: application/json',
+                   'Content-Length: {}'.format(len(content)),
+                   'Connection: {}'.format('keep-alive' if keep_alive else 'close')]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            headers.append('Retry-After: 1')
+        writer.write('\r\n'.join(headers).encode('latin-1') + b'\r\n\r\n' + content)
+        await writer.drain()
+
+    async def dispatch(self, request: HttpRequest) -> Dict[str, Any]:
+        """
+        Process a request with the handler of its path
+
+        :param request:
+        :raises HttpError: if the request can't be processed
+        :return: Body of the response
+        """
+        if request.path == '/health':
+            if request.method != 'GET':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, 'Use GET')
+            return {'status': 'ok', 'pending': self._batcher.pending if self._batcher else 0}
+
+        if request.path not in ('/interpret', '/validate'):
+            raise HttpError(HTTPStatus.NOT_FOUND, 'Unknown path {}'.format(request.path))
+        if request.method != 'POST':
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, 'Use POST')
+
+        content = self.parse_body(request.body)
+        (numbers, many) = self.parse_numbers(content)
+        if request.path == '/validate':
+            results = [{'number': number, 'valid': self.validator.validate(number)} for number in numbers]
+        else:
+            results = await self.interpret(numbers, bool(content.get('valid_only', False)))
+        return {'results': results} if many else results[0]
+
+    @staticmethod
+    def parse_body(body: bytes) -> Dict[str, Any]:
+        """
+        Parse the JSON object of the body of a request
+
+        :param body:
+        :raises HttpError: if the body is not a JSON object
+        :return:
+        """
+        try:
+            content = json.loads(body)
+        except ValueError as error:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'The body must be a JSON object') from error
+        if not isinstance(content, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'The body must be a JSON object')
+        return content
+
+    @staticmethod
+    def parse_numbers(content: Dict[str, Any]) -> Tuple[List[str], bool]:
+        """
+        Get the numbers of the body of a request, without spaces
+
+        :param content: JSON object with a `number` or a list of `numbers`
+        :raises HttpError: if there are no numbers
+        :return: Numbers and if the request has many numbers
+        """
+        many = 'numbers' in content
+        numbers = content['numbers'] if many else [content.get('number')]
+        if not isinstance(numbers, list) or not numbers or not all(isinstance(number, str) for number in numbers):
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'The body must have a "number" or a list of "numbers"')
+        if len(numbers) > MAX_NUMBERS_PER_REQUEST:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                            'A request can have {} numbers'.format(MAX_NUMBERS_PER_REQUEST))
+        return [''.join(number.split()) for number in numbers], many
+
+    async def interpret(self, numbers: List[str], valid_only: bool) -> List[Dict[str, Any]]:
+        """
+        Submit the numbers to the micro-batches and wait for their results
+
+        :param numbers: Numbers without spaces
+        :param valid_only: If True only the interpretations that are valid phone numbers are included
+        :raises HttpError: if the service is overloaded or the results are not ready in `request_timeout` seconds
+        :return: Results of `batch.interpret_number`
+        """
+        futures = []
+        try:
+            for number in numbers:
+                futures.append(self._batcher.submit((number, valid_only)))
+            return list(await asyncio.wait_for(asyncio.gather(*futures), self.request_timeout))
+        except ServiceOverloadedError as error:
+            for future in futures:
+                future.cancel()
+            raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, str(error)) from error
+        except asyncio.TimeoutError as error:
+            raise HttpError(HTTPStatus.GATEWAY_TIMEOUT,
+                            'The request was not processed in {} seconds'.format(self.request_timeout)) from error
+
+
+class ServiceThread(threading.Thread):
+    """
+    Run an InterpretationService with its own event loop in a background thread, to use it from synchronous code
+
+    Example:
+        $ with ServiceThread(InterpretationService(port=0)) as service_thread:
+        $     urlopen('http://127.0.0.1:{}/health'.format(service_thread.service.port))
+
+    Attributes:
+        service: InterpretationService
+    """
+
+    def __init__(self, service: InterpretationService):
+        super().__init__(daemon=True)
+        self.service = service
+        self._ready = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        try:
+            await self.service.start()
+        except BaseException as error:  # pylint: disable=broad-except
+            self._error = error
+            self._ready.set()
+            await self.service.close()
+            return
+        self._ready.set()
+        await self._stop_event.wait()
+        await self.service.close()
+
+    def start(self) -> None:
+        """
+        Start the thread and wait until the service is listening
+
+        :raises Exception: the error of the service if it can't be started
+        :return:
+        """
+        super().start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        """
+        Close the service and wait for the thread
+
+        :return:
+        """
+        if self.is_alive() and self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
+        self.join()
+
+    def __enter__(self) -> 'ServiceThread':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments of the service
+
+    :param argv: Command line arguments, after `serve`
+    :return:
+    """
+    parser = argparse.ArgumentParser(prog='python -m phone_number_interpreter serve',
+                                     description='HTTP service to interpret and validate numbers')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='Address where the service listens')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port where the service listens')
+    parser.add_argument('--workers', type=non_negative_int, default=1,
+                        help='Number of processes used to process the numbers, 0 to use one per CPU')
+    parser.add_argument('--batch-size', type=positive_int, default=DEFAULT_BATCH_SIZE,
+                        help='Maximum numbers of the concurrent requests processed together')
+    parser.add_argument('--batch-delay', type=float, default=DEFAULT_BATCH_DELAY * 1000,
+                        help='Milliseconds that a batch waits for the numbers of other requests')
+    parser.add_argument('--max-pending', type=positive_int, default=DEFAULT_MAX_PENDING,
+                        help='Maximum numbers waiting to be processed, the requests over it are rejected with 503')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_REQUEST_TIMEOUT,
+                        help='Seconds to process a request, the requests over it are answered with 504')
+    parser.add_argument('--max-interpretations', type=positive_int, default=None,
+                        help='Reject the numbers with more possible interpretations than this value')
+    parser.add_argument('--truncate', action='store_true',
+                        help='Include only --max-interpretations interpretations, instead of rejecting the number')
+    return parser.parse_args(argv)
+
+
+def print_address(service: InterpretationService) -> None:
+    """
+    Write to stderr the address where a started service listens, with the port that was bound
+
+    :param service:
+    :return:
+    """
+    print('Listening on http://{}:{}'.format(service.host, service.port), file=sys.stderr, flush=True)
+
+
+def run(argv: Optional[List[str]] = None) -> None:
+    """
+    Start point of the service, it runs until it is interrupted
+
+    :param argv: Command line arguments after `serve`, if not provided `sys.argv[2:]` is used
+    :return:
+    """
+    arguments = parse_arguments(sys.argv[2:] if argv is None else argv)
+    service = InterpretationService(host=arguments.host,
+                                    port=arguments.port,
+                                    workers=arguments.workers,
+                                    interpreter=NaturalNumbersInterpreter(
+                                        max_interpretations=arguments.max_interpretations,
+                                        truncate=arguments.truncate),
+                                    batch_size=arguments.batch_size,
+                                    batch_delay=arguments.batch_delay / 1000,
+                                    max_pending=arguments.max_pending,
+                                    request_timeout=arguments.timeout)
+    try:
+        asyncio.run(service.serve_forever(print_address))
+    except KeyboardInterrupt:
+        pass
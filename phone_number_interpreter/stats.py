@@ -0,0 +1,160 @@
+"""
+Module with the statistics collected while the numbers are interpreted, to find where the time goes.
+
+The statistics are only collected when an InterpretationStats is provided, the code instrumented checks if it is
+ None once per phase, so the overhead is minimal when they are disabled.
+
+Phases:
+    segmentation: Search of the possible interpretations of the number (`create_possible_interpretations`)
+    generation: Generation of the interpretations from the possible interpretations
+    validation: Validation of the interpretations as phone numbers
+    printing: Format and print of the interpretations
+
+Counters:
+    numbers: Numbers interpreted
+    possible_interpretations: PossibleInterpretation objects created
+    prefix_rebuilds: Exclusive ambiguities, that create possible interpretations from the states before them
+    raw_interpretations: Interpretations generated by each PossibleInterpretation, including the duplicates
+    interpretations: Unique interpretations generated
+    validator_calls: Calls to `PhoneValidator.validate`
+    validator_prefix_checks: Calls to `PhoneValidator.could_be_valid`
+
+Classes:
+    InterpretationStats
+"""
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Type, TypeVar
+from phone_number_interpreter.phone_number_validator import PhoneValidator
+
+
+Item = TypeVar('Item')
+
+
+class InterpretationStats:
+    """
+    Timings per phase and counters collected while the numbers are interpreted
+
+    Example:
+        $ stats = InterpretationStats()
+        $ interpreter = NaturalNumbersInterpreter(stats=stats)
+        $ interpretations = list(interpreter.iter_interpretations('2336'))
+        $ stats.counters['interpretations']
+        $ 5
+
+    Attributes:
+        counters: Counters by name
+        timings: Seconds by phase
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self.timings: Dict[str, float] = defaultdict(float)
+
+    def add(self, counter: str, value: int = 1) -> None:
+        """
+        Increase a counter
+
+        :param counter:
+        :param value:
+        :return:
+        """
+        self.counters[counter] += value
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """
+        Add time to a phase
+
+        :param phase:
+        :param seconds:
+        :return:
+        """
+        self.timings[phase] += seconds
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """
+        Context manager that adds the time of its block to a phase
+
+        :param phase:
+        :return:
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] += time.perf_counter() - start_time
+
+    def timed_iter(self, phase: str, iterable: Iterable[Item], counter: Optional[str] = None) -> Iterator[Item]:
+        """
+        Iterate `iterable` adding the time used to get each item to a phase, the time used by the consumer of the
+         items is not included
+
+        :param phase:
+        :param iterable:
+        :param counter: Counter increased by each item, if provided
+        :return:
+        """
+        iterator = iter(iterable)
+        while True:
+            start_time = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.timings[phase] += time.perf_counter() - start_time
+                return
+            self.timings[phase] += time.perf_counter() - start_time
+            if counter:
+                self.counters[counter] += 1
+            yield item
+
+    def counting_validator(self, validator: Type[PhoneValidator]) -> Type[PhoneValidator]:
+        """
+        Create a PhoneValidator that counts the calls to `validator`
+
+        :param validator: PhoneValidator
+        :return: Subclass of `validator` that counts its calls
+        """
+        stats = self
+
+        class CountingValidator(validator):  # type: ignore
+            """PhoneValidator that counts the calls to the validator"""
+
+            @staticmethod
+            def validate(text_number: str) -> bool:
+                stats.counters['validator_calls'] += 1
+                return validator.validate(text_number)
+
+            @classmethod
+            def validate_many(cls, numbers):
+                stats.counters['validator_calls'] += len(numbers)
+                return validator.validate_many(numbers)
+
+            @classmethod
+            def could_be_valid(cls, prefix: str, min_len: int, max_len: int) -> bool:
+                stats.counters['validator_prefix_checks'] += 1
+                return validator.could_be_valid(prefix, min_len, max_len)
+
+        return CountingValidator
+
+    def as_dict(self) -> Dict[str, Dict]:
+        """
+        Statistics as a dict that can be serialized as JSON
+
+        :return: Dict with the `timings_ms` by phase and the `counters`
+        """
+        return {'timings_ms': {phase: round(seconds * 1000, 3) for (phase, seconds) in self.timings.items()},
+                'counters': dict(self.counters)}
+
+    def format(self) -> str:
+        """
+        Format the statistics as text, one line per phase and counter
+
+        :return:
+        """
+        lines = ['Timings:']
+        lines.extend('  {:<24} {:>10.3f} ms'.format(phase, seconds * 1000) for (phase, seconds) in self.timings.items())
+        lines.append('Counters:')
+        lines.extend('  {:<24} {:>10}'.format(counter, value) for (counter, value) in self.counters.items())
+        return '\n'.join(lines)
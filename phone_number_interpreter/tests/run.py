@@ -5,8 +5,24 @@ Attributes:
     run.run_tests(): Function to run the tests
 """
 import unittest
+import phone_number_interpreter.tests.test_ambiguity_rules as test_ambiguity_rules
+import phone_number_interpreter.tests.test_batch as test_batch
+import phone_number_interpreter.tests.test_benchmarks as test_benchmarks
+import phone_number_interpreter.tests.test_bulk_reader as test_bulk_reader
+import phone_number_interpreter.tests.test_byte_interpreter as test_byte_interpreter
+import phone_number_interpreter.tests.test_cache as test_cache
+import phone_number_interpreter.tests.test_contacts_index as test_contacts_index
+import phone_number_interpreter.tests.test_incremental_interpreter as test_incremental_interpreter
+import phone_number_interpreter.tests.test_interpretation_graph as test_interpretation_graph
+import phone_number_interpreter.tests.test_interpretation_scorer as test_interpretation_scorer
 import phone_number_interpreter.tests.test_natural_numbers_interpreter as test_natural_numbers_interpreter
+import phone_number_interpreter.tests.test_numbering_plan_trie as test_numbering_plan_trie
+import phone_number_interpreter.tests.test_persistent_cache as test_persistent_cache
 import phone_number_interpreter.tests.test_phone_number_validator as test_phone_number_validator
+import phone_number_interpreter.tests.test_pipeline as test_pipeline
+import phone_number_interpreter.tests.test_server as test_server
+import phone_number_interpreter.tests.test_startup as test_startup
+import phone_number_interpreter.tests.test_stats as test_stats
 
 
 def run_tests():
@@ -22,6 +38,22 @@ def run_tests():
     # add tests to the test suite
     suite.addTests(loader.loadTestsFromModule(test_natural_numbers_interpreter))
     suite.addTests(loader.loadTestsFromModule(test_phone_number_validator))
+    suite.addTests(loader.loadTestsFromModule(test_batch))
+    suite.addTests(loader.loadTestsFromModule(test_cache))
+    suite.addTests(loader.loadTestsFromModule(test_benchmarks))
+    suite.addTests(loader.loadTestsFromModule(test_stats))
+    suite.addTests(loader.loadTestsFromModule(test_server))
+    suite.addTests(loader.loadTestsFromModule(test_persistent_cache))
+    suite.addTests(loader.loadTestsFromModule(test_numbering_plan_trie))
+    suite.addTests(loader.loadTestsFromModule(test_incremental_interpreter))
+    suite.addTests(loader.loadTestsFromModule(test_interpretation_graph))
+    suite.addTests(loader.loadTestsFromModule(test_contacts_index))
+    suite.addTests(loader.loadTestsFromModule(test_interpretation_scorer))
+    suite.addTests(loader.loadTestsFromModule(test_bulk_reader))
+    suite.addTests(loader.loadTestsFromModule(test_ambiguity_rules))
+    suite.addTests(loader.loadTestsFromModule(test_startup))
+    suite.addTests(loader.loadTestsFromModule(test_byte_interpreter))
+    suite.addTests(loader.loadTestsFromModule(test_pipeline))
 
     # initialize a runner, pass it your suite and run it
     runner = unittest.TextTestRunner(verbosity=3)
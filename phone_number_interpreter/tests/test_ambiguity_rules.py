@@ -0,0 +1,163 @@
+"""Tests for ambiguity_rules module"""
+import itertools
+import unittest
+from phone_number_interpreter import ambiguity_tables
+from phone_number_interpreter.ambiguity_rules import DEFAULT_AMBIGUITY_RULES, AmbiguityRule, AmbiguityTransducer, \
+    render_tables
+from phone_number_interpreter.incremental_interpreter import IncrementalInterpreter
+from phone_number_interpreter.interpretation_graph import InterpretationGraph
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES, build_language_ambiguities_dict
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+
+
+def hard_coded_last_index(text_number: str, index: int):
+    """
+    Last index of the ambiguity that starts in `index`, with the rules hard-coded: [2-9] followed by [1-9] or by
+     0 + [2-9]
+    """
+    if text_number[index] not in '23456789' or index + 1 >= len(text_number):
+        return None
+    if text_number[index + 1] in '123456789':
+        return index + 1
+    if text_number[index + 1] == '0' and index + 2 < len(text_number) and text_number[index + 2] in '23456789':
+        return index + 2
+    return None
+
+
+class TestAmbiguityTransducer(unittest.TestCase):
+    """Test AmbiguityTransducer"""
+
+    def test_default_rules(self):
+        """
+        Test the transducer of the default rules finds the same ambiguities as the hard-coded rules, for all the
+         numbers of 4 digits and all their indexes
+        :return:
+        """
+        # Data
+        transducer = AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES)
+        ambiguities = transducer.ambiguities()
+
+        for digits in itertools.product('0123456789', repeat=4):
+            text_number = ''.join(digits)
+            for index in range(len(text_number)):
+                # When
+                last_index = transducer.match(text_number, index)
+
+                # Then
+                self.assertEqual(last_index, hard_coded_last_index(text_number, index), (text_number, index))
+                if last_index is not None:
+                    ambiguity = text_number[index:last_index + 1]
+                    self.assertEqual(transducer.replace(ambiguity), ambiguities[ambiguity])
+
+    def test_replacements(self):
+        """
+        Test the replacements of the default rules add or remove the '0'
+        :return:
+        """
+        # Data
+        transducer = AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES)
+
+        # When
+        ambiguities = transducer.ambiguities()
+
+        # Then
+        self.assertEqual(ambiguities['25'], '205')
+        self.assertEqual(ambiguities['205'], '25')
+        self.assertNotIn('201', ambiguities)
+        self.assertEqual(len(ambiguities), 8 * 9 + 8 * 8)
+        self.assertEqual(transducer.max_length, 3)
+        with self.assertRaises(KeyError):
+            transducer.replace('20')
+
+    def test_invalid_rules(self):
+        """
+        Test the rules that the interpreter doesn't support are rejected when they are compiled
+        :return:
+        """
+        # Data
+        invalid_rule_sets = [
+            # Overlapping ambiguities, '25' and '250'
+            [AmbiguityRule('[2-9][1-9]', '{0}0{1}'), AmbiguityRule('[2-9][1-9]0', '{0}0{1}{2}')],
+            # The replacement doesn't add or remove a '0' after the first number
+            [AmbiguityRule('[2-9][1-9]', '{1}{0}')],
+            # The replacement has a single number
+            [AmbiguityRule('55', '5')],
+            [AmbiguityRule('[1-9]0', '{0}')],
+            # Ambiguities too long
+            [AmbiguityRule('[2-9]00[2-9]', '{0}{3}')],
+            # Invalid pattern
+            [AmbiguityRule('[2-9]x', '{0}0{1}')],
+        ]
+
+        for rules in invalid_rule_sets:
+            # When/Then
+            with self.assertRaises(ValueError):
+                AmbiguityTransducer(rules)
+
+    def test_precomputed_tables(self):
+        """
+        Test the precomputed tables are the tables of the default rules, and they are frozen
+        :return:
+        """
+        # Data
+        with open(ambiguity_tables.__file__, encoding='utf-8') as tables_file:
+            tables_source = tables_file.read()
+
+        # When
+        source = render_tables(AmbiguityTransducer(DEFAULT_AMBIGUITY_RULES))
+
+        # Then
+        self.assertEqual(source, tables_source, 'Run python -m phone_number_interpreter.ambiguity_rules')
+        self.assertEqual(dict(LANGUAGE_AMBIGUITIES), build_language_ambiguities_dict())
+        with self.assertRaises(TypeError):
+            LANGUAGE_AMBIGUITIES['11'] = '101'  # type: ignore
+
+
+class TestInterpreterWithRules(unittest.TestCase):
+    """Test NaturalNumbersInterpreter with the transducer of other rules"""
+
+    def test_same_as_default_tables(self):
+        """
+        Test the default rules written digit by digit find the same interpretations as the precomputed tables, for all
+         the numbers up to 5 digits with the digits 0 to 3 and 5
+        :return:
+        """
+        # Data
+        rules = [AmbiguityRule(first + '[1-9]', '{0}0{1}') for first in '23456789'] + \
+            [AmbiguityRule(first + '0[2-9]', '{0}{2}') for first in '23456789']
+        interpreter = NaturalNumbersInterpreter(transducer=AmbiguityTransducer(rules))
+        default_interpreter = NaturalNumbersInterpreter()
+
+        for length in range(1, 6):
+            for digits in itertools.product('01235', repeat=length):
+                input_number = ''.join(digits)
+
+                # When
+                result = list(interpreter.iter_interpretations(input_number))
+
+                # Then
+                self.assertEqual(result, list(default_interpreter.iter_interpretations(input_number)), input_number)
+
+    def test_other_rules(self):
+        """
+        Test the interpreter only finds the ambiguities of the rules of its transducer, and uses their replacements
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter(transducer=AmbiguityTransducer([AmbiguityRule('[2-5][1-9]',
+                                                                                              '{0}0{1}')]))
+
+        # When
+        interpretations = interpreter.get_all_possible_interpretations_of_number('2052')
+        graph = InterpretationGraph.from_number('6532', interpreter)
+        incremental_interpreter = IncrementalInterpreter(interpreter)
+        for digit in '6532':
+            incremental_interpreter.feed(digit)
+
+        # Then
+        self.assertEqual(interpretations, {'2052', '20502'})
+        self.assertEqual(set(graph), {'6532', '65032', '65302'})
+        self.assertIn('65302', graph)
+        self.assertNotIn('60532', graph)
+        self.assertEqual(interpreter.count_interpretations('6532'), 3)
+        self.assertEqual(incremental_interpreter.finish(), interpreter.create_possible_interpretations('6532'))
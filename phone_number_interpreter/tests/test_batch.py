@@ -0,0 +1,186 @@
+"""Tests for batch module"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from phone_number_interpreter.cache import LRUCache
+from phone_number_interpreter.batch import BLOCKS_IN_FLIGHT, interpret_many, interpret_number, iter_input_numbers, \
+    parse_arguments, run, run_batch
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+class TestBatch(unittest.TestCase):
+    """batch module tests"""
+
+    def test_interpret_number(self):
+        """
+        Test interpret_number
+        :return:
+        """
+        # Data
+        input_number = '2336'
+        expected_interpretations = [{'number': number, 'valid': False}
+                                    for number in ['2336', '23306', '23036', '20336', '203306']]
+
+        # When
+        result = interpret_number(input_number, NaturalNumbersInterpreter(), GreekPhoneNumberValidator)
+
+        # Then
+        self.assertEqual(result['input'], input_number)
+        self.assertCountEqual(result['interpretations'], expected_interpretations)
+        self.assertIn('time_ms', result)
+
+    def test_interpret_number_errors(self):
+        """
+        Test interpret_number for invalid numbers and numbers with too many interpretations
+        :return:
+        """
+        # When
+        invalid_result = interpret_number('23a6', NaturalNumbersInterpreter(), GreekPhoneNumberValidator)
+        too_many_result = interpret_number('2336', NaturalNumbersInterpreter(max_interpretations=2),
+                                           GreekPhoneNumberValidator)
+
+        # Then
+        self.assertNotIn('interpretations', invalid_result)
+        self.assertIn('error', invalid_result)
+        self.assertNotIn('interpretations', too_many_result)
+        self.assertIn('error', too_many_result)
+
+    def test_interpret_number_cache(self):
+        """
+        Test interpret_number reuses the results stored in the cache
+        :return:
+        """
+        # Data
+        cache = LRUCache(capacity=10)
+        interpreter = NaturalNumbersInterpreter()
+
+        # When
+        first_result = interpret_number('2336', interpreter, GreekPhoneNumberValidator, cache=cache)
+        second_result = interpret_number('2336', interpreter, GreekPhoneNumberValidator, cache=cache)
+        valid_only_result = interpret_number('2336', interpreter, GreekPhoneNumberValidator, valid_only=True,
+                                             cache=cache)
+
+        # Then
+        self.assertEqual(first_result['interpretations'], second_result['interpretations'])
+        self.assertEqual(valid_only_result['interpretations'], [])
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (1, 2))
+
+    def test_iter_input_numbers(self):
+        """
+        Test iter_input_numbers
+        :return:
+        """
+        # Data
+        lines = ['0030 69 70 24 13 52\n', '\n', '  \n', '2336']
+
+        # When
+        result = list(iter_input_numbers(lines))
+
+        # Then
+        self.assertEqual(result, ['00306970241352', '2336'])
+
+    def test_interpret_many(self):
+        """
+        Test interpret_many keeps the order of the numbers, in the current process and in a pool of processes, with
+        and without cache
+        :return:
+        """
+        # Data
+        numbers = ['2336', '23a6', '00306970241352', '2970241352', '23456'] * 5
+
+        for (workers, cache) in [(1, None), (2, None), (1, LRUCache(2)), (2, LRUCache(2))]:
+            # When
+            results = list(interpret_many(numbers, workers=workers, chunksize=3, cache=cache))
+
+            # Then
+            self.assertEqual([result['input'] for result in results], numbers)
+            self.assertEqual([len(result.get('interpretations', [])) for result in results], [5, 0, 45, 33, 7] * 5)
+
+    def test_interpret_many_bounded(self):
+        """
+        Test interpret_many with a pool of processes only reads the numbers of the blocks in flight, not the whole input
+        :return:
+        """
+        # Data
+        read_numbers = []
+
+        def numbers():
+            for index in range(10000):
+                read_numbers.append(index)
+                yield '2336'
+
+        # When
+        results = interpret_many(numbers(), workers=2, chunksize=3)
+        first_result = next(results)
+        read_count = len(read_numbers)
+        results.close()
+
+        # Then
+        self.assertEqual(first_result['input'], '2336')
+        self.assertLessEqual(read_count, 3 * 2 * (BLOCKS_IN_FLIGHT + 1))
+
+    def test_interpret_many_invalid_arguments(self):
+        """
+        Test interpret_many and the command line reject a negative number of workers and a chunk size lower than 1
+        :return:
+        """
+        # When/Then
+        for (workers, chunksize) in [(-1, 3), (2, 0), (1, -1)]:
+            with self.assertRaises(ValueError):
+                list(interpret_many(['2336'], workers=workers, chunksize=chunksize))
+
+        with mock.patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit):
+                parse_arguments(['numbers.txt', '--workers', '-1'])
+        self.assertEqual(parse_arguments(['numbers.txt', '--workers', '0']).workers, 0)
+
+    def test_run_batch(self):
+        """
+        Test run_batch writes one JSON line per number
+        :return:
+        """
+        # Data
+        lines = io.StringIO('0030 69 70 24 13 52\n\n2336\n')
+        output = io.StringIO()
+
+        # When
+        processed_numbers = run_batch(lines, output, NaturalNumbersInterpreter(), GreekPhoneNumberValidator,
+                                      valid_only=True)
+
+        # Then
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(processed_numbers, 2)
+        self.assertEqual([result['input'] for result in results], ['00306970241352', '2336'])
+        self.assertCountEqual([interpretation['number'] for interpretation in results[0]['interpretations']],
+                              ['00306972401352', '00306972413052', '00306970241352', '00306972413502'])
+        self.assertEqual(results[1]['interpretations'], [])
+
+    def test_run_keeps_output(self):
+        """
+        Test an interrupted run doesn't modify the existing output file, and a finished run replaces it
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Data
+            input_path = os.path.join(directory, 'numbers.txt')
+            output_path = os.path.join(directory, 'results.jsonl')
+            with open(input_path, 'w', encoding='utf-8') as input_file:
+                input_file.write('2336\n234\n')
+            with open(output_path, 'w', encoding='utf-8') as output_file:
+                output_file.write('previous results\n')
+
+            # When/Then
+            with mock.patch('phone_number_interpreter.batch.write_results', side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    run([input_path, '-o', output_path])
+            with open(output_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'previous results\n')
+
+            run([input_path, '-o', output_path])
+            with open(output_path, encoding='utf-8') as output_file:
+                self.assertEqual([json.loads(line)['input'] for line in output_file], ['2336', '234'])
+            self.assertEqual(sorted(os.listdir(directory)), ['numbers.txt', 'results.jsonl'])
@@ -0,0 +1,84 @@
+"""Tests for benchmarks module"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from dataclasses import asdict
+from unittest import mock
+from phone_number_interpreter.benchmarks import ambiguous_run, compare_results, greek_numbers, parse_arguments, \
+    percentile, run, run_benchmarks, zero_padded
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+class TestBenchmarks(unittest.TestCase):
+    """benchmarks module tests"""
+
+    def test_input_families(self):
+        """
+        Test the families of numbers have the requested length and count
+        :return:
+        """
+        for build_numbers in [ambiguous_run, zero_padded, greek_numbers]:
+            for length in [10, 14]:
+                # When
+                numbers = build_numbers(length, 5)
+
+                # Then
+                self.assertEqual(len(numbers), 5)
+                self.assertTrue(all(len(number) == length and number.isdigit() for number in numbers))
+
+        self.assertTrue(all(map(GreekPhoneNumberValidator.validate, greek_numbers(10, 5) + greek_numbers(14, 5))))
+
+    def test_percentile(self):
+        """
+        Test percentile
+        :return:
+        """
+        # Data
+        values = [float(value) for value in range(1, 101)]
+
+        # When/Then
+        self.assertEqual(percentile(values, 0.5), 51.0)
+        self.assertEqual(percentile(values, 0.99), 100.0)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_run_benchmarks_and_compare(self):
+        """
+        Test run_benchmarks returns a result per family and length, and compare_results with itself
+        :return:
+        """
+        # When
+        results = run_benchmarks(lengths=[4, 6], count=2)
+        comparison = compare_results(results, {'results': [asdict(result) for result in results]})
+
+        # Then
+        self.assertEqual([result.key for result in results],
+                         ['ambiguous_run/4', 'ambiguous_run/6', 'zero_padded/4', 'zero_padded/6', 'greek_10/10',
+                          'greek_14/14', 'batch/14'])
+        self.assertEqual(results[-1].numbers, 12)
+        self.assertTrue(all(result.interpretations > 0 for result in results))
+        self.assertEqual(len(comparison), len([result for result in results if result.p50_ms]))
+        self.assertIn('throughput x1.00', comparison[0])
+
+    def test_run_output(self):
+        """
+        Test run() writes the results to the -o file without leaving temporary files, and rejects a --count of 0
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            # Data
+            output_path = os.path.join(directory, 'baseline.json')
+
+            # When
+            with mock.patch('sys.stdout', io.StringIO()):
+                run(['--lengths', '4', '--count', '2', '-o', output_path])
+
+            # Then
+            with open(output_path, encoding='utf-8') as output_file:
+                self.assertEqual(len(json.load(output_file)['results']), 5)
+            self.assertEqual(os.listdir(directory), ['baseline.json'])
+
+        with mock.patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit):
+                parse_arguments(['--count', '0'])
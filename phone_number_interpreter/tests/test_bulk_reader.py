@@ -0,0 +1,104 @@
+"""Tests for bulk_reader module"""
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from phone_number_interpreter.batch import iter_input_numbers
+from phone_number_interpreter.bulk_reader import iter_mapped_numbers, parse_shard, shard_ranges, MappedInput
+
+
+class TestBulkReader(unittest.TestCase):
+    """Test MappedInput and iter_mapped_numbers"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'numbers.txt')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_same_numbers_as_lines(self):
+        """
+        Test iter_mapped_numbers() returns the same numbers as iter_input_numbers() with the lines of the file
+        :return:
+        """
+        # Data
+        text = '20 060 04 0 08\n\n  2336\r\n\t0 0 30 69 70 24 1 3 50 2  \n   \n23a6\n2106930664'
+
+        # When
+        numbers = list(iter_mapped_numbers(text.encode()))
+
+        # Then
+        self.assertEqual(numbers, list(iter_input_numbers(text.splitlines())))
+
+    def test_ascii_whitespace(self):
+        """
+        Test iter_mapped_numbers() removes all the ASCII whitespace that str.split() removes in iter_input_numbers()
+        :return:
+        """
+        # Data
+        whitespace = [chr(code) for code in range(128) if chr(code).isspace() and chr(code) != '\n']
+        text = '\n'.join('2{}3{}6'.format(character, character * 2) for character in whitespace) + '\n' + \
+            ''.join(whitespace) + '\n'
+
+        # When
+        numbers = list(iter_mapped_numbers(text.encode()))
+
+        # Then
+        self.assertEqual(numbers, list(iter_input_numbers(text.split('\n'))))
+        self.assertEqual(numbers, ['236'] * len(whitespace))
+
+    def test_shards(self):
+        """
+        Test the shards of a file read all its numbers once and in order, for any number of shards and size of the
+         blocks
+        :return:
+        """
+        # Data
+        digits = random.Random(0)
+        lines = [' '.join(digits.choice(['2', '30', '69', '0', '']) for _ in range(digits.randint(0, 6)))
+                 for _ in range(200)]
+        with open(self.path, 'w') as input_file:
+            input_file.write('\n'.join(lines))
+        expected_numbers = list(iter_input_numbers(lines))
+
+        with MappedInput(self.path) as mapped_input:
+            for block_size in [1, 7, 1 << 20]:
+                for shards in [1, 2, 3, 7, 64, 5000]:
+                    # When
+                    with mock.patch('phone_number_interpreter.bulk_reader.BLOCK_SIZE', block_size):
+                        numbers = [number for (start, end) in mapped_input.shard_ranges(shards)
+                                   for number in mapped_input.iter_numbers(start, end)]
+
+                    # Then
+                    self.assertEqual(numbers, expected_numbers, (block_size, shards))
+
+    def test_empty_file(self):
+        """
+        Test an empty file has no numbers
+        :return:
+        """
+        # Data
+        open(self.path, 'w').close()
+
+        # When
+        with MappedInput(self.path) as mapped_input:
+            numbers = list(mapped_input.iter_numbers())
+
+        # Then
+        self.assertEqual(numbers, [])
+
+    def test_parse_shard(self):
+        """
+        Test parse_shard() and shard_ranges() reject the invalid shards
+        :return:
+        """
+        # When/Then
+        self.assertEqual(parse_shard('1/4'), (1, 4))
+        self.assertEqual(shard_ranges(10, 3), [(0, 3), (3, 6), (6, 10)])
+        for shard in ['4/4', '-1/4', '1', 'a/4', '1/2/3']:
+            with self.assertRaises(ValueError):
+                parse_shard(shard)
+        with self.assertRaises(ValueError):
+            shard_ranges(10, 0)
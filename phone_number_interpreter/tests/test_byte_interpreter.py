@@ -0,0 +1,94 @@
+"""Tests for byte_interpreter module"""
+import random
+import unittest
+from phone_number_interpreter.byte_interpreter import ambiguity_lengths, write_interpretations
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+
+
+class TestByteInterpreter(unittest.TestCase):
+    """Test write_interpretations() and its tables"""
+
+    def test_same_interpretations(self):
+        """
+        Test write_interpretations() writes the interpretations of NaturalNumbersInterpreter().iter_interpretations(),
+         in the same order, for bytes, bytearray and memoryview
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        digits = random.Random(0)
+        output = bytearray()
+        for _ in range(500):
+            text_number = ''.join(digits.choice('0023456789') for _ in range(digits.randint(1, 12)))
+            expected = list(interpreter.iter_interpretations(text_number))
+            for data in [text_number.encode('ascii'), bytearray(text_number.encode('ascii')),
+                         memoryview(text_number.encode('ascii'))]:
+                del output[:]
+
+                # When
+                count = write_interpretations(data, output)
+
+                # Then
+                self.assertEqual(output.decode('ascii').split('\n')[:-1], expected)
+                self.assertEqual(count, len(expected))
+
+    def test_reused_output(self):
+        """
+        Test write_interpretations() adds the interpretations to the end of the output with the separator
+        :return:
+        """
+        # Data
+        output = bytearray(b'2106930664;')
+
+        # When
+        count = write_interpretations(b'2336', output, separator=b';')
+
+        # Then
+        self.assertEqual(count, 5)
+        self.assertEqual(bytes(output), b'2106930664;2336;23306;23036;20336;203306;')
+
+    def test_non_contiguous_view(self):
+        """
+        Test write_interpretations() accepts the memoryviews that are not contiguous, like a slice with a step
+        :return:
+        """
+        # Data
+        output = bytearray()
+        data = memoryview(bytearray(b'2-3-3-6'))[::2]
+
+        # When
+        count = write_interpretations(data, output)
+
+        # Then
+        self.assertEqual(count, 5)
+        self.assertEqual(bytes(output), b'2336\n23306\n23036\n20336\n203306\n')
+        with self.assertRaises(ValueError):
+            write_interpretations(memoryview(b'2-a-3-6')[::2], output)
+
+    def test_ambiguity_lengths(self):
+        """
+        Test ambiguity_lengths() finds the ambiguities of the number by their bytes
+        :return:
+        """
+        # Data
+        data = memoryview(b'2053020')
+
+        # When
+        lengths = ambiguity_lengths(data)
+
+        # Then
+        self.assertEqual(lengths, [3, 0, 2, 3, 0, 0, 0])
+
+    def test_invalid_numbers(self):
+        """
+        Test write_interpretations() rejects the numbers with non numeric bytes, and doesn't write them
+        :return:
+        """
+        # Data
+        output = bytearray()
+
+        # When/Then
+        for data in [b'', b'23a6', b'23 36', '٢٣'.encode('utf-8')]:
+            with self.assertRaises(ValueError):
+                write_interpretations(data, output)
+        self.assertEqual(output, bytearray())
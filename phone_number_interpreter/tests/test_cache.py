@@ -0,0 +1,99 @@
+"""Tests for cache module"""
+import pickle
+import threading
+import unittest
+from phone_number_interpreter.cache import CacheStats, LRUCache
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test LRUCache"""
+
+    def test_get_and_put(self):
+        """
+        Test LRUCache().get() and LRUCache().put() count hits and misses
+        :return:
+        """
+        # Data
+        cache = LRUCache(capacity=2)
+
+        # When
+        cache.put('2336', ('2336', '23306'))
+
+        # Then
+        self.assertEqual(cache.get('2336'), ('2336', '23306'))
+        self.assertIsNone(cache.get('2337'))
+        self.assertEqual(cache.stats(), CacheStats(hits=1, misses=1, evictions=0, size=1, capacity=2))
+        self.assertEqual(cache.stats().hit_rate, 0.5)
+
+    def test_evict_least_recently_used(self):
+        """
+        Test LRUCache evicts the least recently used entry when it is full
+        :return:
+        """
+        # Data
+        cache = LRUCache(capacity=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+
+        # When
+        cache.put('c', 3)
+
+        # Then
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_invalid_capacity(self):
+        """
+        Test LRUCache with a capacity lower than 1
+        :return:
+        """
+        # When/Then
+        with self.assertRaises(ValueError):
+            LRUCache(capacity=0)
+
+    def test_pickle(self):
+        """
+        Test a pickled LRUCache keeps the entries and resets the counters
+        :return:
+        """
+        # Data
+        cache = LRUCache(capacity=2)
+        cache.put('a', 1)
+        cache.get('a')
+
+        # When
+        result = pickle.loads(pickle.dumps(cache))
+
+        # Then
+        self.assertEqual(result.stats(), CacheStats(hits=0, misses=0, evictions=0, size=1, capacity=2))
+        self.assertEqual(result.get('a'), 1)
+
+    def test_shared_between_threads(self):
+        """
+        Test LRUCache counters when it is shared between threads
+        :return:
+        """
+        # Data
+        cache = LRUCache(capacity=50)
+
+        def use_cache():
+            for number in range(1000):
+                if cache.get(number % 100) is None:
+                    cache.put(number % 100, number)
+
+        threads = [threading.Thread(target=use_cache) for _ in range(4)]
+
+        # When
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Then
+        stats = cache.stats()
+        self.assertEqual(stats.hits + stats.misses, 4000)
+        self.assertEqual(stats.size, 50)
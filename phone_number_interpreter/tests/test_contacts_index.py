@@ -0,0 +1,149 @@
+"""Tests for contacts_index module"""
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+from phone_number_interpreter import contacts_index
+from phone_number_interpreter.contacts_index import canonical_form, read_contacts, Contact, ContactsIndex, \
+    MappedContactsIndex
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+
+
+class TestContactsIndex(unittest.TestCase):
+    """Test ContactsIndex and MappedContactsIndex"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'contacts.idx')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_canonical_form_of_interpretations(self):
+        """
+        Test all the interpretations of a number have the canonical form of the number
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        digits = random.Random(0)
+        for _ in range(300):
+            text_number = ''.join(digits.choice('0023456789') for _ in range(digits.randint(1, 12)))
+
+            # When
+            canonical_forms = {canonical_form(interpretation)
+                               for interpretation in interpreter.iter_interpretations(text_number)}
+
+            # Then
+            self.assertEqual(canonical_forms, {canonical_form(text_number)})
+
+    def test_lookup(self):
+        """
+        Test ContactsIndex().lookup() and MappedContactsIndex().lookup() return the contacts whose number is an
+         interpretation of the number, and only them
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        digits = random.Random(1)
+        numbers = [''.join(digits.choice('0023456789') for _ in range(digits.randint(1, 10))) for _ in range(100)]
+        contacts = [Contact(interpretation, 'Contact {}'.format(contact_n))
+                    for (contact_n, interpretation) in
+                    enumerate(interpretation for number in numbers[:50]
+                              for interpretation in interpreter.iter_interpretations(number))]
+        index = ContactsIndex(contacts)
+        index.save(self.path)
+
+        with MappedContactsIndex(self.path) as mapped_index:
+            self.assertEqual(len(mapped_index), len(contacts))
+            for number in numbers:
+                # When
+                found = index.lookup(number)
+                mapped_found = mapped_index.lookup(number)
+
+                # Then
+                interpretations = set(interpreter.iter_interpretations(number))
+                expected = [contact for contact in contacts if contact.number in interpretations]
+                self.assertEqual(sorted(found, key=contacts.index), expected)
+                self.assertEqual(sorted(mapped_found, key=contacts.index), expected)
+
+    def test_lookup_reads_one_group(self):
+        """
+        Test a lookup only reads the contacts with the canonical form of the number
+        :return:
+        """
+        # Data
+        index = ContactsIndex([Contact('00306970241352', 'Alice'), Contact('2106930664', 'Bob'),
+                               Contact('003069702413502', 'Carol')])
+        index.save(self.path)
+
+        with MappedContactsIndex(self.path) as mapped_index:
+            # When
+            candidates = mapped_index.candidates('003069702413502')
+            contacts = mapped_index.lookup('003069702413502')
+
+        # Then
+        self.assertEqual(candidates, [Contact('00306970241352', 'Alice'), Contact('003069702413502', 'Carol')])
+        self.assertEqual(contacts, [Contact('00306970241352', 'Alice'), Contact('003069702413502', 'Carol')])
+        self.assertEqual(index.lookup('2106930664'), [Contact('2106930664', 'Bob')])
+        self.assertEqual(index.lookup('21069306640'), [])
+
+    def test_save_replaces_file(self):
+        """
+        Test ContactsIndex().save() keeps the previous index file when the save is interrupted, and doesn't affect
+         an index mapped from the previous file when it replaces it
+        :return:
+        """
+        # Data
+        ContactsIndex([Contact('2106930664', 'Bob')]).save(self.path)
+        index = ContactsIndex([Contact('00306970241352', 'Alice')])
+
+        with MappedContactsIndex(self.path) as mapped_index:
+            # When
+            with mock.patch.object(contacts_index, 'RECORD', mock.Mock(pack=mock.Mock(side_effect=KeyboardInterrupt))):
+                with self.assertRaises(KeyboardInterrupt):
+                    index.save(self.path)
+
+            # Then
+            self.assertEqual(os.listdir(self.directory.name), ['contacts.idx'])
+            with MappedContactsIndex(self.path) as previous_index:
+                self.assertEqual(previous_index.lookup('2106930664'), [Contact('2106930664', 'Bob')])
+
+            # When
+            index.save(self.path)
+
+            # Then
+            self.assertEqual(os.listdir(self.directory.name), ['contacts.idx'])
+            self.assertEqual(mapped_index.lookup('2106930664'), [Contact('2106930664', 'Bob')])
+            with MappedContactsIndex(self.path) as saved_index:
+                self.assertEqual(saved_index.lookup('00306970241352'), [Contact('00306970241352', 'Alice')])
+
+    def test_read_contacts(self):
+        """
+        Test read_contacts() normalizes the numbers and rejects the invalid ones
+        :return:
+        """
+        # Data
+        lines = ['+30 697 024 1352,Alice\n', '\n', '(210) 693-0664\n']
+
+        # When
+        contacts = list(read_contacts(lines))
+
+        # Then
+        self.assertEqual(contacts, [Contact('00306970241352', 'Alice'), Contact('2106930664', '')])
+        with self.assertRaises(ValueError):
+            list(read_contacts(['2106930a64,Bob']))
+
+    def test_invalid_index_file(self):
+        """
+        Test MappedContactsIndex() rejects files that are not a contacts index
+        :return:
+        """
+        # Data
+        with open(self.path, 'wb') as index_file:
+            index_file.write(b'not an index of contacts')
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            MappedContactsIndex(self.path)
@@ -0,0 +1,87 @@
+"""Tests for incremental_interpreter module"""
+import random
+import unittest
+from phone_number_interpreter.incremental_interpreter import IncrementalInterpreter
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+class TestIncrementalInterpreter(unittest.TestCase):
+    """Test IncrementalInterpreter"""
+
+    def test_finish(self):
+        """
+        Test IncrementalInterpreter().finish() returns the same possible interpretations as
+         create_possible_interpretations(), for any split of the number in chunks
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        digits = random.Random(0)
+        for _ in range(500):
+            text_number = ''.join(digits.choice('0123456789') for _ in range(digits.randint(1, 20)))
+            incremental_interpreter = IncrementalInterpreter()
+
+            # When
+            index = 0
+            while index < len(text_number):
+                chunk_length = digits.randint(1, 4)
+                incremental_interpreter.feed(text_number[index:index + chunk_length])
+                index += chunk_length
+            possible_interpretations = incremental_interpreter.finish()
+
+            # Then
+            self.assertEqual(possible_interpretations, interpreter.create_possible_interpretations(text_number))
+
+    def test_counts_of_each_prefix(self):
+        """
+        Test the counts reported after each digit are the counts of the digits received so far
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        text_number = '0030697024130502'
+        incremental_interpreter = IncrementalInterpreter()
+
+        for index in range(len(text_number)):
+            # When
+            incremental_interpreter.feed(text_number[index])
+
+            # Then
+            prefix = text_number[:index + 1]
+            potentially_valid = [interpretation for interpretation in interpreter.iter_interpretations(prefix)
+                                 if GreekPhoneNumberValidator.could_be_valid(interpretation, len(interpretation), 20)]
+            self.assertEqual(incremental_interpreter.count_interpretations(), interpreter.count_interpretations(prefix))
+            self.assertEqual(incremental_interpreter.count_potentially_valid(GreekPhoneNumberValidator),
+                             len(potentially_valid))
+
+    def test_finished_number(self):
+        """
+        Test a finished number counts only the valid phone numbers and it can't receive more digits
+        :return:
+        """
+        # Data
+        incremental_interpreter = IncrementalInterpreter()
+        incremental_interpreter.feed('00306970241352')
+
+        # When
+        incremental_interpreter.finish()
+
+        # Then
+        self.assertEqual(incremental_interpreter.count_potentially_valid(GreekPhoneNumberValidator), 4)
+        with self.assertRaises(ValueError):
+            incremental_interpreter.feed('2')
+
+    def test_invalid_digits(self):
+        """
+        Test IncrementalInterpreter().feed() rejects non numeric characters and an empty number can't be finished
+        :return:
+        """
+        # Data
+        incremental_interpreter = IncrementalInterpreter()
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            incremental_interpreter.feed('2a')
+        with self.assertRaises(ValueError):
+            incremental_interpreter.finish()
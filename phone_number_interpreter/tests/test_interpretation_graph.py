@@ -0,0 +1,64 @@
+"""Tests for interpretation_graph module"""
+import itertools
+import unittest
+from phone_number_interpreter.interpretation_graph import InterpretationGraph
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+
+
+class TestInterpretationGraph(unittest.TestCase):
+    """Test InterpretationGraph"""
+
+    def test_same_interpretations(self):
+        """
+        Test InterpretationGraph generates and counts the same interpretations as iter_interpretations(), in the same
+         order
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        numbers = [''.join(digits) for length in range(1, 7) for digits in itertools.product('0237', repeat=length)]
+        numbers.extend(['00306970241352', '2345678', '232323230232'])
+
+        for text_number in numbers:
+            # When
+            graph = InterpretationGraph.from_number(text_number)
+
+            # Then
+            interpretations = list(interpreter.iter_interpretations(text_number))
+            self.assertEqual(list(graph), interpretations)
+            self.assertEqual(graph.count(), len(interpretations))
+
+    def test_contains(self):
+        """
+        Test InterpretationGraph().contains() accepts the interpretations and rejects the other numbers
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        text_number = '0030697024130502'
+        graph = InterpretationGraph.from_number(text_number)
+        interpretations = set(interpreter.iter_interpretations(text_number))
+        candidates = set(interpretations)
+        for interpretation in interpretations:
+            for index in range(len(interpretation) + 1):
+                candidates.add(interpretation[:index] + interpretation[index + 1:])
+                candidates.add(interpretation[:index] + '0' + interpretation[index:])
+
+        # When/Then
+        for candidate in candidates:
+            self.assertEqual(graph.contains(candidate), candidate in interpretations, candidate)
+        self.assertNotIn(2336, graph)
+
+    def test_compact(self):
+        """
+        Test the graph of a number with many interpretations has few nodes
+        :return:
+        """
+        # When
+        graph = InterpretationGraph.from_number('2' * 40)
+
+        # Then
+        self.assertEqual(graph.count(), NaturalNumbersInterpreter().count_interpretations('2' * 40))
+        self.assertLess(graph.nodes_count, 1000)
+        self.assertIn('202' * 20, graph)
+        self.assertNotIn('20' * 20, graph)
@@ -0,0 +1,37 @@
+"""Tests for interpretation_scorer module"""
+import math
+import unittest
+from phone_number_interpreter.interpretation_scorer import AmbiguityPriorScorer
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+class TestAmbiguityPriorScorer(unittest.TestCase):
+    """Test AmbiguityPriorScorer"""
+
+    def test_scores(self):
+        """
+        Test the scores of the ambiguities use their probability, and the valid phone numbers get the bonus
+        :return:
+        """
+        # Data
+        scorer = AmbiguityPriorScorer({'21': 0.9}, keep_probability=0.75, validator=GreekPhoneNumberValidator)
+
+        # When/Then
+        self.assertAlmostEqual(scorer.ambiguity_score('21', False), math.log(0.9))
+        self.assertAlmostEqual(scorer.ambiguity_score('21', True), math.log(0.1))
+        self.assertAlmostEqual(scorer.ambiguity_score('306', True), math.log(0.25))
+        self.assertEqual(scorer.interpretation_score('2106930664'), 2.0)
+        self.assertEqual(scorer.interpretation_score('21069306640'), 0.0)
+        self.assertEqual(scorer.interpretation_score_bound('21', 10, 12), 2.0)
+        self.assertEqual(scorer.interpretation_score_bound('21', 11, 12), 0.0)
+
+    def test_invalid_probability(self):
+        """
+        Test AmbiguityPriorScorer() rejects the probabilities that are not between 0 and 1
+        :return:
+        """
+        # When/Then
+        with self.assertRaises(ValueError):
+            AmbiguityPriorScorer(keep_probability=1.0)
+        with self.assertRaises(ValueError):
+            AmbiguityPriorScorer({'21': 0.0})
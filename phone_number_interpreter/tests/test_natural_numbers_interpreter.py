@@ -1,6 +1,12 @@
 """Tests for natural_numbers_interpreter module"""
+import itertools
+import random
 import unittest
-from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter, PossibleInterpretation
+from phone_number_interpreter.interpretation_scorer import AmbiguityPriorScorer, InterpretationScorer
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter, PossibleInterpretation, \
+    TooManyInterpretationsError, indexes_mask
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
 
 
 class TestNaturalNumbersInterpreter(unittest.TestCase):
@@ -83,3 +89,350 @@ class TestNaturalNumbersInterpreter(unittest.TestCase):
         result = NaturalNumbersInterpreter().get_all_possible_interpretations_of_number(input_number)
 
         self.assertEqual(result, expected_output)
+
+    def test_create_possible_interpretations_4(self):
+        """
+        Test create_possible_interpretations with consecutive exclusive ambiguities
+        :return:
+        """
+        # Data
+        input_number = '23456'
+        expected_output = [
+            PossibleInterpretation(interpretation_elements=['23', '45', '6'],
+                                   ambiguity_indexes={0, 1, 2, 3}),
+            PossibleInterpretation(interpretation_elements=['2', '34', '56'],
+                                   ambiguity_indexes={1, 2, 3, 4}),
+        ]
+
+        # When
+        result = NaturalNumbersInterpreter().create_possible_interpretations(input_number)
+
+        # Then
+        self.assertEqual(result, expected_output)
+
+    def test_create_possible_interpretations_invalid_number(self):
+        """
+        Test create_possible_interpretations with non numeric characters
+        :return:
+        """
+        # Data
+        test_data = ['23a6', '', '2 3']
+
+        # When/Then
+        for input_number in test_data:
+            with self.assertRaises(ValueError):
+                NaturalNumbersInterpreter().create_possible_interpretations(input_number)
+
+    def test_iter_interpretations(self):
+        """
+        Test iter_interpretations generate each interpretation once, starting with the number without replacements
+        :return:
+        """
+        # Data
+        test_data = [('2336', ['2336', '23306', '20336', '203306', '23036']),
+                     ('23456', ['23456', '234506', '234056', '230456', '2304506', '203456', '2034056'])]
+
+        for (input_number, expected_output) in test_data:
+            # When
+            result = list(NaturalNumbersInterpreter().iter_interpretations(input_number))
+
+            # Then
+            self.assertEqual(result[0], input_number)
+            self.assertEqual(len(result), len(set(result)))
+            self.assertEqual(set(result), set(expected_output))
+
+    def test_count_interpretations(self):
+        """
+        Test count_interpretations
+        :return:
+        """
+        # Data
+        test_data = ['2336', '23456', '2303600333', '2220', '00306970241352', '23232323232323']
+
+        for input_number in test_data:
+            # When
+            result = NaturalNumbersInterpreter().count_interpretations(input_number)
+
+            # Then
+            self.assertEqual(result, len(NaturalNumbersInterpreter().get_all_possible_interpretations_of_number(
+                input_number)))
+
+    def test_max_interpretations_reject(self):
+        """
+        Test the numbers with more interpretations than `max_interpretations` are rejected
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter(max_interpretations=4)
+
+        # When/Then
+        with self.assertRaises(TooManyInterpretationsError) as context:
+            list(interpreter.iter_interpretations('2336'))
+        self.assertEqual(context.exception.count, 5)
+
+        with self.assertRaises(TooManyInterpretationsError):
+            interpreter.get_all_possible_interpretations_of_number('2336')
+
+        self.assertEqual(len(interpreter.get_all_possible_interpretations_of_number('234')), 3)
+
+        for max_interpretations in [0, -1]:
+            with self.assertRaises(ValueError):
+                NaturalNumbersInterpreter(max_interpretations=max_interpretations, truncate=True)
+
+    def test_max_interpretations_truncate(self):
+        """
+        Test the interpretations of the numbers with more interpretations than `max_interpretations` are truncated
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter(max_interpretations=3, truncate=True)
+        all_interpretations = NaturalNumbersInterpreter().get_all_possible_interpretations_of_number('2336')
+
+        # When
+        result = list(interpreter.iter_interpretations('2336'))
+        result_set = interpreter.get_all_possible_interpretations_of_number('2336')
+
+        # Then
+        self.assertEqual(len(result), 3)
+        self.assertEqual(len(result_set), 3)
+        self.assertTrue(result_set.issubset(all_interpretations))
+
+    def test_get_valid_phone_interpretations(self):
+        """
+        Test get_valid_phone_interpretations
+        :return:
+        """
+        # Data
+        test_data = ['0030697024135', '69232323', '00302323232323', '23232323232323232323']
+
+        for input_number in test_data:
+            # When
+            result = NaturalNumbersInterpreter().get_valid_phone_interpretations(input_number,
+                                                                                 GreekPhoneNumberValidator)
+
+            # Then
+            all_interpretations = NaturalNumbersInterpreter().get_all_possible_interpretations_of_number(input_number)
+            self.assertEqual(result, set(filter(GreekPhoneNumberValidator.validate, all_interpretations)))
+
+        self.assertEqual(NaturalNumbersInterpreter().get_valid_phone_interpretations('69232323',
+                                                                                     GreekPhoneNumberValidator),
+                         {'6920320323', '6920323203', '6902302323', '6902323023', '6923023023', '6923203203'})
+
+    def test_summarize_interpretations(self):
+        """
+        Test summarize_interpretations counts the valid and invalid interpretations and finds the first valid one,
+         in the order of iter_interpretations
+        :return:
+        """
+        # Data
+        test_data = ['2336', '69232323', '0030697024135', '00302323232323', '2106930664', '23232323232323232323']
+
+        for input_number in test_data:
+            # When
+            summary = NaturalNumbersInterpreter().summarize_interpretations(input_number, GreekPhoneNumberValidator)
+            any_summary = NaturalNumbersInterpreter().summarize_interpretations(input_number,
+                                                                                GreekPhoneNumberValidator,
+                                                                                count_valid=False)
+
+            # Then
+            interpretations = list(NaturalNumbersInterpreter().iter_interpretations(input_number))
+            valid_interpretations = list(filter(GreekPhoneNumberValidator.validate, interpretations))
+            first_valid = valid_interpretations[0] if valid_interpretations else None
+            self.assertEqual((summary.count, summary.valid_count, summary.invalid_count, summary.first_valid),
+                             (len(interpretations), len(valid_interpretations),
+                              len(interpretations) - len(valid_interpretations), first_valid))
+            self.assertEqual((any_summary.count, any_summary.valid_count, any_summary.invalid_count,
+                              any_summary.first_valid), (len(interpretations), None, None, first_valid))
+
+
+class TestPossibleInterpretation(unittest.TestCase):
+    """PossibleInterpretation tests"""
+
+    def test_ambiguity_indexes(self):
+        """
+        Test the ambiguity indexes are stored as a bitmask
+        :return:
+        """
+        # When
+        possible_interpretation = PossibleInterpretation(interpretation_elements=['2', '33', '6'],
+                                                         ambiguity_indexes={1, 2})
+
+        # Then
+        self.assertEqual(possible_interpretation.interpretation_elements, ('2', '33', '6'))
+        self.assertEqual(possible_interpretation.ambiguity_mask, 0b110)
+        self.assertEqual(possible_interpretation.ambiguity_indexes, {1, 2})
+        self.assertTrue(possible_interpretation.index_in_ambiguities(2))
+        self.assertFalse(possible_interpretation.index_in_ambiguities(3))
+        self.assertTrue(possible_interpretation.indexes_intersect(indexes_mask(2, 3)))
+        self.assertFalse(possible_interpretation.indexes_intersect(indexes_mask(3, 4)))
+
+    def test_add_elements(self):
+        """
+        Test add_ambiguity_element and add_interpretation_element
+        :return:
+        """
+        # Data
+        possible_interpretation = PossibleInterpretation()
+
+        # When
+        possible_interpretation.add_interpretation_element('2')
+        possible_interpretation.add_ambiguity_element('33', indexes_mask(1, 2))
+        possible_interpretation.add_interpretation_element('6')
+
+        # Then
+        self.assertEqual(possible_interpretation,
+                         PossibleInterpretation(interpretation_elements=['2', '33', '6'], ambiguity_indexes={1, 2}))
+        with self.assertRaises(AttributeError):
+            possible_interpretation.other_attribute = None
+
+
+def set_based_interpretations(possible_interpretations):
+    """
+    Interpretations of a List of PossibleInterpretation generating the permutations of each PossibleInterpretation
+    and removing the duplicates with a set, used as reference for the duplicate-free generation
+
+    :param possible_interpretations:
+    :return: List of interpretations, with duplicates
+    """
+    interpretations = []
+    for possible_interpretation in possible_interpretations:
+        _interpretations = ['']
+        for element in possible_interpretation.interpretation_elements:
+            _interpretations = [interpretation + option for interpretation in _interpretations
+                                for option in [element] + ([LANGUAGE_AMBIGUITIES[element]]
+                                                           if element in LANGUAGE_AMBIGUITIES else [])]
+        interpretations.extend(_interpretations)
+    return interpretations
+
+
+class TestDuplicateFreeGeneration(unittest.TestCase):
+    """Test the interpretations are generated once, with the same result as the set-based generation"""
+
+    def test_exhaustive_equivalence(self):
+        """
+        Test iter_interpretations and get_all_possible_interpretations_of_number against the set-based generation,
+        for all the numbers up to 7 digits with the digits 0 to 3, that cover all the kinds of digits of the ambiguities
+        :return:
+        """
+        interpreter = NaturalNumbersInterpreter()
+        for length in range(1, 8):
+            for digits in itertools.product('0123', repeat=length):
+                # Data
+                input_number = ''.join(digits)
+                expected_output = set(set_based_interpretations(
+                    interpreter.create_possible_interpretations(input_number)))
+
+                # When
+                result = list(interpreter.iter_interpretations(input_number))
+
+                # Then
+                self.assertEqual(len(result), len(set(result)), input_number)
+                self.assertEqual(set(result), expected_output, input_number)
+                self.assertEqual(interpreter.get_all_possible_interpretations_of_number(input_number), expected_output)
+                self.assertEqual(interpreter.count_interpretations(input_number), len(expected_output))
+
+
+class ZerosScorer(InterpretationScorer):
+    """Scorer of the interpretations by their number of '0', fewer is better"""
+
+    def __init__(self):
+        self.scored = 0
+
+    def interpretation_score(self, interpretation: str) -> float:
+        self.scored += 1
+        return -float(interpretation.count('0'))
+
+    def interpretation_score_bound(self, prefix: str, min_len: int, max_len: int) -> float:
+        return -float(prefix.count('0'))
+
+
+class TestTopKInterpretations(unittest.TestCase):
+    """Test get_top_k_interpretations"""
+
+    def test_best_scores(self):
+        """
+        Test get_top_k_interpretations returns the interpretations with the best scores, for all the numbers up to 6
+         digits with the digits 0, 2 and 3
+        :return:
+        """
+        interpreter = NaturalNumbersInterpreter()
+        for length in range(1, 7):
+            for digits in itertools.product('023', repeat=length):
+                # Data
+                input_number = ''.join(digits)
+                scores = sorted((-float(interpretation.count('0'))
+                                 for interpretation in interpreter.iter_interpretations(input_number)), reverse=True)
+
+                # When
+                result = interpreter.get_top_k_interpretations(input_number, 3, ZerosScorer())
+
+                # Then
+                self.assertEqual([score for (_, score) in result], scores[:3], input_number)
+                for (interpretation, score) in result:
+                    self.assertEqual(score, -interpretation.count('0'))
+
+    def test_best_scores_with_priors(self):
+        """
+        Test get_top_k_interpretations returns the best scores with random priors of each ambiguity, where replacing
+         an ambiguity skips the scores of the ambiguities that intersect it
+        :return:
+        """
+        interpreter = NaturalNumbersInterpreter()
+        randomness = random.Random(0)
+        test_data = ['53240243233'] + [''.join(randomness.choice('0023456789')
+                                               for _ in range(randomness.randint(2, 12))) for _ in range(300)]
+        for input_number in test_data:
+            # Data
+            scorer = AmbiguityPriorScorer({ambiguity: randomness.uniform(0.05, 0.95)
+                                           for ambiguity in LANGUAGE_AMBIGUITIES})
+            # With `k` greater than the number of interpretations all of them are completed with their score
+            scores = sorted((score for (_, score) in interpreter.get_top_k_interpretations(input_number, 1 << 20,
+                                                                                           scorer)), reverse=True)
+
+            # When
+            result = interpreter.get_top_k_interpretations(input_number, 3, scorer)
+
+            # Then
+            self.assertEqual(len(result), min(3, len(scores)), input_number)
+            for ((_, score), expected_score) in zip(result, scores):
+                self.assertAlmostEqual(score, expected_score, msg=input_number)
+
+    def test_all_interpretations_sorted(self):
+        """
+        Test get_top_k_interpretations with a `k` greater than the number of interpretations returns all of them
+         once, sorted by score, and the first `k` are the same with a lower `k`
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        scorer = AmbiguityPriorScorer({'23': 0.4}, validator=GreekPhoneNumberValidator)
+        input_number = '0030697024130502'
+
+        # When
+        result = interpreter.get_top_k_interpretations(input_number, 1000, scorer)
+
+        # Then
+        interpretations = [interpretation for (interpretation, _) in result]
+        scores = [score for (_, score) in result]
+        self.assertEqual(sorted(interpretations), sorted(interpreter.iter_interpretations(input_number)))
+        for (score, next_score) in zip(scores, scores[1:]):
+            self.assertGreaterEqual(score, next_score - 1e-9)
+        self.assertEqual(interpreter.get_top_k_interpretations(input_number, 5, scorer), result[:5])
+        self.assertTrue(GreekPhoneNumberValidator.validate(interpretations[0]))
+
+    def test_early_termination(self):
+        """
+        Test get_top_k_interpretations only completes a few interpretations of a number with millions of them
+        :return:
+        """
+        # Data
+        interpreter = NaturalNumbersInterpreter()
+        scorer = ZerosScorer()
+
+        # When
+        result = interpreter.get_top_k_interpretations('23' * 30, 3, scorer)
+
+        # Then
+        self.assertEqual(result[0], ('23' * 30, 0.0))
+        self.assertEqual(len(result), 3)
+        self.assertLess(scorer.scored, 100)
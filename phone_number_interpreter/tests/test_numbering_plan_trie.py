@@ -0,0 +1,96 @@
+"""Tests for numbering_plan_trie module"""
+import unittest
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.numbering_plan_trie import NumberingPlanTrie
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator, PhoneValidator
+
+
+class PlanAValidator(PhoneValidator):
+    """Numbering plan of 8 digits that start with 2 or 9"""
+    NAME = 'A'
+    VALID_PHONES_LEN = [8]
+    VALID_PHONES_START = {8: ['2', '9']}
+
+    @staticmethod
+    def validate(text_number: str) -> bool:
+        return len(text_number) == 8 and text_number[0] in '29'
+
+
+class PlanBValidator(PhoneValidator):
+    """Numbering plan of 8 or 10 digits without starts"""
+    NAME = 'B'
+    VALID_PHONES_LEN = [8, 10]
+
+    @staticmethod
+    def validate(text_number: str) -> bool:
+        return len(text_number) in (8, 10)
+
+
+class TestNumberingPlanTrie(unittest.TestCase):
+    """Test NumberingPlanTrie"""
+
+    def test_matching_plans(self):
+        """
+        Test NumberingPlanTrie().matching_plans() returns all the plans that accept a number
+        :return:
+        """
+        # Data
+        trie = NumberingPlanTrie({'GR': GreekPhoneNumberValidator, 'A': PlanAValidator, 'B': PlanBValidator})
+        test_data = [('6970241352', ['GR', 'B']),
+                     ('2970241352', ['GR', 'B']),
+                     ('00306970241352', ['GR']),
+                     ('29702413', ['A', 'B']),
+                     ('39702413', ['B']),
+                     ('2336', [])]
+
+        # When/Then
+        for (text_number, expected) in test_data:
+            self.assertEqual(trie.matching_plans(text_number), expected)
+
+    def test_same_result_as_validators(self):
+        """
+        Test NumberingPlanTrie().match() accepts the same numbers as the validate method of each plan
+        :return:
+        """
+        # Data
+        validators = {'GR': GreekPhoneNumberValidator, 'A': PlanAValidator, 'B': PlanBValidator}
+        trie = NumberingPlanTrie(validators)
+        numbers = ['00302', '0030', '2', '6', '69', '0', '9'] * 3
+        numbers = [(prefix + '0123456789' * 2)[:length] for prefix in numbers for length in range(6, 16)]
+
+        # When/Then
+        for text_number in numbers:
+            expected = [name for (name, validator) in validators.items() if validator.validate(text_number)]
+            self.assertEqual(trie.matching_plans(text_number), expected)
+
+    def test_compile_registered(self):
+        """
+        Test NumberingPlanTrie.compile() uses the registered validators
+        :return:
+        """
+        # When
+        trie = NumberingPlanTrie.compile(['GR'])
+
+        # Then
+        self.assertEqual(trie.plans, ['GR'])
+        self.assertEqual(trie.matching_plans('00302970241352'), ['GR'])
+        with self.assertRaises(KeyError):
+            NumberingPlanTrie.compile(['unknown'])
+
+    def test_as_validator(self):
+        """
+        Test NumberingPlanTrie().as_validator() can be used to create the valid interpretations of all the plans
+        :return:
+        """
+        # Data
+        validator = NumberingPlanTrie({'GR': GreekPhoneNumberValidator, 'A': PlanAValidator}).as_validator()
+        interpreter = NaturalNumbersInterpreter()
+
+        # When
+        interpretations = interpreter.get_valid_phone_interpretations('2970241', validator)
+
+        # Then
+        self.assertEqual(interpretations, {number for number in interpreter.iter_interpretations('2970241')
+                                           if GreekPhoneNumberValidator.validate(number)
+                                           or PlanAValidator.validate(number)})
+        self.assertTrue(interpretations)
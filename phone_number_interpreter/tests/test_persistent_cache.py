@@ -0,0 +1,155 @@
+"""Tests for persistent_cache module"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from phone_number_interpreter.batch import interpret_many
+from phone_number_interpreter.cache import CacheStats
+from phone_number_interpreter.natural_numbers_ambiguities import LANGUAGE_AMBIGUITIES
+from phone_number_interpreter.persistent_cache import SQLiteCache, storage_key, validator_version
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+class ShortPhoneNumberValidator(GreekPhoneNumberValidator):
+    """Validator with different rules than GreekPhoneNumberValidator"""
+    VALID_PHONES_LEN = [10]
+
+
+class PrefixPhoneNumberValidator(GreekPhoneNumberValidator):
+    """Validator with the name and the rules of GreekPhoneNumberValidator, and another could_be_valid"""
+    __module__ = GreekPhoneNumberValidator.__module__
+    __qualname__ = GreekPhoneNumberValidator.__qualname__
+
+    @classmethod
+    def could_be_valid(cls, prefix: str, min_len: int, max_len: int) -> bool:
+        return True
+
+
+class TestSQLiteCache(unittest.TestCase):
+    """Test SQLiteCache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_and_put_many(self):
+        """
+        Test SQLiteCache().get_many() returns the values stored by SQLiteCache().put_many() in another instance
+        :return:
+        """
+        # Data
+        cache = SQLiteCache(self.path)
+        cache.put_many([('2336', {'input': '2336'}), (('234', GreekPhoneNumberValidator), {'input': '234'})])
+        cache.close()
+
+        # When
+        cache = SQLiteCache(self.path)
+        values = cache.get_many(['2336', '2337', ('234', GreekPhoneNumberValidator)])
+
+        # Then
+        self.assertEqual(values, [{'input': '2336'}, None, {'input': '234'}])
+        self.assertEqual(cache.stats(), CacheStats(hits=2, misses=1, evictions=0, size=2, capacity=1000000))
+        cache.close()
+
+    def test_evict_least_recently_used(self):
+        """
+        Test SQLiteCache evicts the least recently used entries when it has more than `max_entries`
+        :return:
+        """
+        # Data
+        cache = SQLiteCache(self.path, max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+
+        # When
+        cache.put('c', 3)
+
+        # Then
+        self.assertEqual(cache.get_many(['a', 'b', 'c']), [1, None, 3])
+        self.assertEqual(cache.stats().evictions, 1)
+        self.assertEqual(len(cache), 2)
+        cache.close()
+
+    def test_size(self):
+        """
+        Test the stored size counts the entries inserted and deleted by all the instances, and the entries of a file
+         created without it
+        :return:
+        """
+        # Data
+        with sqlite3.connect(self.path) as connection:
+            connection.execute('CREATE TABLE results (version TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                               'last_used REAL NOT NULL, PRIMARY KEY (version, key))')
+            connection.execute("INSERT INTO results VALUES ('0', '\"a\"', '1', 0)")
+        connection.close()
+        cache = SQLiteCache(self.path, max_entries=4)
+        other_cache = SQLiteCache(self.path, max_entries=4)
+
+        # When
+        initial_size = len(cache)
+        cache.put_many([('b', 2), ('c', 3)])
+        other_cache.put_many([('c', 4), ('d', 5)])
+        size = len(cache)
+        cache.put_many([('e', 6), ('f', 7)])
+        evicted_size = len(other_cache)
+        other_cache.clear()
+
+        # Then
+        self.assertEqual((initial_size, size, evicted_size, len(cache)), (1, 4, 4, 0))
+        self.assertEqual(cache.stats().evictions, 2)
+        self.assertEqual(cache.get_many(['c', 'e']), [None, None])
+        cache.close()
+        other_cache.close()
+
+    def test_invalidation(self):
+        """
+        Test the entries are not found when the ambiguities or the rules of the validator change, also when only one
+         of its methods changes
+        :return:
+        """
+        # Data
+        cache = SQLiteCache(self.path)
+        cache.put(('2336', GreekPhoneNumberValidator), {'input': '2336'})
+        cache.close()
+
+        # When
+        with mock.patch('phone_number_interpreter.persistent_cache.LANGUAGE_AMBIGUITIES',
+                        dict(LANGUAGE_AMBIGUITIES, **{'11': '101'})):
+            changed_ambiguities_cache = SQLiteCache(self.path)
+        cache = SQLiteCache(self.path)
+
+        # Then
+        self.assertIsNone(changed_ambiguities_cache.get(('2336', GreekPhoneNumberValidator)))
+        self.assertIsNone(cache.get(('2336', ShortPhoneNumberValidator)))
+        self.assertEqual(cache.get(('2336', GreekPhoneNumberValidator)), {'input': '2336'})
+        self.assertNotEqual(storage_key(('2336', GreekPhoneNumberValidator)),
+                            storage_key(('2336', ShortPhoneNumberValidator)))
+        self.assertNotEqual(validator_version(PrefixPhoneNumberValidator), validator_version(GreekPhoneNumberValidator))
+        changed_ambiguities_cache.close()
+        cache.close()
+
+    def test_interpret_many(self):
+        """
+        Test interpret_many reuses the results stored by a previous execution
+        :return:
+        """
+        # Data
+        numbers = ['2336', '23a6', '00306970241352', '2336']
+        cache = SQLiteCache(self.path)
+        first_results = list(interpret_many(numbers, cache=cache))
+        cache.close()
+
+        # When
+        cache = SQLiteCache(self.path)
+        second_results = list(interpret_many(numbers, cache=cache))
+
+        # Then
+        self.assertEqual([result.get('interpretations') for result in second_results],
+                         [result.get('interpretations') for result in first_results])
+        self.assertEqual(cache.stats().hits, 4)
+        cache.close()
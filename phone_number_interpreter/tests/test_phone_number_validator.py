@@ -1,6 +1,7 @@
 """Tests for phone_number_validator module"""
 import unittest
-from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+from phone_number_interpreter.phone_number_validator import PHONE_VALIDATORS, GreekPhoneNumberValidator, \
+    PhoneValidator, import_numpy, register_phone_validator
 
 
 class TestGreekPhoneNumberValidator(unittest.TestCase):
@@ -37,3 +38,80 @@ class TestGreekPhoneNumberValidator(unittest.TestCase):
         # When/Then
         for data in test_data:
             self.assertEqual(data[1], GreekPhoneNumberValidator().validate(data[0]))
+
+    def test_greek_phone_number_validator_could_be_valid(self):
+        """
+        Test GreekPhoneNumberValidator.could_be_valid()
+        :return:
+        """
+        # Data
+        test_data = [(('', 1, 20), True),
+                     (('0030', 14, 14), True),
+                     (('0030', 10, 10), False),
+                     (('003068', 12, 15), False),
+                     (('6', 10, 10), True),
+                     (('68', 10, 10), False),
+                     (('2970241352', 10, 10), True),
+                     (('2', 11, 13), False)]
+
+        # When/Then
+        for (arguments, expected) in test_data:
+            self.assertEqual(expected, GreekPhoneNumberValidator.could_be_valid(*arguments))
+
+    def test_greek_phone_number_validator_validate_many(self):
+        """
+        Test GreekPhoneNumberValidator.validate_many() returns the same result as validate(), also for numbers as bytes
+        :return:
+        """
+        # Data
+        numbers = ['00306970241352', '00302970241352', '2970241352', '6970241352', '00306870241352', '0030241352',
+                   '69303970241352', '', '2', '69702413520']
+
+        # When
+        result = GreekPhoneNumberValidator.validate_many(numbers)
+
+        # Then
+        self.assertEqual([bool(valid) for valid in result],
+                         [GreekPhoneNumberValidator.validate(number) for number in numbers])
+        self.assertEqual(list(GreekPhoneNumberValidator.validate_many([])), [])
+        self.assertEqual([bool(valid) for valid in GreekPhoneNumberValidator.validate_many(
+            [number.encode('ascii') for number in numbers])], [bool(valid) for valid in result])
+
+    @unittest.skipIf(import_numpy() is None, 'NumPy is not installed')
+    def test_greek_phone_number_validator_validate_many_bytes(self):
+        """
+        Test GreekPhoneNumberValidator.validate_many() with a fixed-width byte array
+        :return:
+        """
+        # Data
+        numbers = import_numpy().array([b'2970241352', b'6870241352', b'00302970241352', b'297024135'], dtype='S14')
+
+        # When
+        result = GreekPhoneNumberValidator.validate_many(numbers)
+
+        # Then
+        self.assertEqual(result.tolist(), [True, False, True, False])
+
+
+class TestRegisterPhoneValidator(unittest.TestCase):
+    """Test register_phone_validator"""
+
+    def test_registered_validators(self):
+        """
+        Test GreekPhoneNumberValidator is registered and the validators without rules can't be registered
+        :return:
+        """
+        # Data
+        class NoRulesValidator(PhoneValidator):
+            """Validator without rules"""
+            NAME = 'no rules'
+
+            @staticmethod
+            def validate(text_number: str) -> bool:
+                return True
+
+        # When/Then
+        self.assertIs(PHONE_VALIDATORS['GR'], GreekPhoneNumberValidator)
+        self.assertIs(register_phone_validator(GreekPhoneNumberValidator), GreekPhoneNumberValidator)
+        with self.assertRaises(ValueError):
+            register_phone_validator(NoRulesValidator)
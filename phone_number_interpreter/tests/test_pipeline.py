@@ -0,0 +1,209 @@
+"""Tests for pipeline module"""
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Any, Dict, List
+from unittest import mock
+from phone_number_interpreter.batch import run_batch
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+from phone_number_interpreter.pipeline import merge_shards, parse_arguments, run, shard_path, ShardPipeline
+
+
+def without_time(output: bytes) -> List[Dict[str, Any]]:
+    """
+    Results of JSON Lines without the `time_ms` of each number
+
+    :param output:
+    :return:
+    """
+    return [{field: value for (field, value) in json.loads(line).items() if field != 'time_ms'}
+            for line in output.decode('utf-8').splitlines()]
+
+
+class TestPipeline(unittest.TestCase):
+    """Test ShardPipeline and merge_shards"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'numbers.txt')
+        self.work_directory = os.path.join(self.directory.name, 'work')
+        digits = random.Random(0)
+        self.lines = ['{}\n'.format(' '.join(digits.choice(['2', '20', '3', '30', '69', '0']) for _ in range(6)))
+                      for _ in range(200)]
+        with open(self.path, 'w', encoding='utf-8') as input_file:
+            input_file.writelines(self.lines)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_merge_same_as_batch(self):
+        """
+        Test the merged output of the shards has the same results of run_batch(), in the same order
+        :return:
+        """
+        # Data
+        batch_output = io.StringIO()
+        run_batch(self.lines, batch_output, NaturalNumbersInterpreter(), GreekPhoneNumberValidator)
+        pipeline = ShardPipeline(self.path, self.work_directory, shards=7)
+
+        # When
+        processed_numbers = pipeline.run()
+        merged_output = io.BytesIO()
+        merged_numbers = merge_shards(self.work_directory, merged_output)
+
+        # Then
+        self.assertEqual(sorted(processed_numbers), list(range(7)))
+        self.assertEqual(sum(processed_numbers.values()), len(self.lines))
+        self.assertEqual(merged_numbers, len(self.lines))
+        self.assertEqual(without_time(merged_output.getvalue()), without_time(batch_output.getvalue().encode()))
+
+    def test_resume(self):
+        """
+        Test a pipeline stopped in a shard only processes again the shards that were not finished
+        :return:
+        """
+        # Data
+        pipeline = ShardPipeline(self.path, self.work_directory, shards=4)
+        pipeline.run([0, 2])
+        with mock.patch('phone_number_interpreter.pipeline.write_results', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                pipeline.run()
+
+        # When
+        pending_shards = pipeline.pending_shards()
+        processed_numbers = ShardPipeline(self.path, self.work_directory, shards=4).run()
+        finished_again = pipeline.run()
+
+        # Then
+        self.assertEqual(pending_shards, [1, 3])
+        self.assertEqual(sorted(processed_numbers), [1, 3])
+        self.assertEqual(finished_again, {})
+        self.assertEqual(sorted(os.listdir(self.work_directory)),
+                         sorted(['manifest.json'] + [os.path.basename(shard_path(self.work_directory, shard, 4, ext))
+                                                     for shard in range(4) for ext in ['jsonl', 'done']]))
+
+    def test_merge_pending_shards(self):
+        """
+        Test the shards are not merged until all of them are finished
+        :return:
+        """
+        # Data
+        pipeline = ShardPipeline(self.path, self.work_directory, shards=3)
+        pipeline.run([1])
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            pipeline.merge(io.BytesIO())
+        with self.assertRaises(ValueError):
+            merge_shards(self.directory.name, io.BytesIO())
+
+    def test_merge_keeps_output(self):
+        """
+        Test a merge that fails doesn't modify the existing output file, and a merge that succeeds replaces it
+        :return:
+        """
+        # Data
+        output_path = os.path.join(self.directory.name, 'results.jsonl')
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            output_file.write('previous results\n')
+        ShardPipeline(self.path, self.work_directory, shards=2).run([0])
+
+        # When/Then
+        with mock.patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(SystemExit):
+                run(['merge', self.work_directory, '-o', output_path])
+            with open(output_path, encoding='utf-8') as output_file:
+                self.assertEqual(output_file.read(), 'previous results\n')
+
+            ShardPipeline(self.path, self.work_directory, shards=2).run()
+            run(['merge', self.work_directory, '-o', output_path])
+        with open(output_path, 'rb') as output_file:
+            self.assertEqual(len(without_time(output_file.read())), len(self.lines))
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['numbers.txt', 'results.jsonl', 'work'])
+
+    def test_merge_unwritable_output(self):
+        """
+        Test a merge to a file that can't be created raises the error of the file, not of its cleanup
+        :return:
+        """
+        # Data
+        output_path = os.path.join(self.directory.name, 'missing', 'results.jsonl')
+        ShardPipeline(self.path, self.work_directory, shards=2).run()
+
+        # When
+        with mock.patch('sys.stderr', io.StringIO()):
+            with self.assertRaises(FileNotFoundError) as error:
+                run(['merge', self.work_directory, '-o', output_path])
+
+        # Then
+        self.assertIsNone(error.exception.__context__)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ['numbers.txt', 'work'])
+
+    def test_invalid_arguments(self):
+        """
+        Test the number of shards must be positive and the number of workers not negative
+        :return:
+        """
+        # When/Then
+        with self.assertRaises(ValueError):
+            ShardPipeline(self.path, self.work_directory, shards=2, workers=-1)
+        with mock.patch('sys.stderr', io.StringIO()):
+            for arguments in (['--shards', '0'], ['--shards', '2', '--workers', '-1']):
+                with self.assertRaises(SystemExit):
+                    parse_arguments(['run', self.path, self.work_directory] + arguments)
+        self.assertEqual(parse_arguments(['run', self.path, self.work_directory, '--shards', '2', '--workers', '0'])
+                         .workers, 0)
+
+    def test_valid_only_deterministic(self):
+        """
+        Test the valid interpretations of the merged output are in the same order with different hash seeds
+        :return:
+        """
+        # Data
+        digits = random.Random(1)
+        with open(self.path, 'w', encoding='utf-8') as input_file:
+            input_file.writelines('{}\n'.format(' '.join(['2', '10'] + [digits.choice(['2', '20', '3', '30', '69', '6'])
+                                                                        for _ in range(4)]))
+                                  for _ in range(100))
+        package_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        outputs = []
+        for hash_seed in ['1', '2']:
+            work_directory = os.path.join(self.directory.name, 'work-{}'.format(hash_seed))
+            # When
+            for argv in [['run', self.path, work_directory, '--shards', '3', '--valid-only'],
+                         ['merge', work_directory]]:
+                process = subprocess.run([sys.executable, '-m', 'phone_number_interpreter', 'pipeline', *argv],
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True,
+                                         cwd=package_directory, env=dict(os.environ, PYTHONHASHSEED=hash_seed))
+            outputs.append(without_time(process.stdout))
+
+        # Then
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertTrue(any(len(result['interpretations']) > 1 for result in outputs[0]))
+
+    def test_other_job(self):
+        """
+        Test the work directory of a job is not reused by a job with other options or other input
+        :return:
+        """
+        # Data
+        ShardPipeline(self.path, self.work_directory, shards=2).run([0])
+
+        # When/Then
+        with self.assertRaises(ValueError):
+            ShardPipeline(self.path, self.work_directory, shards=3).run()
+        with self.assertRaises(ValueError):
+            ShardPipeline(self.path, self.work_directory, shards=2, valid_only=True).run()
+        with self.assertRaises(ValueError):
+            ShardPipeline(self.path, self.work_directory, shards=2).run([2])
+        with open(self.path, 'a', encoding='utf-8') as input_file:
+            input_file.write('2336\n')
+        with self.assertRaises(ValueError):
+            ShardPipeline(self.path, self.work_directory, shards=2).run()
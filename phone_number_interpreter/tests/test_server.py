@@ -0,0 +1,258 @@
+"""Tests for server module"""
+import asyncio
+import http.client
+import io
+import json
+import socket
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+from phone_number_interpreter import load_generator, server
+from phone_number_interpreter.load_generator import generate_load
+from phone_number_interpreter.server import InterpretationService, MicroBatcher, ServiceOverloadedError, \
+    ServiceThread, interpret_batch, print_address
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+
+
+def post(connection: http.client.HTTPConnection, path: str, content: dict):
+    """
+    Send a POST request with a JSON body and read the JSON response
+
+    :param connection:
+    :param path:
+    :param content:
+    :return: HTTP status and content of the response
+    """
+    connection.request('POST', path, json.dumps(content), {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestInterpretationService(unittest.TestCase):
+    """Test InterpretationService"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service_thread = ServiceThread(InterpretationService(port=0))
+        cls.service_thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.service_thread.stop()
+
+    def setUp(self):
+        self.connection = http.client.HTTPConnection('127.0.0.1', self.service_thread.service.port, timeout=10)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_interpret(self):
+        """
+        Test /interpret returns the interpretations of a number, and keeps the connection open for the next request
+        :return:
+        """
+        # When
+        (status, content) = post(self.connection, '/interpret', {'number': '23 36'})
+        (_, valid_content) = post(self.connection, '/interpret', {'number': '2000000000', 'valid_only': True})
+
+        # Then
+        self.assertEqual(status, 200)
+        self.assertEqual(content['input'], '2336')
+        self.assertEqual({interpretation['number'] for interpretation in content['interpretations']},
+                         {'2336', '23306', '23036', '20336', '203306'})
+        self.assertEqual(valid_content['interpretations'], [{'number': '2000000000', 'valid': True}])
+
+    def test_interpret_many(self):
+        """
+        Test /interpret with many numbers returns the results in the same order
+        :return:
+        """
+        # When
+        (status, content) = post(self.connection, '/interpret', {'numbers': ['2336', '23a6', '234']})
+
+        # Then
+        self.assertEqual(status, 200)
+        self.assertEqual([result['input'] for result in content['results']], ['2336', '23a6', '234'])
+        self.assertIn('error', content['results'][1])
+
+    def test_validate(self):
+        """
+        Test /validate returns if the numbers are valid phone numbers
+        :return:
+        """
+        # When
+        (status, content) = post(self.connection, '/validate', {'numbers': ['2106930664', '2336']})
+
+        # Then
+        self.assertEqual(status, 200)
+        self.assertEqual(content, {'results': [{'number': '2106930664', 'valid': True},
+                                               {'number': '2336', 'valid': False}]})
+
+    def test_errors(self):
+        """
+        Test the invalid requests get an error status
+        :return:
+        """
+        # When
+        (invalid_body_status, _) = post(self.connection, '/interpret', {'phone': '2336'})
+        (unknown_path_status, _) = post(self.connection, '/unknown', {'number': '2336'})
+        self.connection.request('GET', '/interpret')
+        method_status = self.connection.getresponse().status
+
+        # Then
+        self.assertEqual(invalid_body_status, 400)
+        self.assertEqual(unknown_path_status, 404)
+        self.assertEqual(method_status, 405)
+
+    def test_line_too_long(self):
+        """
+        Test the request lines and the header lines longer than the limit of the reader get an error status
+        :return:
+        """
+        # Data
+        long_value = 'a' * (1 << 17)
+        requests = [
+            'GET /{} HTTP/1.1\r\n\r\n'.format(long_value),
+            'GET /health HTTP/1.1\r\nX-Long: {}\r\n\r\n'.format(long_value),
+        ]
+
+        statuses = []
+        for request in requests:
+            with socket.create_connection(('127.0.0.1', self.service_thread.service.port), timeout=10) as client:
+                # When
+                client.sendall(request.encode('latin-1'))
+                response = client.makefile('rb').readline()
+
+            statuses.append(int(response.split()[1]))
+
+        # Then
+        self.assertEqual(statuses, [400, 431])
+
+    def test_worker_error(self):
+        """
+        Test the requests get 500 when the workers fail, e.g. when the process pool is broken
+        :return:
+        """
+        # Data
+        with mock.patch('phone_number_interpreter.server.interpret_batch', side_effect=BrokenProcessPool('Broken')):
+            with ServiceThread(InterpretationService(port=0)) as service_thread:
+                connection = http.client.HTTPConnection('127.0.0.1', service_thread.service.port, timeout=10)
+
+                # When
+                (status, content) = post(connection, '/interpret', {'number': '2336'})
+                connection.close()
+
+        # Then
+        self.assertEqual(status, 500)
+        self.assertEqual(content, {'error': 'Internal error'})
+
+    def test_invalid_options(self):
+        """
+        Test the options that would disable the backpressure or break the workers are rejected
+        :return:
+        """
+        # When/Then
+        for options in [{'workers': -1}, {'batch_size': 0}, {'max_pending': 0}]:
+            with self.assertRaises(ValueError):
+                InterpretationService(port=0, **options)
+
+        with mock.patch('sys.stderr', io.StringIO()):
+            for argv in [['--max-pending', '0'], ['--workers', '-1'], ['--batch-size', '0']]:
+                with self.assertRaises(SystemExit):
+                    server.parse_arguments(argv)
+            for argv in [['--requests', '0'], ['--concurrency', '0']]:
+                with self.assertRaises(SystemExit):
+                    load_generator.parse_arguments(argv)
+
+    def test_print_address(self):
+        """
+        Test the address of a service started with port 0 has the port that was bound
+        :return:
+        """
+        # When
+        with mock.patch('sys.stderr', io.StringIO()) as stderr:
+            print_address(self.service_thread.service)
+
+        # Then
+        port = self.service_thread.service.port
+        self.assertNotEqual(port, 0)
+        self.assertEqual(stderr.getvalue(), 'Listening on http://127.0.0.1:{}\n'.format(port))
+
+    def test_generate_load(self):
+        """
+        Test generate_load() sends all the requests from concurrent clients
+        :return:
+        """
+        # When
+        result = generate_load('127.0.0.1', self.service_thread.service.port, ['2336'] * 40, concurrency=4)
+
+        # Then
+        self.assertEqual(result.requests, 40)
+        self.assertEqual(result.statuses, {200: 40})
+
+    def test_timeout(self):
+        """
+        Test the requests that are not processed in time get 504
+        :return:
+        """
+        # Data
+        with ServiceThread(InterpretationService(port=0, request_timeout=0)) as service_thread:
+            connection = http.client.HTTPConnection('127.0.0.1', service_thread.service.port, timeout=10)
+
+            # When
+            (status, content) = post(connection, '/interpret', {'number': '2336'})
+            connection.close()
+
+        # Then
+        self.assertEqual(status, 504)
+        self.assertIn('error', content)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test MicroBatcher"""
+
+    def test_batches(self):
+        """
+        Test the numbers submitted together are processed in a single batch
+        :return:
+        """
+        # Data
+        batches = []
+
+        def process_batch(items):
+            batches.append(items)
+            return interpret_batch(items, NaturalNumbersInterpreter(), GreekPhoneNumberValidator)
+
+        async def submit_numbers():
+            with ThreadPoolExecutor(1) as executor:
+                batcher = MicroBatcher(process_batch, executor, max_batch_size=8, max_delay=0.05)
+                task = asyncio.ensure_future(batcher.run())
+                results = await asyncio.gather(*(batcher.submit((number, False)) for number in ['2336', '234', '0']))
+                task.cancel()
+                return results
+
+        # When
+        results = asyncio.run(submit_numbers())
+
+        # Then
+        self.assertEqual(len(batches), 1)
+        self.assertEqual([len(result['interpretations']) for result in results], [5, 3, 1])
+
+    def test_backpressure(self):
+        """
+        Test the numbers are rejected when the queue of pending numbers is full
+        :return:
+        """
+        # Data
+        async def submit_numbers():
+            with ThreadPoolExecutor(1) as executor:
+                batcher = MicroBatcher(lambda items: [], executor, max_pending=2)
+                batcher.submit(('2336', False))
+                batcher.submit(('2336', False))
+                batcher.submit(('2336', False))
+
+        # When / Then
+        with self.assertRaises(ServiceOverloadedError):
+            asyncio.run(submit_numbers())
@@ -0,0 +1,72 @@
+"""Tests of the start time of the application"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Dict, List, Tuple
+
+
+# Maximum time to import the modules of the application when a number is interpreted
+IMPORT_TIME_BUDGET_MS = 150
+# Modules that must not be imported when a number is interpreted
+NOT_IMPORTED_MODULES = ['unittest', 'asyncio', 'multiprocessing', 'sqlite3', 'numpy',
+                        'phone_number_interpreter.tests.run', 'phone_number_interpreter.ambiguity_rules',
+                        'phone_number_interpreter.batch', 'phone_number_interpreter.benchmarks',
+                        'phone_number_interpreter.server',
+                        'phone_number_interpreter.load_generator', 'phone_number_interpreter.pipeline']
+IMPORT_TIME_LINE = re.compile(r'import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)')
+
+
+def import_times(argv: List[str], pycache_prefix: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Execute the application with `-X importtime`, with the bytecode written to `pycache_prefix`
+
+    :param argv: Command line arguments of the application
+    :param pycache_prefix:
+    :return: Cumulative time in microseconds of the modules imported at top level, and names of all the modules
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache_prefix)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'phone_number_interpreter', *argv],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, check=True,
+                             cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             universal_newlines=True)
+
+    top_level_times = {}
+    modules = []
+    for line in process.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            (cumulative_time, indent, module) = match.groups()
+            modules.append(module)
+            if len(indent) == 1:
+                top_level_times[module] = int(cumulative_time)
+    return top_level_times, modules
+
+
+class TestStartup(unittest.TestCase):
+    """Test the modules imported to interpret a number"""
+
+    def test_interpret_import_time(self):
+        """
+        Test the modules of the application imported to interpret a number are imported within the budget, and the
+         modules of the other modes are not imported
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as pycache_prefix:
+            # Data, the first execution writes the bytecode
+            import_times(['2336'], pycache_prefix)
+
+            # When
+            executions = [import_times(['2336'], pycache_prefix) for _ in range(3)]
+
+        # Then
+        import_time_ms = min(sum(time for (module, time) in top_level_times.items()
+                                 if module.startswith('phone_number_interpreter')) / 1000
+                             for (top_level_times, _) in executions)
+        self.assertLess(import_time_ms, IMPORT_TIME_BUDGET_MS)
+        (_, modules) = executions[0]
+        self.assertIn('phone_number_interpreter.app', modules)
+        self.assertEqual([module for module in NOT_IMPORTED_MODULES if module in modules], [])
@@ -0,0 +1,85 @@
+"""Tests for stats module"""
+import contextlib
+import io
+import unittest
+from phone_number_interpreter import app
+from phone_number_interpreter.natural_numbers_interpreter import NaturalNumbersInterpreter
+from phone_number_interpreter.phone_number_validator import GreekPhoneNumberValidator
+from phone_number_interpreter.stats import InterpretationStats
+
+
+class TestInterpretationStats(unittest.TestCase):
+    """Test InterpretationStats"""
+
+    def test_timed_iter(self):
+        """
+        Test InterpretationStats().timed_iter() yields the items, counts them and adds the time to the phase
+        :return:
+        """
+        # Data
+        stats = InterpretationStats()
+
+        # When
+        items = list(stats.timed_iter('generation', ['2336', '23306'], counter='interpretations'))
+
+        # Then
+        self.assertEqual(items, ['2336', '23306'])
+        self.assertEqual(stats.counters['interpretations'], 2)
+        self.assertIn('generation', stats.timings)
+
+    def test_counting_validator(self):
+        """
+        Test InterpretationStats().counting_validator() counts the calls and keeps the result of the validator
+        :return:
+        """
+        # Data
+        stats = InterpretationStats()
+        validator = stats.counting_validator(GreekPhoneNumberValidator)
+
+        # When
+        results = [validator.validate('2106930664'), validator.validate('2336'),
+                   validator.could_be_valid('69', 10, 10)]
+
+        # Then
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(stats.counters['validator_calls'], 2)
+        self.assertEqual(stats.counters['validator_prefix_checks'], 1)
+
+    def test_interpreter_stats(self):
+        """
+        Test NaturalNumbersInterpreter collects the counters of each phase when `stats` is provided
+        :return:
+        """
+        # Data
+        stats = InterpretationStats()
+        interpreter = NaturalNumbersInterpreter(stats=stats)
+
+        # When
+        interpretations = list(interpreter.iter_interpretations('2336'))
+
+        # Then
+        self.assertEqual(len(interpretations), 5)
+        self.assertEqual(stats.counters['numbers'], 1)
+        self.assertEqual(stats.counters['possible_interpretations'], 2)
+        self.assertEqual(stats.counters['prefix_rebuilds'], 1)
+        self.assertEqual(stats.counters['raw_interpretations'], 6)
+        self.assertEqual(stats.counters['interpretations'], 5)
+        self.assertEqual(set(stats.as_dict()['timings_ms']), {'segmentation', 'generation'})
+
+    def test_app_stats_callback(self):
+        """
+        Test app.run() provides the statistics to the callback, including the validation and printing phases
+        :return:
+        """
+        # Data
+        collected = []
+
+        # When
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.run(['2336'], stats_callback=collected.append)
+
+        # Then
+        self.assertEqual(len(collected), 1)
+        self.assertEqual(collected[0].counters['validator_calls'], 5)
+        self.assertEqual(set(collected[0].timings), {'segmentation', 'generation', 'validation', 'printing'})
+        self.assertIn('interpretations', collected[0].format())